@@ -2,16 +2,127 @@ __author__ = "Jakub Franěk"
 __email__ = "tofugangsw@gmail.com"
 
 """
-Santa was hoping for a white Christmas, but his weather machine's "snow" 
-function is powered by stars, and he's fresh out! To save Christmas, he needs 
+Santa was hoping for a white Christmas, but his weather machine's "snow"
+function is powered by stars, and he's fresh out! To save Christmas, he needs
 you to collect fifty stars by December 25th.
 
-Collect stars by helping Santa solve puzzles. Two puzzles will be made available 
-on each day in the Advent calendar; the second puzzle is unlocked when you 
+Collect stars by helping Santa solve puzzles. Two puzzles will be made available
+on each day in the Advent calendar; the second puzzle is unlocked when you
 complete the first. Each puzzle grants one star. Good luck!
 """
 
-from src.day_25 import puzzle
+from argparse import ArgumentParser, Namespace
+from os.path import dirname, join, realpath
+from sys import exit
+from time import perf_counter
+from typing import Tuple
+from src.utils.backends import AUTO, BACKENDS, NUMPY, numpy_installed
+from src.utils.inputs import DEFAULT_MEMORY_LIMIT
+from src.utils.progress import DEFAULT_REPORT_INTERVAL
+from src.utils.result_cache import clear_results
+from src.utils.runner import DAYS, PUZZLES, TIMED_OUT, PuzzleResult, \
+    RunOptions, run_puzzles, initialize_worker, timed_out, over_memory_budget, \
+    format_results_table, format_operation_counts
+from src.utils.stochastic import DEFAULT_SEED
+from src.utils.utils import print_puzzle_solution
+from src.utils.watch import DEFAULT_INTERVAL, watch
+
+PROFILE_DIRECTORY = join(dirname(realpath(__file__)), ".cache", "profiles")
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Advent of Code 2015 puzzle runner")
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=DAYS,
+                        choices=DAYS, metavar="DAY",
+                        help="days to run (default: all)")
+    parser.add_argument("-p", "--puzzles", type=int, nargs="+",
+                        default=PUZZLES, choices=PUZZLES, metavar="PUZZLE",
+                        help="puzzles to run for each day (default: both)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("--input-cache-mb", type=float,
+                        default=DEFAULT_MEMORY_LIMIT / 2 ** 20,
+                        help="memory limit of the parsed input cache in each "
+                             "worker (MiB)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="neither use nor store cached solutions")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="remove all cached solutions before running")
+    parser.add_argument("-m", "--memory", action="store_true",
+                        help="measure peak memory of every puzzle (slower)")
+    parser.add_argument("--memory-budget-mb", type=float, default=None,
+                        help="fail when any puzzle allocates more memory "
+                             "(MiB); implies --memory")
+    parser.add_argument("-c", "--count-operations", action="store_true",
+                        help="count hot path operations of every puzzle "
+                             "(hashes, permutations, fights, ...)")
+    parser.add_argument("--progress", nargs="?", type=float,
+                        const=DEFAULT_REPORT_INTERVAL, default=None,
+                        metavar="SECONDS",
+                        help="report progress of the long searches to stderr "
+                             "(default interval: {:.0f} s)".format(
+                                 DEFAULT_REPORT_INTERVAL))
+    parser.add_argument("-t", "--time-limit", type=float, default=None,
+                        help="cancel puzzles running longer (seconds); each "
+                             "puzzle then runs in its own process")
+    parser.add_argument("-s", "--stars", action="store_true",
+                        help="print the solutions instead of the timing table")
+    parser.add_argument("--backend", choices=BACKENDS, default=AUTO,
+                        help="engine of the grid, search and numeric days "
+                             "(6, 15, 18, 20); auto picks one by input size "
+                             "and core count (default: auto)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="random seed of the puzzles solved by random "
+                             "search (days 19 and 24)")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_DIRECTORY,
+                        default=None, metavar="DIRECTORY",
+                        help="run the puzzles one by one under cProfile and "
+                             "save .pstats and collapsed stacks (default "
+                             "directory: .cache/profiles)")
+    parser.add_argument("--metrics", default=None, metavar="PATH",
+                        help="also write the results to an OpenMetrics "
+                             "(.prom) file, e.g. for the node-exporter "
+                             "textfile collector")
+    # the default path is filled in where the history is written, so the
+    # history module is not imported by the usual runs
+    parser.add_argument("--history", nargs="?", const="", default=None,
+                        metavar="PATH",
+                        help="append the timings to the SQLite history "
+                             "(default path: .cache/history.sqlite); not "
+                             "with --profile, whose timings are skewed")
+    parser.add_argument("--watch", nargs="?", const=DEFAULT_INTERVAL,
+                        type=float, default=None, metavar="SECONDS",
+                        help="keep polling the input files and solve again "
+                             "the days whose inputs changed (default "
+                             "interval: {:.0f} s)".format(DEFAULT_INTERVAL))
+    arguments = parser.parse_args()
+    if arguments.backend == NUMPY and not numpy_installed():
+        parser.error("the numpy backend needs NumPy installed")
+    return arguments
+
+
+################################################################################
+
+def report_watch(results: Tuple[PuzzleResult, ...],
+                 changed: Tuple[int, ...]) -> None:
+    """
+    Prints the results of one watch mode run.
+
+    :param results: results of all the watched puzzles
+    :param changed: days solved again
+    """
+
+    print("Solved days {}; other answers are served from memory".format(
+        ", ".join("{:02d}".format(day) for day in changed)))
+    print(format_results_table(results))
+    print()
+
 
 ################################################################################
 
@@ -20,7 +131,89 @@ if __name__ == "__main__":
     Runs specified puzzles.
     """
 
-    puzzle.puzzle_01()
-    puzzle.puzzle_02()
+    arguments = parse_arguments()
+
+    if arguments.clear_cache:
+        clear_results()
+
+    start = perf_counter()
+    options = RunOptions(
+        input_cache_limit=int(arguments.input_cache_mb * 2 ** 20),
+        measure_memory=arguments.memory
+        or arguments.memory_budget_mb is not None,
+        time_limit=arguments.time_limit,
+        seed=arguments.seed,
+        count_operations=arguments.count_operations,
+        progress_interval=arguments.progress,
+        backend=arguments.backend)
+
+    if arguments.watch is not None:
+        try:
+            watch(arguments.days, arguments.puzzles, arguments.workers,
+                  options, not arguments.no_cache, report_watch,
+                  arguments.watch)
+        except KeyboardInterrupt:
+            exit(0)
+
+    if arguments.profile is not None:
+        # imported here; the profiler is not needed for the usual runs
+        from src.utils.profiling import profile_puzzle
+        initialize_worker(options)
+        results = []
+        for day in arguments.days:
+            for puzzle in arguments.puzzles:
+                result, stats_path, collapsed_path = profile_puzzle(
+                    day, puzzle, arguments.profile)
+                results.append(result)
+                print("DAY {:02d}; puzzle {}: {}, {}".format(
+                    day, puzzle, stats_path, collapsed_path))
+    else:
+        results = run_puzzles(arguments.days, arguments.puzzles,
+                              arguments.workers, options,
+                              not arguments.no_cache)
+
+    if arguments.stars:
+        for result in results:
+            print_puzzle_solution(
+                result.day, result.puzzle,
+                TIMED_OUT if result.timed_out else result.answer)
+    else:
+        print(format_results_table(results))
+        if arguments.count_operations:
+            print(format_operation_counts(results))
+        print("Total wall time: {:.3f} s".format(perf_counter() - start))
+
+    if arguments.metrics is not None:
+        # imported here; the export is not needed for the usual runs
+        from src.utils.metrics import write_metrics
+        write_metrics(results, arguments.metrics)
+
+    if arguments.history is not None and arguments.profile is None:
+        # imported here; the history is not needed for the usual runs
+        from src.utils.history import DEFAULT_HISTORY_PATH, record_results
+        record_results(results, "runner", arguments.backend,
+                       arguments.history or DEFAULT_HISTORY_PATH)
+
+    failed = False
+
+    if len(timed_out(results)) > 0:
+        print("Over the {:.1f} s time limit: {}".format(
+            arguments.time_limit, ", ".join(
+                "{:02d}/{}".format(result.day, result.puzzle)
+                for result in timed_out(results))))
+        failed = True
+
+    if arguments.memory_budget_mb is not None:
+        over_budget = over_memory_budget(
+            results, int(arguments.memory_budget_mb * 2 ** 20))
+        if len(over_budget) > 0:
+            print("Over the {:.1f} MiB memory budget: {}".format(
+                arguments.memory_budget_mb, ", ".join(
+                    "{:02d}/{}".format(result.day, result.puzzle)
+                    for result in over_budget)))
+            failed = True
+
+    if failed:
+        exit(1)
 
 ################################################################################
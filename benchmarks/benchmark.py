@@ -0,0 +1,187 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Benchmark suite for the puzzles. Every requested puzzle is run several times in
+a row, its min, median and 95th percentile wall times are reported and can be
+stored to a JSON baseline. A later run can be compared to the baseline; it fails
+when any puzzle got slower by more than the given threshold.
+
+Run from the repository root:
+
+    python -m benchmarks.benchmark --days 6 18 --repeats 5 --save
+    python -m benchmarks.benchmark --days 6 18 --repeats 5 --compare
+"""
+
+from argparse import ArgumentParser, Namespace
+from json import dump, load
+from math import ceil
+from os.path import dirname, join, realpath
+from platform import python_version
+from statistics import median
+from sys import exit
+from typing import Dict, Iterable, List, Sequence, Union
+from src.utils.backends import AUTO
+from src.utils.history import DEFAULT_HISTORY_PATH, record_results
+from src.utils.inputs import clear_cache
+from src.utils.runner import DAYS, PUZZLES, run_puzzle
+
+REPOSITORY_ROOT = dirname(dirname(realpath(__file__)))
+BASELINE_FILE_PATH = join(REPOSITORY_ROOT, "benchmarks", "baseline.json")
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.1
+PUZZLE_KEY = "{:02d}/{}"
+STATISTICS_LINE = "{}  min {:>9.4f} s  median {:>9.4f} s  p95 {:>9.4f} s"
+
+KEY_PYTHON = "python"
+KEY_REPEATS = "repeats"
+KEY_PUZZLES = "puzzles"
+KEY_MIN = "min"
+KEY_MEDIAN = "median"
+KEY_P95 = "p95"
+
+
+################################################################################
+
+def _percentile(values: Sequence[float], percent: float) -> float:
+    """
+    :param values: measured values
+    :param percent: requested percentile (0-100)
+    :return: nearest-rank percentile of the values
+    """
+
+    ordered = sorted(values)
+    rank = max(ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+################################################################################
+
+def benchmark(days: Iterable[int],
+              puzzles: Iterable[int],
+              repeats: int,
+              history_path: Union[str, None] = None) \
+        -> Dict[str, Dict[str, float]]:
+    """
+    Runs every requested puzzle the given number of times in this process.
+
+    :param days: day numbers to benchmark
+    :param puzzles: puzzle numbers to benchmark for each day
+    :param repeats: how many times each puzzle is run
+    :param history_path: SQLite history every run is appended to; None
+    records nothing
+    :return: dict in format puzzle key: min, median and p95 wall times
+    """
+
+    statistics = {}
+
+    for day in days:
+        for puzzle in puzzles:
+            results = []
+            for _ in range(repeats):
+                # parsed by the earlier repeat otherwise; every repeat parses
+                # its input itself
+                clear_cache()
+                results.append(run_puzzle(day, puzzle))
+            if history_path is not None:
+                record_results(results, "benchmark", AUTO, history_path)
+            times = [result.wall_time for result in results]
+            key = PUZZLE_KEY.format(day, puzzle)
+            statistics[key] = {
+                KEY_MIN: min(times),
+                KEY_MEDIAN: median(times),
+                KEY_P95: _percentile(times, 95)
+            }
+            print(STATISTICS_LINE.format(key, *statistics[key].values()))
+
+    return statistics
+
+
+################################################################################
+
+def find_regressions(statistics: Dict[str, Dict[str, float]],
+                     baseline: Dict[str, Dict[str, float]],
+                     threshold: float) -> List[str]:
+    """
+    Compares median wall times with the baseline. Puzzles missing from the
+    baseline are skipped.
+
+    :param statistics: current benchmark statistics
+    :param baseline: stored benchmark statistics
+    :param threshold: allowed relative slowdown (0.1 means 10 %)
+    :return: descriptions of puzzles that got slower than allowed
+    """
+
+    return ["{}  {:.4f} s -> {:.4f} s ({:+.1%})".format(
+        key, baseline[key][KEY_MEDIAN], values[KEY_MEDIAN],
+        values[KEY_MEDIAN] / baseline[key][KEY_MEDIAN] - 1)
+        for key, values in statistics.items()
+        if key in baseline
+        and values[KEY_MEDIAN] > baseline[key][KEY_MEDIAN] * (1 + threshold)]
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Advent of Code 2015 benchmarks")
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=DAYS,
+                        choices=DAYS, metavar="DAY")
+    parser.add_argument("-p", "--puzzles", type=int, nargs="+",
+                        default=PUZZLES, choices=PUZZLES, metavar="PUZZLE")
+    parser.add_argument("-r", "--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("-b", "--baseline", default=BASELINE_FILE_PATH,
+                        help="baseline JSON file")
+    parser.add_argument("-t", "--threshold", type=float,
+                        default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown of the median")
+    parser.add_argument("--save", action="store_true",
+                        help="store the results as the new baseline")
+    parser.add_argument("--compare", action="store_true",
+                        help="fail if any puzzle is slower than the baseline")
+    parser.add_argument("--history", nargs="?", const=DEFAULT_HISTORY_PATH,
+                        default=None, metavar="PATH",
+                        help="append every run to the SQLite history "
+                             "(default path: .cache/history.sqlite)")
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Benchmarks the specified puzzles.
+    """
+
+    arguments = parse_arguments()
+    results = benchmark(arguments.days, arguments.puzzles, arguments.repeats,
+                        arguments.history)
+
+    if arguments.compare:
+        with open(arguments.baseline, "r") as f:
+            regressions = find_regressions(
+                results, load(f)[KEY_PUZZLES], arguments.threshold)
+        if len(regressions) > 0:
+            print("Slower than the baseline:")
+            print("\n".join(regressions))
+            exit(1)
+
+    if arguments.save:
+        try:
+            with open(arguments.baseline, "r") as f:
+                stored = load(f)[KEY_PUZZLES]
+        except FileNotFoundError:
+            stored = {}
+        # keep the stored puzzles which were not benchmarked this time
+        stored.update(results)
+        with open(arguments.baseline, "w") as f:
+            dump({
+                KEY_PYTHON: python_version(),
+                KEY_REPEATS: arguments.repeats,
+                KEY_PUZZLES: stored
+            }, f, indent=4)
+
+################################################################################
@@ -0,0 +1,256 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Differential harness. Days with a reference engine (src/day_XX/reference.py)
+have their registered puzzles run side by side with the reference versions,
+on the bundled input and on seeded synthetic inputs. The answers must match
+each other and, for the bundled inputs, the "Answer should be X" value from the
+puzzle docstring; the speedup of the registered engine over the reference one
+is printed for every input.
+
+The reference day 20 engine takes hours for the bundled input, so it is only
+run with --slow; synthetic day 20 inputs are smaller present counts.
+
+The registered engines run with the backend given by --backend (auto by
+default), so every engine of src/utils/backends.py can be checked against the
+reference one.
+
+Run from the repository root:
+
+    python -m benchmarks.differential --days 6 18 --seeds 1 2 3
+    python -m benchmarks.differential --backend multiprocessing
+"""
+
+from argparse import ArgumentParser, Namespace
+from importlib import import_module
+from os.path import join
+from random import Random
+from re import MULTILINE, compile
+from sys import exit
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Iterable, List, NamedTuple, Tuple, Union
+from src.utils.backends import AUTO, BACKENDS, set_backend
+from src.utils.generators import write_input
+from src.utils.inputs import clear_cache
+from src.utils.registry import get_puzzle
+from src.utils.runner import PUZZLES
+
+REFERENCE_MODULE_NAME = "src.day_{:02d}.reference"
+REFERENCE_DAYS = (6, 18, 20)
+# bundled inputs the reference engines need hours for
+SLOW_BUNDLED_DAYS = (20,)
+DEFAULT_SEEDS = (1, 2, 3)
+# synthetic input sizes in the natural unit of the day; small enough for the
+# reference engines to finish in seconds
+SYNTHETIC_SIZES = {
+    6: 300,     # grid side length
+    18: 60      # grid side length
+}
+# day 20 input is a number of presents, not a file
+PRESENTS_RANGE = (50000, 500000)
+BUNDLED = "bundled"
+ANSWER_PATTERN = compile(r"Answer should be (\S+?)\.?\s*$", MULTILINE)
+HEADER_LINE = "{:>3}  {:>6}  {:<8}  {:>13}  {:>13}  {:>8}  {}"
+COMPARISON_LINE = "{:>3}  {:>6}  {:<8}  {:>13.4f}  {:>13.4f}  {:>7.2f}x  {}{}"
+
+
+################################################################################
+
+class Comparison(NamedTuple):
+    """
+    Outcome of one input solved by both engines.
+    """
+
+    day: int
+    puzzle: int
+    input_name: str
+    reference_time: float
+    optimized_time: float
+    reference_answer: Union[int, str]
+    optimized_answer: Union[int, str]
+    # None if there is no known answer for the input
+    expected_answer: Union[str, None]
+
+    @property
+    def speedup(self) -> float:
+        """
+        :return: how many times faster the optimized engine was
+        """
+
+        return self.reference_time / self.optimized_time \
+            if self.optimized_time > 0 else float("inf")
+
+    @property
+    def problem(self) -> Union[str, None]:
+        """
+        :return: what is wrong with the answers, None if nothing
+        """
+
+        if self.reference_answer != self.optimized_answer:
+            return "MISMATCH (reference {})".format(self.reference_answer)
+        if self.expected_answer is not None \
+                and str(self.optimized_answer) != self.expected_answer:
+            return "WRONG (expected {})".format(self.expected_answer)
+        return None
+
+
+################################################################################
+
+def expected_answer(function: Callable) -> Union[str, None]:
+    """
+    :param function: registered puzzle function
+    :return: answer from the "Answer should be X" note in its docstring, None
+    if there is none
+    """
+
+    match = ANSWER_PATTERN.search(function.__doc__ or "")
+    return None if match is None else match.group(1)
+
+
+################################################################################
+
+def _timed(function: Callable,
+           arguments: Tuple) -> Tuple[Union[int, str], float]:
+    """
+    :param function: puzzle function
+    :param arguments: puzzle input arguments; empty for the bundled input
+    :return: answer and wall time of the function
+    """
+
+    # parsed by the earlier run otherwise; every run parses its input itself
+    clear_cache()
+    start = perf_counter()
+    answer = function(*arguments)
+    return answer, perf_counter() - start
+
+
+################################################################################
+
+def _synthetic_inputs(day: int,
+                      seeds: Iterable[int],
+                      directory: str) -> List[Tuple[str, Tuple]]:
+    """
+    :param day: day number
+    :param seeds: random seeds, one input for each
+    :param directory: where to write the input files
+    :return: input names and puzzle input arguments
+    """
+
+    inputs = []
+
+    for seed in seeds:
+        name = "seed {}".format(seed)
+        if day in SYNTHETIC_SIZES:
+            path = join(directory, "day_{:02d}-{}.txt".format(day, seed))
+            write_input(day, path, SYNTHETIC_SIZES[day], seed)
+            inputs.append((name, (path, )))
+        else:
+            inputs.append((name, (Random(seed).randrange(*PRESENTS_RANGE), )))
+
+    return inputs
+
+
+################################################################################
+
+def compare(days: Iterable[int],
+            puzzles: Iterable[int],
+            seeds: Iterable[int],
+            bundled: bool = True,
+            slow: bool = False) -> Iterable[Comparison]:
+    """
+    Generator function that solves every input with both engines.
+
+    :param days: days with a reference engine
+    :param puzzles: puzzle numbers to run for each day
+    :param seeds: random seeds of the synthetic inputs
+    :param bundled: if True, the bundled inputs are solved too
+    :param slow: if True, the bundled inputs the reference engines need hours
+    for are solved too
+    :return: comparison of the engines for every input
+    """
+
+    with TemporaryDirectory() as directory:
+        for day in days:
+            reference = import_module(REFERENCE_MODULE_NAME.format(day))
+            inputs = _synthetic_inputs(day, seeds, directory)
+            if bundled and (slow or day not in SLOW_BUNDLED_DAYS):
+                inputs.insert(0, (BUNDLED, ()))
+
+            for puzzle in puzzles:
+                optimized_function = get_puzzle(day, puzzle)
+                reference_function = getattr(
+                    reference, "puzzle_{:02d}".format(puzzle))
+
+                for name, arguments in inputs:
+                    reference_answer, reference_time = _timed(
+                        reference_function, arguments)
+                    optimized_answer, optimized_time = _timed(
+                        optimized_function, arguments)
+                    yield Comparison(
+                        day, puzzle, name, reference_time, optimized_time,
+                        reference_answer, optimized_answer,
+                        expected_answer(optimized_function)
+                        if name == BUNDLED else None)
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Reference and optimized engines of "
+                                        "the puzzles side by side")
+    parser.add_argument("-d", "--days", type=int, nargs="+",
+                        default=REFERENCE_DAYS, choices=REFERENCE_DAYS,
+                        metavar="DAY",
+                        help="days to compare (default: all with a reference "
+                             "engine)")
+    parser.add_argument("-p", "--puzzles", type=int, nargs="+",
+                        default=PUZZLES, choices=PUZZLES, metavar="PUZZLE",
+                        help="puzzles to compare for each day (default: both)")
+    parser.add_argument("--seeds", type=int, nargs="*", default=DEFAULT_SEEDS,
+                        help="seeds of the synthetic inputs (default: 1 2 3)")
+    parser.add_argument("--no-bundled", action="store_true",
+                        help="compare the synthetic inputs only")
+    parser.add_argument("--slow", action="store_true",
+                        help="compare the bundled day 20 input too (hours)")
+    parser.add_argument("--backend", choices=BACKENDS, default=AUTO,
+                        help="engine of the registered puzzles (default: "
+                             "auto)")
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Compares the specified days and fails if any answers differ.
+    """
+
+    arguments = parse_arguments()
+    set_backend(arguments.backend)
+    failed = False
+
+    print(HEADER_LINE.format(
+        "DAY", "PUZZLE", "INPUT", "REFERENCE (s)", "OPTIMIZED (s)", "SPEEDUP",
+        "ANSWER"))
+
+    for comparison in compare(arguments.days, arguments.puzzles,
+                              arguments.seeds, not arguments.no_bundled,
+                              arguments.slow):
+        problem = comparison.problem
+        failed = failed or problem is not None
+        print(COMPARISON_LINE.format(
+            comparison.day, comparison.puzzle, comparison.input_name,
+            comparison.reference_time, comparison.optimized_time,
+            comparison.speedup, comparison.optimized_answer,
+            "" if problem is None else "  " + problem), flush=True)
+
+    if failed:
+        exit(1)
+
+################################################################################
@@ -0,0 +1,370 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Empirical scaling curves. The registered puzzles of each day are run on seeded
+synthetic inputs of increasing size (locations for day 9, guests for day 13,
+containers for day 17, grid side length for days 6 and 18, the natural unit of
+src/utils/generators.py for the other days). The times are fitted to both
+a power law t = a * n^k and an exponential t = a * b^n by least squares in log
+space; the better fit gives the estimated complexity and the largest input
+which still fits into the time budget. A curve that fits neither model well
+(R^2 below MINIMUM_R_SQUARED) or barely rises over the measured sizes is
+reported as having no clear growth, without a largest input. The days with
+the least headroom over their bundled input size are the ones to break first
+as the inputs grow.
+
+Each size is timed as the best of the repeats; the parsed input is cached
+after the first one, so the times are those of the solver itself. The ladder
+of a day stops at the first size slower than --max-seconds.
+
+Run from the repository root:
+
+    python -m benchmarks.scaling --days 9 13 --budget 60
+    python -m benchmarks.scaling -d 17 --sizes 10 14 18 22 26 -p 1
+"""
+
+from argparse import ArgumentParser, Namespace
+from math import exp, floor, log
+from os.path import join
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, \
+    Tuple, Union
+from src.utils.backends import AUTO, BACKENDS, set_backend
+from src.utils.batch import accepts_input
+from src.utils.generators import BUNDLED_SIZES, GENERATORS, scaled_size, \
+    write_input
+from src.utils.inputs import clear_cache
+from src.utils.registry import get_puzzle
+from src.utils.runner import PUZZLES
+
+# days whose input can be generated; the others have it embedded in the code
+SCALING_DAYS = tuple(sorted(GENERATORS))
+DEFAULT_DAYS = (6, 9, 13, 17, 18)
+# input sizes in the natural unit of the day; the days not listed run at
+# SCALES of their bundled input size
+SIZE_LADDERS = {
+    6: (125, 250, 500, 1000, 2000),     # grid side length
+    9: (5, 6, 7, 8, 9),                 # locations
+    13: (5, 6, 7, 8, 9),                # guests
+    15: (2, 3, 4, 5),                   # ingredients
+    17: (12, 14, 16, 18, 20, 22),       # containers
+    18: (25, 50, 100, 200, 400),        # grid side length
+    24: (16, 20, 24, 28)                # packages
+}
+SCALES = (0.125, 0.25, 0.5, 1.0)
+DEFAULT_SEED = 1
+DEFAULT_REPEATS = 3
+DEFAULT_BUDGET = 60.0
+DEFAULT_MAX_SECONDS = 30.0
+# times below the timer resolution would wreck the logarithms
+MINIMUM_TIME = 1e-6
+POWER_LAW = "power law"
+EXPONENTIAL = "exponential"
+NO_GROWTH = "no clear growth"
+# fits worse than this are noise rather than a trend
+MINIMUM_R_SQUARED = 0.8
+# fitted time at the largest measured size over the time at the smallest one;
+# curves rising less than this are flat
+FLAT_RATIO = 1.5
+MEASUREMENT_HEADER_LINE = "{:>3}  {:>6}  {:>8}  {:>12}"
+MEASUREMENT_LINE = "{:>3}  {:>6}  {:>8}  {:>12.6f}"
+HEADER_LINE = "{:>3}  {:>6}  {:<18}  {:>6}  {:>8}  {:>10}  {:>8}"
+FIT_LINE = "{:>3}  {:>6}  {:<18}  {:>6.3f}  {:>8}  {:>10}  {:>8}"
+
+
+################################################################################
+
+class Measurement(NamedTuple):
+    """
+    Best time of one puzzle on one input size.
+    """
+
+    day: int
+    puzzle: int
+    size: int
+    seconds: float
+
+
+################################################################################
+
+class ScalingFit(NamedTuple):
+    """
+    Time model of one puzzle fitted to its measurements; t = a * n^k for the
+    power law, t = a * b^n for the exponential. NO_GROWTH keeps the numbers
+    of the better of the two fits, but they predict nothing.
+    """
+
+    day: int
+    puzzle: int
+    model: str
+    # a of both models
+    coefficient: float
+    # k of the power law, b of the exponential
+    growth: float
+    # coefficient of determination of the fit in log space
+    r_squared: float
+
+    @property
+    def complexity(self) -> str:
+        """
+        :return: estimated complexity in the big O notation
+        """
+
+        if self.model == NO_GROWTH:
+            return NO_GROWTH
+        if self.model == POWER_LAW:
+            return "O(n^{:.2f})".format(self.growth)
+        # bases near 1 are common; two decimals would show them as 1.00
+        return "O({:.4g}^n)".format(self.growth)
+
+    def largest_size(self, budget: float) -> Union[int, None]:
+        """
+        :param budget: time budget (seconds)
+        :return: largest input size predicted to run within the budget; None if
+        the time does not grow with the size, or grows so slowly that no
+        representable size runs out of the budget
+        """
+
+        if self.model == NO_GROWTH:
+            return None
+        try:
+            if self.model == POWER_LAW:
+                if self.growth <= 0:
+                    return None
+                return floor((budget / self.coefficient) ** (1 / self.growth))
+            if self.growth <= 1:
+                return None
+            return floor(log(budget / self.coefficient) / log(self.growth))
+        except OverflowError:
+            return None
+
+
+################################################################################
+
+def size_ladder(day: int) -> Tuple[int, ...]:
+    """
+    :param day: day number
+    :return: increasing input sizes of the day, without duplicates
+    """
+
+    if day in SIZE_LADDERS:
+        return SIZE_LADDERS[day]
+    return tuple(sorted({scaled_size(day, scale) for scale in SCALES}))
+
+
+################################################################################
+
+def measure(day: int,
+            puzzle: int,
+            sizes: Iterable[int],
+            directory: str,
+            seed: int = DEFAULT_SEED,
+            repeats: int = DEFAULT_REPEATS,
+            max_seconds: float = DEFAULT_MAX_SECONDS) -> Iterator[Measurement]:
+    """
+    Generator function that times the puzzle on inputs of the given sizes, up
+    to the first one slower than max_seconds.
+
+    :param day: day number
+    :param puzzle: puzzle number
+    :param sizes: increasing input sizes in the natural unit of the day
+    :param directory: where to write the input files
+    :param seed: random seed of the inputs
+    :param repeats: runs of every size; the best time counts
+    :param max_seconds: the ladder stops after a run slower than this
+    :return: measurement of every size
+    """
+
+    function = get_puzzle(day, puzzle)
+
+    for size in sizes:
+        path = join(directory, "day_{:02d}-{}.txt".format(day, size))
+        write_input(day, path, size, seed)
+        best = None
+
+        for _ in range(repeats):
+            # parsed by the earlier repeat otherwise; every repeat parses its
+            # input itself
+            clear_cache()
+            start = perf_counter()
+            function(path)
+            seconds = perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+            if seconds > max_seconds:
+                break
+
+        yield Measurement(day, puzzle, size, best)
+        if best > max_seconds:
+            return
+
+
+################################################################################
+
+def _least_squares(xs: Sequence[float],
+                   ys: Sequence[float]) -> Tuple[float, float, float]:
+    """
+    :param xs: independent values
+    :param ys: dependent values
+    :return: slope, intercept and coefficient of determination of the line
+    fitted to the points
+    """
+
+    count = len(xs)
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    variance_x = sum((x - mean_x) ** 2 for x in xs)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    slope = covariance / variance_x
+    intercept = mean_y - slope * mean_x
+
+    total = sum((y - mean_y) ** 2 for y in ys)
+    residual = sum((y - slope * x - intercept) ** 2 for x, y in zip(xs, ys))
+    return slope, intercept, 1.0 if total == 0 else 1 - residual / total
+
+
+################################################################################
+
+def fit(measurements: Sequence[Measurement]) -> Union[ScalingFit, None]:
+    """
+    Fits both models to the measurements of one puzzle and keeps the better
+    one.
+
+    :param measurements: measurements of one puzzle
+    :return: the model with the higher coefficient of determination, or
+    NO_GROWTH if it fits poorly or is flat; None if there are fewer than two
+    distinct sizes
+    """
+
+    sizes = [measurement.size for measurement in measurements]
+    if len(set(sizes)) < 2:
+        return None
+    log_times = [log(max(measurement.seconds, MINIMUM_TIME))
+                 for measurement in measurements]
+    day = measurements[0].day
+    puzzle = measurements[0].puzzle
+
+    exponent, intercept, power_r_squared = _least_squares(
+        [log(size) for size in sizes], log_times)
+    power_law = ScalingFit(day, puzzle, POWER_LAW, exp(intercept), exponent,
+                           power_r_squared)
+    log_base, intercept, exponential_r_squared = _least_squares(
+        sizes, log_times)
+    exponential = ScalingFit(day, puzzle, EXPONENTIAL, exp(intercept),
+                             exp(log_base), exponential_r_squared)
+
+    # a tie goes to the power law, the more modest claim
+    if exponential_r_squared > power_r_squared:
+        best = exponential
+        # rise of the fitted log time over the measured sizes
+        rise = log_base * (max(sizes) - min(sizes))
+    else:
+        best = power_law
+        rise = exponent * (log(max(sizes)) - log(min(sizes)))
+
+    if best.r_squared < MINIMUM_R_SQUARED or rise < log(FLAT_RATIO):
+        return best._replace(model=NO_GROWTH)
+    return best
+
+
+################################################################################
+
+def headroom(scaling_fit: ScalingFit, budget: float) -> float:
+    """
+    :param scaling_fit: fitted time model
+    :param budget: time budget (seconds)
+    :return: largest input size within the budget relative to the bundled
+    input size; infinity if the time does not grow with the size
+    """
+
+    largest_size = scaling_fit.largest_size(budget)
+    if largest_size is None:
+        return float("inf")
+    return largest_size / BUNDLED_SIZES[scaling_fit.day]
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Scaling curves of the puzzles on "
+                                        "synthetic inputs of increasing size")
+    parser.add_argument("-d", "--days", type=int, nargs="+",
+                        default=DEFAULT_DAYS, choices=SCALING_DAYS,
+                        metavar="DAY",
+                        help="days to measure (default: {})".format(
+                            " ".join(map(str, DEFAULT_DAYS))))
+    parser.add_argument("-p", "--puzzles", type=int, nargs="+",
+                        default=PUZZLES, choices=PUZZLES, metavar="PUZZLE",
+                        help="puzzles to measure for each day (default: both)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=None,
+                        help="input sizes in the natural unit of the day "
+                             "(default: the day's own ladder)")
+    parser.add_argument("-b", "--budget", type=float, default=DEFAULT_BUDGET,
+                        help="time budget of one puzzle run (seconds)")
+    parser.add_argument("-r", "--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--max-seconds", type=float,
+                        default=DEFAULT_MAX_SECONDS,
+                        help="stop a day's ladder after a slower run")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="random seed of the synthetic inputs")
+    parser.add_argument("--backend", choices=BACKENDS, default=AUTO,
+                        help="engine of the grid, search and numeric days; "
+                             "auto may switch engines along the ladder "
+                             "(default: auto)")
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Measures the specified puzzles and prints their fitted complexity, the
+    puzzles with the least headroom first.
+    """
+
+    arguments = parse_arguments()
+    set_backend(arguments.backend)
+    measurements: Dict[Tuple[int, int], List[Measurement]] = {}
+    print(MEASUREMENT_HEADER_LINE.format("DAY", "PUZZLE", "SIZE",
+                                         "SECONDS"))
+
+    with TemporaryDirectory() as directory:
+        for day in arguments.days:
+            sizes = sorted(set(arguments.sizes)) \
+                if arguments.sizes is not None else size_ladder(day)
+            for puzzle in arguments.puzzles:
+                if not accepts_input(day, puzzle):
+                    print("Day {} puzzle {} has its input written in the "
+                          "source code; skipped".format(day, puzzle))
+                    continue
+                for measurement in measure(
+                        day, puzzle, sizes, directory, arguments.seed,
+                        arguments.repeats, arguments.max_seconds):
+                    measurements.setdefault((day, puzzle), []).append(
+                        measurement)
+                    print(MEASUREMENT_LINE.format(*measurement), flush=True)
+
+    fits = [scaling_fit for scaling_fit in map(fit, measurements.values())
+            if scaling_fit is not None]
+    fits.sort(key=lambda scaling_fit: headroom(scaling_fit, arguments.budget))
+
+    print()
+    print(HEADER_LINE.format("DAY", "PUZZLE", "COMPLEXITY", "R^2", "BUNDLED",
+                             "LARGEST", "HEADROOM"))
+    for scaling_fit in fits:
+        largest_size = scaling_fit.largest_size(arguments.budget)
+        print(FIT_LINE.format(
+            scaling_fit.day, scaling_fit.puzzle, scaling_fit.complexity,
+            scaling_fit.r_squared, BUNDLED_SIZES[scaling_fit.day],
+            "-" if largest_size is None else largest_size,
+            "-" if largest_size is None
+            else "{:.2f}x".format(headroom(scaling_fit, arguments.budget))))
+    print("LARGEST: input size predicted to run within {:.1f} s; HEADROOM: "
+          "LARGEST over the BUNDLED size".format(arguments.budget))
+
+################################################################################
@@ -0,0 +1,147 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Cold-start benchmark. For every requested day, a fresh interpreter imports the
+command line runner and the day module, the way a single-day run does, with
+-X importtime turned on. The total import time and the heaviest modules are
+reported; the run fails when any day is over the given budget.
+
+Run from the repository root:
+
+    python -m benchmarks.startup --days 1 2 24 --budget 50
+"""
+
+from argparse import ArgumentParser, Namespace
+from os.path import dirname, realpath
+from subprocess import run
+from sys import executable, exit
+from typing import Iterable, List, NamedTuple, Tuple
+from src.utils.runner import DAYS
+
+REPOSITORY_ROOT = dirname(dirname(realpath(__file__)))
+IMPORT_STATEMENT = ("import advent_of_code_2015; "
+                    "from src.utils.registry import get_puzzle; "
+                    "get_puzzle({}, 1)")
+IMPORT_TIME_PREFIX = "import time:"
+IMPORT_TIME_DENOMINATOR = "|"
+DEFAULT_REPEATS = 5
+DEFAULT_BUDGET_MS = 100.0
+HEAVIEST_COUNT = 3
+
+
+################################################################################
+
+class ImportedModule(NamedTuple):
+    """
+    One line of the -X importtime output.
+    """
+
+    name: str
+    self_us: int
+    cumulative_us: int
+    level: int
+
+
+################################################################################
+
+def _measure_imports(day: int) -> Tuple[ImportedModule, ...]:
+    """
+    Imports the runner and the day module in a fresh interpreter.
+
+    :param day: day number (1-25)
+    :return: every imported module with its import times
+    """
+
+    process = run((executable, "-X", "importtime", "-c",
+                   IMPORT_STATEMENT.format(day)),
+                  cwd=REPOSITORY_ROOT, capture_output=True, text=True,
+                  check=True)
+    modules = []
+
+    for line in process.stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        columns = line[len(IMPORT_TIME_PREFIX):].split(IMPORT_TIME_DENOMINATOR)
+        if not columns[0].strip().isnumeric():
+            # the header line
+            continue
+        name = columns[2].rstrip()
+        modules.append(ImportedModule(
+            name.strip(), int(columns[0]), int(columns[1]),
+            (len(name) - len(name.lstrip())) // 2))
+
+    return tuple(modules)
+
+
+################################################################################
+
+def startup_times(days: Iterable[int], repeats: int) \
+        -> Tuple[Tuple[int, float, Tuple[ImportedModule, ...]], ...]:
+    """
+    Measures every day several times and keeps the fastest run, which is the
+    least disturbed by the rest of the system.
+
+    :param days: day numbers to measure
+    :param repeats: number of fresh interpreters per day
+    :return: day number, total import time (ms) and the imported modules of the
+    fastest run for every day
+    """
+
+    results = []
+
+    for day in days:
+        runs = []
+        for _ in range(repeats):
+            modules = _measure_imports(day)
+            # top level imports already include their nested imports
+            total = sum(module.cumulative_us
+                        for module in modules if module.level == 0) / 1000
+            runs.append((total, modules))
+        total, modules = min(runs, key=lambda item: item[0])
+        results.append((day, total, modules))
+
+    return tuple(results)
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Advent of Code 2015 cold-start times")
+    parser.add_argument("-d", "--days", type=int, nargs="+", default=DAYS,
+                        choices=DAYS, metavar="DAY")
+    parser.add_argument("-r", "--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("-b", "--budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help="allowed total import time per day (ms)")
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Measures cold-start import times of the specified days.
+    """
+
+    arguments = parse_arguments()
+    over_budget: List[int] = []
+
+    for day, total, modules in startup_times(arguments.days, arguments.repeats):
+        heaviest = sorted(modules, key=lambda module: module.self_us,
+                          reverse=True)[:HEAVIEST_COUNT]
+        print("{:02d}  {:>8.1f} ms  heaviest: {}".format(
+            day, total, ", ".join("{} ({:.1f} ms)".format(
+                module.name, module.self_us / 1000) for module in heaviest)))
+        if total > arguments.budget:
+            over_budget.append(day)
+
+    if len(over_budget) > 0:
+        print("Over the {:.1f} ms budget: {}".format(
+            arguments.budget, ", ".join(str(day) for day in over_budget)))
+        exit(1)
+
+################################################################################
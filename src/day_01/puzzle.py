@@ -16,31 +16,39 @@ The apartment building is very tall, and the basement is very deep; he will
 never find the top or bottom floors.
 """
 
-from src.utils.utils import print_puzzle_solution
+from os.path import dirname, join, realpath
+from src.utils.inputs import map_input, read_chunks
+from src.utils.registry import solution
 
-INPUT_FILE_PATH = "src/day_01/input.txt"
-FLOOR_UP = "("
-FLOOR_DOWN = ")"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
+FLOOR_UP = b"("
+FLOOR_DOWN = b")"
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=1, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Use the puzzle input txt file. To what floor do the instructions take Santa?
 
-    :return: None; Answer should be 232.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 232.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        contents = f.read()
-        floor = contents.count(FLOOR_UP) - contents.count(FLOOR_DOWN)
-        print_puzzle_solution(floor)
+    floor = 0
+
+    with map_input(input_path) as contents:
+        for chunk in read_chunks(contents):
+            floor += chunk.count(FLOOR_UP) - chunk.count(FLOOR_DOWN)
+
+    return floor
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=1, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Now, given the same instructions, find the position of the first character
     that causes him to enter the basement (floor -1). The first character in the
@@ -49,21 +57,34 @@ def puzzle_02() -> None:
     What is the position of the character that causes Santa to first enter the
     basement?
 
-    :return: None; Answer should be 1783.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 1783.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        contents = f.read()
-        # floor instructions translated to +1 or -1 integers
-        instructions = [1 if literal == FLOOR_UP
-                        else -1
-                        for literal in contents]
-        # what floor Santa will end up by following every instruction
-        floors = [sum(instructions[:i]) for i in range(len(instructions))]
-        # index of the first instruction that causes Santa to end up
-        # in the basement
-        first_basement_instruction = floors.index(
-            next(floor for floor in floors if floor < 0))
-        print_puzzle_solution(first_basement_instruction)
+    # what floor Santa is on; only the current one is kept, not every floor
+    # Santa went through
+    floor = 0
+    position = 0
+
+    with map_input(input_path) as contents:
+        for chunk in read_chunks(contents):
+            # Santa can only reach the basement within the chunk if it goes
+            # down more times than Santa is floors above the basement
+            if chunk.count(FLOOR_DOWN) <= floor:
+                floor += chunk.count(FLOOR_UP) - chunk.count(FLOOR_DOWN)
+                position += len(chunk)
+                continue
+            for literal in chunk:
+                position += 1
+                if literal == FLOOR_UP[0]:
+                    floor += 1
+                elif literal == FLOOR_DOWN[0]:
+                    floor -= 1
+                if floor < 0:
+                    # the first instruction that causes Santa to end up in
+                    # the basement
+                    return position
+
+    raise ValueError("Santa never enters the basement")
 
 ################################################################################
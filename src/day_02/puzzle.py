@@ -13,13 +13,28 @@ only have to worry about the length they need to order, which they would again
 like to be exact.
 """
 
-from numpy import prod
-from src.utils.utils import print_puzzle_solution
+from os.path import dirname, join, realpath
+from math import prod
+from typing import Iterator, Tuple
+from src.utils.inputs import stream_lines
+from src.utils.registry import solution
 
-INPUT_FILE_PATH = "src/day_02/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 DENOMINATOR = "x"
 
 
+################################################################################
+
+def _read_box_dimensions(input_path: str) -> Iterator[Tuple[int, ...]]:
+    """
+    :param input_path: puzzle input file path
+    :return: length, width and height of every box, one box at a time
+    """
+
+    return (tuple(int(value) for value in line.strip().split(DENOMINATOR))
+            for line in stream_lines(input_path))
+
+
 ################################################################################
 
 def _get_paper_area(length: int, width: int, height: int) -> int:
@@ -61,7 +76,8 @@ def _get_ribbon_length(length: int, width: int, height: int) -> int:
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=2, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Fortunately, every present is a box (a perfect right rectangular prism),
     which makes calculating the required wrapping paper for each gift a little
@@ -72,21 +88,19 @@ def puzzle_01() -> None:
     All numbers in the elves' list are in feet. How many total square feet of
     wrapping paper should they order?
 
-    :return: None; Answer should be 1606483.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 1606483.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        box_dimensions = f.readlines()
-        total = sum(_get_paper_area(int(line.strip().split(DENOMINATOR)[0]),
-                                    int(line.strip().split(DENOMINATOR)[1]),
-                                    int(line.strip().split(DENOMINATOR)[2]))
-                    for line in box_dimensions)
-        print_puzzle_solution(total)
+    total = sum(_get_paper_area(*dimensions)
+                for dimensions in _read_box_dimensions(input_path))
+    return total
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=2, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     The ribbon required to wrap a present is the shortest distance around its
     sides, or the smallest perimeter of any one face. Each present also requires
@@ -94,15 +108,12 @@ def puzzle_02() -> None:
     perfect bow is equal to the cubic feet of volume of the present. Don't ask
     how they tie the bow, though; they'll never tell.
 
-    :return: None; Answer should be 3842356.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 3842356.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        box_dimensions = f.readlines()
-        total = sum(_get_ribbon_length(int(line.strip().split(DENOMINATOR)[0]),
-                                       int(line.strip().split(DENOMINATOR)[1]),
-                                       int(line.strip().split(DENOMINATOR)[2]))
-                    for line in box_dimensions)
-        print_puzzle_solution(total)
+    total = sum(_get_ribbon_length(*dimensions)
+                for dimensions in _read_box_dimensions(input_path))
+    return total
 
 ################################################################################
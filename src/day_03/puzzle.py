@@ -10,9 +10,12 @@ The next year, to speed up the process, Santa creates a robot version of
 himself, Robo-Santa, to deliver presents with him.
 """
 
-from src.utils.utils import print_puzzle_solution
+from os.path import dirname, join, realpath
+from typing import Iterator
+from src.utils.inputs import map_input, read_chunks
+from src.utils.registry import solution
 
-INPUT_FILE_PATH = "src/day_03/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 DIRECTION_NORTH = "^"
 DIRECTION_SOUTH = "v"
 DIRECTION_WEST = "<"
@@ -43,7 +46,22 @@ DIRECTIONS = {
 
 ################################################################################
 
-def puzzle_01() -> None:
+def _read_directions(input_path: str) -> Iterator[str]:
+    """
+    :param input_path: puzzle input file path
+    :return: directions from the elf, one by one; the input is mapped to
+    memory, not read whole
+    """
+
+    with map_input(input_path) as contents:
+        for chunk in read_chunks(contents):
+            yield from chunk.decode("ascii")
+
+
+################################################################################
+
+@solution(day=3, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Santa begins by delivering a present to the house at his starting location,
     and then an elf at the North Pole calls him via radio and tells him where to
@@ -55,28 +73,32 @@ def puzzle_01() -> None:
     and so his directions are a little off, and Santa ends up visiting some
     houses more than once. How many houses receive at least one present?
 
-    :return: None; Answer should be 2081.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 2081.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        directions = f.read().strip()
-        houses = [(0, 0)]
+    house = (0, 0)
+    # eliminate duplicities by using set
+    houses = {house}
 
-        for direction in directions:
-            # look at the previously visited house;
-            # change the coordinates according to the direction;
-            # append the visited house
-            houses.append((
-                DIRECTIONS[direction][KEY_COORD_X](houses[-1][0]),
-                DIRECTIONS[direction][KEY_COORD_Y](houses[-1][1])))
+    for direction in _read_directions(input_path):
+        if direction not in DIRECTIONS:
+            # the line ending
+            continue
+        # look at the previously visited house;
+        # change the coordinates according to the direction;
+        # add the visited house
+        house = (DIRECTIONS[direction][KEY_COORD_X](house[0]),
+                 DIRECTIONS[direction][KEY_COORD_Y](house[1]))
+        houses.add(house)
 
-        # eliminate duplicities by using set
-        print_puzzle_solution(len(set(houses)))
+    return len(houses)
 
 ################################################################################
 
 
-def puzzle_02() -> None:
+@solution(day=3, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Santa and Robo-Santa start at the same location (delivering two presents to
     the same starting house), then take turns moving based on instructions from
@@ -85,27 +107,29 @@ def puzzle_02() -> None:
 
     This year, how many houses receive at least one present?
 
-    :return: None; Answer should be 2341.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 2341.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        directions = f.read()
-        # one starting house for the human Santa and the other for the
-        # Robo-Santa
-        houses = [(0, 0), (0, 0)]
-
-        for direction in directions:
-            # since human Santa and Robo-Santa are taking turns, the previous
-            # visited house for each Santa is now second to last
-
-            # look at the previously visited house;
-            # change the coordinates according to the direction;
-            # append the visited house
-            houses.append((
-                DIRECTIONS[direction][KEY_COORD_X](houses[-2][0]),
-                DIRECTIONS[direction][KEY_COORD_Y](houses[-2][1])))
-
-        # eliminate duplicities by using set
-        print_puzzle_solution(len(set(houses)))
+    # the last visited house of the human Santa and of the Robo-Santa
+    santas = [(0, 0), (0, 0)]
+    # eliminate duplicities by using set
+    houses = set(santas)
+    turn = 0
+
+    for direction in _read_directions(input_path):
+        if direction not in DIRECTIONS:
+            # the line ending
+            continue
+        # look at the previously visited house of the Santa whose turn it is;
+        # change the coordinates according to the direction;
+        # add the visited house
+        santas[turn] = (DIRECTIONS[direction][KEY_COORD_X](santas[turn][0]),
+                        DIRECTIONS[direction][KEY_COORD_Y](santas[turn][1]))
+        houses.add(santas[turn])
+        # human Santa and Robo-Santa are taking turns
+        turn = 1 - turn
+
+    return len(houses)
 
 ################################################################################
@@ -10,7 +10,9 @@ gifts for all the economically forward-thinking little girls and boys.
 
 from hashlib import md5
 from itertools import count
-from src.utils.utils import print_puzzle_solution
+from src.utils.counters import add
+from src.utils.progress import Tracker
+from src.utils.registry import solution
 
 CODE = "yzbqklnj"
 PREFIX_1 = "00000"
@@ -27,8 +29,12 @@ def _find_the_hash(prefix: str) -> int:
     :return: puzzle solution
     """
 
-    for i in count(start=0, step=1):
+    tracker = Tracker("day 04 hashes, prefix {}".format(prefix), "hashes")
+
+    for i in tracker.iterate(count(start=0, step=1)):
         if md5(bytes(CODE + str(i), encoding='utf-8')).hexdigest().startswith(prefix):
+            # counted once; numbers 0 to i were hashed
+            add("md5 hashes", i + 1)
             return i
         else:
             i += 1
@@ -36,7 +42,8 @@ def _find_the_hash(prefix: str) -> int:
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=4, puzzle=1)
+def puzzle_01() -> int:
     """
     To do the mining, Santa needs to find MD5 hashes which, in hexadecimal,
     start with at least five zeroes. The input to the MD5 hash is some secret
@@ -44,21 +51,22 @@ def puzzle_01() -> None:
     you must find Santa the lowest positive number (no leading zeroes: 1, 2, 3,
     ...) that produces such a hash.
 
-    :return: None; Answer should be 282749.
+    :return: puzzle solution; Answer should be 282749.
     """
 
-    print_puzzle_solution(_find_the_hash(PREFIX_1))
+    return _find_the_hash(PREFIX_1)
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=4, puzzle=2)
+def puzzle_02() -> int:
     """
     Now find one that starts with six zeroes.
 
-    :return: None; Answer should be 9962624.
+    :return: puzzle solution; Answer should be 9962624.
     """
 
-    print_puzzle_solution(_find_the_hash(PREFIX_2))
+    return _find_the_hash(PREFIX_2)
 
 ################################################################################
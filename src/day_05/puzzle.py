@@ -8,9 +8,11 @@ Santa needs help figuring out which strings in his text file are naughty or
 nice.
 """
 
-from src.utils.utils import print_puzzle_solution
+from os.path import dirname, join, realpath
+from src.utils.inputs import stream_lines
+from src.utils.registry import solution
 
-INPUT_FILE_PATH = "src/day_05/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 VOWELS = "aeiou"
 FORBIDDEN = ("ab", "cd", "pq", "xy")
 
@@ -68,34 +70,34 @@ def _is_string_nice_2(input_string: str) -> bool:
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=5, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     How many strings in the input are nice?
 
-    :return: None; Answer should be 258.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 258.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        print_puzzle_solution(len(tuple(
-            filter(lambda line: _is_string_nice_1(line), lines))))
+    return sum(1 for line in stream_lines(input_path)
+               if _is_string_nice_1(line))
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=5, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Realizing the error of his ways, Santa has switched to a better model of
     determining whether a string is naughty or nice. None of the old rules
     apply, as they are all clearly ridiculous. How many strings are nice under
     the new rules?
 
-    :return: None; Answer should be 53.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 53.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        print_puzzle_solution(len(tuple(
-            filter(lambda line: _is_string_nice_2(line), lines))))
+    return sum(1 for line in stream_lines(input_path)
+               if _is_string_nice_2(line))
 
 ################################################################################
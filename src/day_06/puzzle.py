@@ -11,12 +11,39 @@ Furthermore, because you've been especially nice this year, Santa has mailed you
 instructions on how to display the ideal lighting configuration.
 """
 
-from typing import Dict
+from array import array
+from functools import partial
+from math import ceil
+from os.path import dirname, join, realpath
+from typing import Iterable, NamedTuple, Tuple, Union
 from itertools import chain
-from re import compile, findall
-from src.utils.utils import print_puzzle_solution
+from re import compile
+from src.utils.backends import MULTIPROCESSING, NUMPY, available_workers, \
+    select_backend, worker_pool
+from src.utils.inputs import stream_lines
+from src.utils.registry import solution
+from src.utils.shared import SharedArray, attach, share
 
-INPUT_FILE_PATH = "src/day_06/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
+# smallest grids (number of lights) the auto backend solves with NumPy and
+# with the worker pool
+NUMPY_SIZE = 10000
+POOL_SIZE = 250000
+
+
+################################################################################
+
+class Instruction(NamedTuple):
+    """
+    One instruction from the input file; the borders are inclusive row/column
+    numbers of the rectangle of lights.
+    """
+
+    type: str
+    top: int
+    bottom: int
+    left: int
+    right: int
 
 
 ################################################################################
@@ -25,16 +52,18 @@ class Lights(object):
     TURN_ON = "turn on"
     TURN_OFF = "turn off"
     TOGGLE = "toggle"
+    # instruction types by their numbers in the shared instructions
+    TYPES = (TURN_ON, TURN_OFF, TOGGLE)
     DIMENSIONS_DENOMINATOR = ","
+    # instruction type and both corners; compiled once for all the lines
+    INSTRUCTION_PATTERN = compile(
+        r"({}|{}|{}) (\d+){}(\d+) through (\d+){}(\d+)".format(
+            TURN_ON, TURN_OFF, TOGGLE,
+            DIMENSIONS_DENOMINATOR, DIMENSIONS_DENOMINATOR))
     SIZE = 1000
     KEY_LIGHT_OFF = "LIGHT_OFF"
     KEY_IS_LIT = "IS_LIT"
 
-    KEY_TOP = "TOP"
-    KEY_BOTTOM = "BOTTOM"
-    KEY_LEFT = "LEFT"
-    KEY_RIGHT = "RIGHT"
-
     KEY_PUZZLE_1 = "PUZZLE_1"
     KEY_PUZZLE_2 = "PUZZLE_2"
 
@@ -59,39 +88,48 @@ class Lights(object):
 
 ################################################################################
 
-    def __init__(self, puzzle):
+    def __init__(self,
+                 puzzle,
+                 size: int = SIZE,
+                 rows: Union[Tuple[int, int], None] = None):
         """
         Initialize the grid of lights. Store the information about which puzzle
         we are solving.
+
+        :param puzzle: KEY_PUZZLE_1 or KEY_PUZZLE_2
+        :param size: grid side length
+        :param rows: first row number and number of rows of the band of the
+        grid kept by this object (worker pool engine); None for the whole grid
         """
 
         self._puzzle = puzzle
+        self._size = size
+        self._first_row, self._rows = (0, size) if rows is None else rows
 
         # breaks if initialized like LIGHTS = [[LIGHT_OFF] * SIZE] * SIZE
         # probably because of shallow copies of rows
         self._lights = []
-        for _ in range(self.SIZE):
+        for _ in range(self._rows):
             row = []
-            for __ in range(self.SIZE):
+            for __ in range(self._size):
                 row.append(self.LIGHTS[self._puzzle][self.KEY_LIGHT_OFF])
             self._lights.append(row)
 
 ################################################################################
 
-    def process_instruction(self, instruction: str) -> None:
+    def process_instruction(self, instruction: Instruction) -> None:
         """
         Applies the instruction to the grid of lights.
 
-        :param instruction: one instruction from the input file
+        :param instruction: one parsed instruction from the input file
         """
 
-        instruction_type = self._get_instruction_type(instruction)
-        function = self.LIGHTS[self._puzzle][instruction_type]
-        borders = self._get_instruction_borders(instruction)
-        top = borders[self.KEY_TOP]
-        bottom = borders[self.KEY_BOTTOM]
-        left = borders[self.KEY_LEFT]
-        right = borders[self.KEY_RIGHT]
+        function = self.LIGHTS[self._puzzle][instruction.type]
+        # only the rows of the band are kept; numbered from its first row
+        top = max(instruction.top, self._first_row) - self._first_row
+        bottom = min(instruction.bottom,
+                     self._first_row + self._rows - 1) - self._first_row
+        left, right = instruction.left, instruction.right
 
         for row_number in range(top, bottom + 1):
             # get the segment of the row which is affected by the instruction
@@ -124,39 +162,187 @@ class Lights(object):
 
 ################################################################################
 
-    def _get_instruction_type(self, instruction: str) -> str:
+    @property
+    def result(self) -> int:
+        """
+        :return: number of lit lights for puzzle 1, total brightness for
+        puzzle 2
+        """
+
+        return self.lit_lights_count if self._puzzle == self.KEY_PUZZLE_1 \
+            else self.total_brightness
+
+################################################################################
+
+    @classmethod
+    def parse_instruction(cls, line: str) -> Instruction:
         """
-        :param instruction: one instruction from the input file
-        :return: either "turn on", "turn off" or "toggle"
+        :param line: one instruction from the input file
+        :return: the instruction type ("turn on", "turn off" or "toggle") and
+        the top, bottom, left and right row/column numbers that surround the
+        lights from the instruction
         """
 
-        return findall(compile("{}|{}|{}".format(
-            self.TURN_ON, self.TURN_OFF, self.TOGGLE)), instruction)[0]
+        instruction_type, left, top, right, bottom = \
+            cls.INSTRUCTION_PATTERN.search(line).groups()
+        return Instruction(instruction_type,
+                           int(top), int(bottom), int(left), int(right))
 
 ################################################################################
 
-    def _get_instruction_borders(self, instruction: str) -> Dict[str, int]:
+    @classmethod
+    def parse_instructions(cls, input_path: str) -> Iterable[Instruction]:
         """
-        :param instruction: one instruction from the input file
-        :return: top, bottom, left and right row/column numbers that surround
-        the lights from the instruction
+        :param input_path: puzzle input file path
+        :return: instructions parsed as the input file lines are streamed
         """
 
-        pattern = compile(r"\d+{}\d+".format(self.DIMENSIONS_DENOMINATOR))
-        borders = tuple(map(
-            lambda corner: [int(value) for value in corner.split(",")],
-            findall(pattern, instruction)))
-        return {
-            self.KEY_TOP: borders[0][1],
-            self.KEY_BOTTOM: borders[1][1],
-            self.KEY_LEFT: borders[0][0],
-            self.KEY_RIGHT: borders[1][0]
+        return map(cls.parse_instruction, stream_lines(input_path))
+
+################################################################################
+
+    @classmethod
+    def grid_size(cls, instructions: Iterable[Instruction]) -> int:
+        """
+        :param instructions: all the instructions from the input file
+        :return: grid side length; the usual 1000 unless the instructions
+        reach beyond it (synthetic inputs)
+        """
+
+        return max(chain((cls.SIZE - 1, ), (
+            max(instruction.top, instruction.bottom,
+                instruction.left, instruction.right)
+            for instruction in instructions))) + 1
+
+
+################################################################################
+
+def solve_lights(puzzle: str, input_path: str) -> int:
+    """
+    Follows all the instructions with the engine of the current backend.
+
+    :param puzzle: Lights.KEY_PUZZLE_1 or Lights.KEY_PUZZLE_2
+    :param input_path: puzzle input file path
+    :return: number of lit lights for puzzle 1, total brightness for puzzle 2
+    """
+
+    # the instructions are streamed twice; first for the grid size, then for
+    # the lights
+    size = Lights.grid_size(Lights.parse_instructions(input_path))
+    backend = select_backend(size ** 2, NUMPY_SIZE, POOL_SIZE)
+
+    if backend == NUMPY:
+        return _solve_lights_numpy(puzzle, size, input_path)
+    elif backend == MULTIPROCESSING:
+        return _solve_lights_pool(puzzle, size, input_path)
+    else:
+        lights = Lights(puzzle, size)
+        for instruction in Lights.parse_instructions(input_path):
+            lights.process_instruction(instruction)
+        return lights.result
+
+
+################################################################################
+
+def _solve_lights_numpy(puzzle: str, size: int, input_path: str) -> int:
+    """
+    NumPy engine; every instruction is applied to the whole rectangle of
+    lights at once.
+
+    :param puzzle: Lights.KEY_PUZZLE_1 or Lights.KEY_PUZZLE_2
+    :param size: grid side length
+    :param input_path: puzzle input file path
+    :return: number of lit lights for puzzle 1, total brightness for puzzle 2
+    """
+
+    # imported here; NumPy is only needed for its backend
+    import numpy
+
+    # lights are 0 or 1 for puzzle 1; the rectangles are views of the grid,
+    # changed in place
+    functions = {
+        Lights.KEY_PUZZLE_1: {
+            Lights.TURN_ON: lambda lights: lights.fill(1),
+            Lights.TURN_OFF: lambda lights: lights.fill(0),
+            Lights.TOGGLE: lambda lights: numpy.bitwise_xor(lights, 1,
+                                                            out=lights)
+        },
+        Lights.KEY_PUZZLE_2: {
+            Lights.TURN_ON: lambda lights: numpy.add(lights, 1, out=lights),
+            Lights.TURN_OFF: lambda lights: numpy.maximum(lights - 1, 0,
+                                                          out=lights),
+            Lights.TOGGLE: lambda lights: numpy.add(lights, 2, out=lights)
         }
+    }
+    grid = numpy.zeros((size, size), dtype=numpy.int32)
+
+    for instruction in Lights.parse_instructions(input_path):
+        functions[puzzle][instruction.type](
+            grid[instruction.top: instruction.bottom + 1,
+                 instruction.left: instruction.right + 1])
+
+    return int(grid.sum(dtype=numpy.int64))
+
+
+################################################################################
+
+def _solve_lights_pool(puzzle: str, size: int, input_path: str) -> int:
+    """
+    Worker pool engine; the grid is split into bands of rows and every worker
+    follows all the instructions in its own band. The instructions are parsed
+    once and shared with the workers as flat numbers: type number, top,
+    bottom, left and right border of every instruction.
+
+    :param puzzle: Lights.KEY_PUZZLE_1 or Lights.KEY_PUZZLE_2
+    :param size: grid side length
+    :param input_path: puzzle input file path
+    :return: number of lit lights for puzzle 1, total brightness for puzzle 2
+    """
+
+    instructions = array("l", chain.from_iterable(
+        (Lights.TYPES.index(instruction.type), *instruction[1:])
+        for instruction in Lights.parse_instructions(input_path)))
+    band_rows = ceil(size / available_workers())
+    bands = tuple((first_row, min(band_rows, size - first_row))
+                  for first_row in range(0, size, band_rows))
+
+    with share(instructions) as shared_instructions, \
+            worker_pool() as pool_map:
+        return sum(pool_map(
+            partial(_solve_band, puzzle, size, shared_instructions), bands))
+
+
+################################################################################
+
+def _solve_band(puzzle: str,
+                size: int,
+                shared_instructions: SharedArray,
+                rows: Tuple[int, int]) -> int:
+    """
+    :param puzzle: Lights.KEY_PUZZLE_1 or Lights.KEY_PUZZLE_2
+    :param size: grid side length
+    :param shared_instructions: all the instructions from the input file, as
+    shared by _solve_lights_pool()
+    :param rows: first row number and number of rows of the band
+    :return: number of lit lights for puzzle 1, total brightness for puzzle 2,
+    in the band
+    """
+
+    lights = Lights(puzzle, size, rows)
+    fields = len(Instruction._fields)
+
+    with attach(shared_instructions) as instructions:
+        for start in range(0, len(instructions), fields):
+            instruction_type, *borders = instructions[start: start + fields]
+            lights.process_instruction(
+                Instruction(Lights.TYPES[instruction_type], *borders))
+    return lights.result
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=6, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Lights in your grid are numbered from 0 to 999 in each direction; the lights
     at each corner are at 0,0, 0,999, 999,999, and 999,0. The instructions
@@ -170,22 +356,17 @@ def puzzle_01() -> None:
 
     After following the instructions, how many lights are lit?
 
-    :return: None; Answer should be 543903.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 543903.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        instructions = f.readlines()
-        lights = Lights(Lights.KEY_PUZZLE_1)
-
-        for instruction in instructions:
-            lights.process_instruction(instruction)
-
-        print_puzzle_solution(lights.lit_lights_count)
+    return solve_lights(Lights.KEY_PUZZLE_1, input_path)
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=6, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     You just finish implementing your winning light pattern when you realize you
     mistranslated Santa's message from Ancient Nordic Elvish.
@@ -205,16 +386,10 @@ def puzzle_02() -> None:
     What is the total brightness of all lights combined after following Santa's
     instructions?
 
-    :return: None; Answer should be 14687245.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 14687245.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        instructions = f.readlines()
-        lights = Lights(Lights.KEY_PUZZLE_2)
-
-        for instruction in instructions:
-            lights.process_instruction(instruction)
-
-        print_puzzle_solution(lights.total_brightness)
+    return solve_lights(Lights.KEY_PUZZLE_2, input_path)
 
 ################################################################################
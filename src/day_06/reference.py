@@ -0,0 +1,214 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Reference engine of day 6, the implementation the puzzles started with, kept
+as it is. Faster engines are checked against it by the differential harness
+(benchmarks/differential.py).
+"""
+
+from os.path import dirname, join, realpath
+from typing import Dict, Iterable
+from itertools import chain
+from re import compile, findall
+from src.utils.inputs import stream_lines
+
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
+
+
+################################################################################
+
+class Lights(object):
+    TURN_ON = "turn on"
+    TURN_OFF = "turn off"
+    TOGGLE = "toggle"
+    DIMENSIONS_DENOMINATOR = ","
+    SIZE = 1000
+    KEY_LIGHT_OFF = "LIGHT_OFF"
+    KEY_IS_LIT = "IS_LIT"
+
+    KEY_TOP = "TOP"
+    KEY_BOTTOM = "BOTTOM"
+    KEY_LEFT = "LEFT"
+    KEY_RIGHT = "RIGHT"
+
+    KEY_PUZZLE_1 = "PUZZLE_1"
+    KEY_PUZZLE_2 = "PUZZLE_2"
+
+    # initial values for every light (KEY_LIGHT_OFF) and set of functions which
+    # are applied to a single light and define instructions turn on, turn off
+    # and toggle and a definition of a lit light for both puzzles
+    LIGHTS = {
+        KEY_PUZZLE_1: {
+            KEY_LIGHT_OFF: False,
+            TURN_ON: lambda light: True,
+            TURN_OFF: lambda light: False,
+            TOGGLE: lambda light: not light,
+            KEY_IS_LIT: lambda light: light is True
+        },
+        KEY_PUZZLE_2: {
+            KEY_LIGHT_OFF: 0,
+            TURN_ON: lambda light: light + 1,
+            TURN_OFF: lambda light: light - 1 if light >= 1 else 0,
+            TOGGLE: lambda light: light + 2
+        }
+    }
+
+################################################################################
+
+    def __init__(self, puzzle, size: int = SIZE):
+        """
+        Initialize the grid of lights. Store the information about which puzzle
+        we are solving.
+
+        :param puzzle: KEY_PUZZLE_1 or KEY_PUZZLE_2
+        :param size: grid side length
+        """
+
+        self._puzzle = puzzle
+        self._size = size
+
+        # breaks if initialized like LIGHTS = [[LIGHT_OFF] * SIZE] * SIZE
+        # probably because of shallow copies of rows
+        self._lights = []
+        for _ in range(self._size):
+            row = []
+            for __ in range(self._size):
+                row.append(self.LIGHTS[self._puzzle][self.KEY_LIGHT_OFF])
+            self._lights.append(row)
+
+################################################################################
+
+    def process_instruction(self, instruction: str) -> None:
+        """
+        Applies the instruction to the grid of lights.
+
+        :param instruction: one instruction from the input file
+        """
+
+        instruction_type = self._get_instruction_type(instruction)
+        function = self.LIGHTS[self._puzzle][instruction_type]
+        borders = self._get_instruction_borders(instruction)
+        top = borders[self.KEY_TOP]
+        bottom = borders[self.KEY_BOTTOM]
+        left = borders[self.KEY_LEFT]
+        right = borders[self.KEY_RIGHT]
+
+        for row_number in range(top, bottom + 1):
+            # get the segment of the row which is affected by the instruction
+            row_segment = self._lights[row_number][left: right + 1]
+            # apply the instruction to the row segment
+            row_segment_after = list(map(function, row_segment))
+            self._lights[row_number][left: right + 1] = row_segment_after
+
+################################################################################
+
+    @property
+    def lit_lights_count(self) -> int:
+        """
+        :return: number of lit lights in the grid
+        """
+
+        return len(tuple(filter(
+            self.LIGHTS[self._puzzle][self.KEY_IS_LIT],
+            chain.from_iterable(self._lights))))
+
+################################################################################
+
+    @property
+    def total_brightness(self) -> int:
+        """
+        :return: total brightness of lights in the grid
+        """
+
+        return sum(chain.from_iterable(self._lights))
+
+################################################################################
+
+    def _get_instruction_type(self, instruction: str) -> str:
+        """
+        :param instruction: one instruction from the input file
+        :return: either "turn on", "turn off" or "toggle"
+        """
+
+        return findall(compile("{}|{}|{}".format(
+            self.TURN_ON, self.TURN_OFF, self.TOGGLE)), instruction)[0]
+
+################################################################################
+
+    def _get_instruction_borders(self, instruction: str) -> Dict[str, int]:
+        """
+        :param instruction: one instruction from the input file
+        :return: top, bottom, left and right row/column numbers that surround
+        the lights from the instruction
+        """
+
+        pattern = compile(r"\d+{}\d+".format(self.DIMENSIONS_DENOMINATOR))
+        borders = tuple(map(
+            lambda corner: [int(value) for value in corner.split(",")],
+            findall(pattern, instruction)))
+        return {
+            self.KEY_TOP: borders[0][1],
+            self.KEY_BOTTOM: borders[1][1],
+            self.KEY_LEFT: borders[0][0],
+            self.KEY_RIGHT: borders[1][0]
+        }
+
+################################################################################
+
+    @classmethod
+    def grid_size(cls, instructions: Iterable[str]) -> int:
+        """
+        :param instructions: all the instructions from the input file
+        :return: grid side length; the usual 1000 unless the instructions
+        reach beyond it (synthetic inputs)
+        """
+
+        pattern = compile(r"\d+")
+        return max(chain((cls.SIZE - 1, ), (
+            int(value) for instruction in instructions
+            for value in findall(pattern, instruction)))) + 1
+
+
+################################################################################
+
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
+    """
+    Puzzle 1 as solved by the reference engine.
+
+    :param input_path: puzzle input file path
+    :return: puzzle solution
+    """
+
+    # the instructions are streamed twice; first for the grid size, then for
+    # the lights
+    lights = Lights(Lights.KEY_PUZZLE_1,
+                    Lights.grid_size(stream_lines(input_path)))
+
+    for instruction in stream_lines(input_path):
+        lights.process_instruction(instruction)
+
+    return lights.lit_lights_count
+
+
+################################################################################
+
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
+    """
+    Puzzle 2 as solved by the reference engine.
+
+    :param input_path: puzzle input file path
+    :return: puzzle solution
+    """
+
+    # the instructions are streamed twice; first for the grid size, then for
+    # the lights
+    lights = Lights(Lights.KEY_PUZZLE_2,
+                    Lights.grid_size(stream_lines(input_path)))
+
+    for instruction in stream_lines(input_path):
+        lights.process_instruction(instruction)
+
+    return lights.total_brightness
+
+################################################################################
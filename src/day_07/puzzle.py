@@ -9,9 +9,26 @@ gates! Unfortunately, little Bobby is a little under the recommended age range,
 and he needs help assembling the circuit.
 """
 
-from typing import Union, Any
-from re import compile, findall
-from src.utils.utils import print_puzzle_solution
+from os.path import dirname, join, realpath
+from typing import NamedTuple, TextIO, Tuple, Union
+from re import compile
+from src.utils.inputs import load_input
+from src.utils.registry import solution
+
+
+################################################################################
+
+class Instruction(NamedTuple):
+    """
+    One instruction from the input file.
+    """
+
+    # None if a direct signal is provided to a wire or a wire is redirected to
+    # the result wire
+    operator: Union[str, None]
+    # signal values and wire names
+    operands: Tuple[Union[int, str], ...]
+    result_wire: str
 
 
 ################################################################################
@@ -24,6 +41,8 @@ class Assembly(object):
     RSHIFT = "RSHIFT"
     NOT = "NOT"
     DENOMINATOR = "->"
+    OPERATOR_PATTERN = compile("{}|{}|{}|{}|{}".format(
+        AND, OR, LSHIFT, RSHIFT, NOT))
 
     # functions to evaluate the instructions
     FUNCTIONS = {
@@ -35,17 +54,20 @@ class Assembly(object):
         None: lambda operands: operands[0]
     }
 
-    INPUT_FILE_PATH = "src/day_07/input.txt"
+    INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
     GOAL_WIRE = "a"
     OVERRIDDEN_WIRE = "b"
 
 ################################################################################
 
-    def __init__(self):
+    def __init__(self, input_path: str = INPUT_FILE_PATH):
         """
         Load instructions and initialize the wires dictionary.
+
+        :param input_path: puzzle input file path
         """
 
+        self._input_path = input_path
         self._instructions = None
         self._wires = None
         self._reset_wires()
@@ -56,14 +78,25 @@ class Assembly(object):
         """
         Try to update the wires dictionary with each instruction. If successful,
         remove the instruction; eventually, all instructions are successfully
-        processed and none remains.
+        processed and none remains. Instructions whose operands never get a
+        signal raise ValueError instead of being retried forever.
         """
 
+        # instructions added back in a row; once every remaining one was added
+        # back without any wire getting a signal, none ever will
+        stalled = 0
+
         while len(self._instructions) > 0:
+            if stalled >= len(self._instructions):
+                raise ValueError("Wires {} never get a signal".format(
+                    ", ".join(sorted(set(
+                        instruction.result_wire
+                        for instruction in self._instructions)))))
+
             instruction = self._instructions.pop(0)
-            operator = self._get_operator(instruction)
+            operator = instruction.operator
             operands = self._get_operands(instruction)
-            result_wire = self._get_result_wire(instruction)
+            result_wire = instruction.result_wire
 
             try:
                 self._wires[result_wire] = self.FUNCTIONS[operator](operands)
@@ -71,10 +104,14 @@ class Assembly(object):
                     # the wires dict was not updated; add the instruction back
                     # so it is eventually processed again
                     self._instructions.append(instruction)
+                    stalled += 1
+                else:
+                    stalled = 0
             except TypeError:
                 # the wires dict was not updated; add the instruction back so it
                 # is eventually processed again
                 self._instructions.append(instruction)
+                stalled += 1
 
 ################################################################################
 
@@ -92,7 +129,7 @@ class Assembly(object):
         self._wires[self.OVERRIDDEN_WIRE] = goal_signal
         self._instructions = list(filter(
             lambda instruction:
-            self._get_result_wire(instruction) != self.OVERRIDDEN_WIRE,
+            instruction.result_wire != self.OVERRIDDEN_WIRE,
             self._instructions))
 
 ################################################################################
@@ -112,57 +149,65 @@ class Assembly(object):
         Load instructions and initialize the wires dictionary.
         """
 
-        with open(self.INPUT_FILE_PATH, "r") as f:
-            self._instructions = f.readlines()
-            self._wires = {}
-            [self._wires.update({self._get_result_wire(instruction): None})
-             for instruction in self._instructions]
+        # the cached instructions are shared; processing removes instructions
+        # from this copy
+        self._instructions = list(load_input(self._input_path,
+                                             self._parse_instructions))
+        self._wires = {}
+        [self._wires.update({instruction.result_wire: None})
+         for instruction in self._instructions]
 
 ################################################################################
 
-    def _get_operator(self, instruction: str) -> Union[str, None]:
+    @classmethod
+    def _parse_instructions(cls, f: TextIO) -> Tuple[Instruction, ...]:
         """
-        :param instruction: one instruction from the input file
-        :return: operator from the instruction, or None if a direct signal is
-        provided to a wire or a wire is redirected to the result wire
+        :param f: opened input file
+        :return: all the instructions from the input file
         """
 
-        pattern = compile("{}|{}|{}|{}|{}".format(
-            self.AND, self.OR, self.LSHIFT, self.RSHIFT, self.NOT))
-        try:
-            return findall(pattern, instruction)[0]
-        except IndexError:
-            return None
+        return tuple(cls._parse_instruction(line) for line in f
+                     if len(line.strip()) > 0)
 
 ################################################################################
 
-    def _get_operands(self, instruction: str) -> tuple[Union[int, Any], ...]:
+    @classmethod
+    def _parse_instruction(cls, line: str) -> Instruction:
         """
-        :param instruction: one instruction from the input file
-        :return: operand(s) from the instruction
+        :param line: one instruction from the input file
+        :return: operator, operand(s) and result wire of the instruction
         """
 
-        left = instruction.split(self.DENOMINATOR)[0].strip()
-        operator = self._get_operator(instruction)
-        return tuple(int(operand.strip()) if operand.strip().isnumeric()
-                     else self._wires[operand.strip()]
-                     for operand in left.split(operator)
-                     if len(operand) > 0)
+        left, result_wire = line.split(cls.DENOMINATOR)
+        match = cls.OPERATOR_PATTERN.search(left)
+        operator = None if match is None else match.group()
+        return Instruction(
+            operator,
+            tuple(int(operand.strip()) if operand.strip().isnumeric()
+                  else operand.strip()
+                  for operand in left.strip().split(operator)
+                  if len(operand) > 0),
+            result_wire.strip())
 
 ################################################################################
 
-    def _get_result_wire(self, instruction: str) -> str:
+    def _get_operands(self, instruction: Instruction) \
+            -> Tuple[Union[int, None], ...]:
         """
-        :param instruction: one instruction from the input file
-        :return: result wire of the instruction
+        :param instruction: one parsed instruction from the input file
+        :return: signal values of the operand(s); None for wires which have no
+        signal yet
         """
 
-        return instruction.split(self.DENOMINATOR)[1].strip()
+        return tuple(operand if isinstance(operand, int)
+                     else self._wires[operand]
+                     for operand in instruction.operands)
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=7, puzzle=1)
+def puzzle_01(input_path: str = Assembly.INPUT_FILE_PATH) -> int:
     """
     Each wire has an identifier (some lowercase letters) and can carry a 16-bit
     signal (a number from 0 to 65535). A signal is provided to each wire by a
@@ -182,28 +227,31 @@ def puzzle_01() -> None:
     In little Bobby's kit's instructions booklet (provided as your puzzle
     input), what signal is ultimately provided to wire a?
 
-    :return: None; Answer should be 956.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 956.
     """
 
-    assembly = Assembly()
+    assembly = Assembly(input_path)
     assembly.process_instructions()
-    print_puzzle_solution(assembly.get_goal_wire_signal)
+    return assembly.get_goal_wire_signal
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=7, puzzle=2)
+def puzzle_02(input_path: str = Assembly.INPUT_FILE_PATH) -> int:
     """
     Now, take the signal you got on wire a, override wire b to that signal, and
     reset the other wires (including wire a). What new signal is ultimately
     provided to wire a?
 
-    :return: None; Answer should be 40149.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 40149.
     """
 
-    assembly = Assembly()
+    assembly = Assembly(input_path)
     assembly.override()
     assembly.process_instructions()
-    print_puzzle_solution(assembly.get_goal_wire_signal)
+    return assembly.get_goal_wire_signal
 
 ################################################################################
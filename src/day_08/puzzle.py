@@ -16,14 +16,18 @@ characters in the code representation of the string literal and the number of
 characters in the in-memory string itself.
 """
 
-from src.utils.utils import print_puzzle_solution
+from ast import literal_eval
+from os.path import dirname, join, realpath
+from src.utils.inputs import map_input, read_mapped_lines
+from src.utils.registry import solution
 
-INPUT_FILE_PATH = "src/day_08/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=8, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Santa's list is a file that contains many double-quoted string literals, one
     on each line. The only escape sequences used are \\ (which represents a
@@ -35,18 +39,22 @@ def puzzle_01() -> None:
     code for string literals minus the number of characters in memory for the
     values of the strings in total for the entire file?
 
-    :return: None; Answer should be 1350.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 1350.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        print_puzzle_solution(sum([len(line.strip()) - len(eval(line.strip()))
-                                   for line in lines]))
+    with map_input(input_path) as contents:
+        # the literals are ASCII; literal_eval only takes them as a string and
+        # never runs any code of the input
+        return sum(len(line.strip())
+                   - len(literal_eval(line.strip().decode("ascii")))
+                   for line in read_mapped_lines(contents))
 
 ################################################################################
 
 
-def puzzle_02() -> None:
+@solution(day=8, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Now, let's go the other way. In addition to finding the number of characters
     of code, you should now encode each code representation as a new string and
@@ -57,13 +65,13 @@ def puzzle_02() -> None:
     encoded strings minus the number of characters of code in each original
     string literal.
 
-    :return: None; Answer should be 2085.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 2085.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        print_puzzle_solution(sum([2 + line.strip().count('\\')
-                                   + line.strip().count('"')
-                                   for line in lines]))
+    with map_input(input_path) as contents:
+        return sum(2 + line.strip().count(b'\\')
+                   + line.strip().count(b'"')
+                   for line in read_mapped_lines(contents))
 
 ################################################################################
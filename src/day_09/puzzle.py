@@ -12,66 +12,84 @@ two (different) locations he wants, but he must visit each location exactly
 once.
 """
 
+from os.path import dirname, join, realpath
 from itertools import permutations
-from typing import Dict
-from src.utils.utils import print_puzzle_solution
+from typing import Dict, TextIO
+from src.utils.counters import counted
+from src.utils.inputs import load_input
+from src.utils.registry import solution
 
 LOCATIONS_DENOMINATOR = "to"
 DISTANCE_DENOMINATOR = "="
-INPUT_FILE_PATH = "src/day_09/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 
 
 ################################################################################
 
-def _load_distances() -> Dict[str, Dict[str, int]]:
+def _parse_distances(f: TextIO) -> Dict[str, Dict[str, int]]:
     """
     Loads distances from the puzzle input to a dictionary. In this dictionary,
     keys are locations and values are dictionaries where keys are neighbour
     locations and value the distance to this neighbour location.
 
-    :return:
+    :param f: opened input file
+    :return: distances dictionary
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        distances = {}
+    distances = {}
 
-        for line in lines:
-            path = line.strip().split(LOCATIONS_DENOMINATOR)
-            location1 = path[0].strip()
-            location2 = path[1].split(DISTANCE_DENOMINATOR)[0].strip()
-            distance = int(path[1].split(DISTANCE_DENOMINATOR)[1])
+    # the lines are streamed; only the distances are kept
+    for line in f:
+        path = line.strip().split(LOCATIONS_DENOMINATOR)
+        location1 = path[0].strip()
+        location2 = path[1].split(DISTANCE_DENOMINATOR)[0].strip()
+        distance = int(path[1].split(DISTANCE_DENOMINATOR)[1])
 
-            try:
-                distances[location1].update({location2: distance})
-            except KeyError:
-                distances[location1] = {location2: distance}
-            try:
-                distances[location2].update({location1: distance})
-            except KeyError:
-                distances[location2] = {location1: distance}
-        return distances
+        try:
+            distances[location1].update({location2: distance})
+        except KeyError:
+            distances[location1] = {location2: distance}
+        try:
+            distances[location2].update({location1: distance})
+        except KeyError:
+            distances[location2] = {location1: distance}
+    return distances
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+def _load_distances(input_path: str) -> Dict[str, Dict[str, int]]:
+    """
+    :param input_path: puzzle input file path
+    :return: distances dictionary, shared by both puzzles; must not be modified
+    """
+
+    return load_input(input_path, _parse_distances)
+
+
+################################################################################
+
+@solution(day=9, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     What is the shortest distance Santa can travel to visit each location
     exactly once?
 
-    :return: None; Answer should be 117.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 117.
     """
 
-    distances = _load_distances()
-    print_puzzle_solution(min([sum([distances[perm[i]][perm[i + 1]]
-                                    for i in range(len(perm) - 1)])
-                               for perm in permutations(distances.keys())]))
+    distances = _load_distances(input_path)
+    return min([sum([distances[perm[i]][perm[i + 1]]
+                     for i in range(len(perm) - 1)])
+                for perm in counted("permutations",
+                                    permutations(distances.keys()))])
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=9, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     The next year, just to show off, Santa decides to take the route with the
     longest distance instead.
@@ -81,12 +99,14 @@ def puzzle_02() -> None:
 
     What is the distance of the longest route?
 
-    :return: None; Answer should be 909.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 909.
     """
 
-    distances = _load_distances()
-    print_puzzle_solution(max([sum([distances[perm[i]][perm[i + 1]]
-                                    for i in range(len(perm) - 1)])
-                               for perm in permutations(distances.keys())]))
+    distances = _load_distances(input_path)
+    return max([sum([distances[perm[i]][perm[i + 1]]
+                     for i in range(len(perm) - 1)])
+                for perm in counted("permutations",
+                                    permutations(distances.keys()))])
 
 ################################################################################
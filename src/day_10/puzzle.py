@@ -12,7 +12,7 @@ next sequence.
 """
 
 from re import compile
-from src.utils.utils import print_puzzle_solution
+from src.utils.registry import solution
 
 PUZZLE_INPUT = "1113122113"
 
@@ -35,7 +35,8 @@ def _look_and_say(look: str) -> str:
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=10, puzzle=1)
+def puzzle_01() -> int:
     """
     Look-and-say sequences are generated iteratively, using the previous value
     as input for the next step. For each step, take the previous value, and
@@ -45,7 +46,7 @@ def puzzle_01() -> None:
     Starting with the digits in your puzzle input, apply this process 40 times.
     What is the length of the result?
 
-    :return: None; Answer should be 360154.
+    :return: puzzle solution; Answer should be 360154.
     """
 
     look = PUZZLE_INPUT
@@ -53,12 +54,13 @@ def puzzle_01() -> None:
     for _ in range(40):
         look = _look_and_say(look)
 
-    print_puzzle_solution(len(look))
+    return len(look)
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=10, puzzle=2)
+def puzzle_02() -> int:
     """
     Neat, right? You might also enjoy hearing John Conway talking about this
     sequence (that's Conway of Conway's Game of Life fame).
@@ -68,7 +70,7 @@ def puzzle_02() -> None:
     Now, starting again with the digits in your puzzle input, apply this process
     50 times. What is the length of the new result?
 
-    :return: None; Answer should be 5103798.
+    :return: puzzle solution; Answer should be 5103798.
     """
 
     look = PUZZLE_INPUT
@@ -76,6 +78,6 @@ def puzzle_02() -> None:
     for _ in range(50):
         look = _look_and_say(look)
 
-    print_puzzle_solution(len(look))
+    return len(look)
 
 ################################################################################
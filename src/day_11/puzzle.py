@@ -8,7 +8,7 @@ Santa's previous password expired, and he needs help choosing a new one.
 """
 
 from re import compile
-from src.utils.utils import print_puzzle_solution
+from src.utils.registry import solution
 
 CURRENT_PASSWORD = "vzbxkghb"
 
@@ -75,7 +75,8 @@ def _is_password_valid(password: str) -> bool:
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=11, puzzle=1)
+def puzzle_01() -> str:
     """
     To help Santa remember his new password after the old one expires, he has
     devised a method of coming up with a password based on the previous one.
@@ -86,7 +87,7 @@ def puzzle_01() -> None:
     Given Santa's current password (the puzzle input), what should his next
     password be?
 
-    :return: None; Answer should be vzbxxyzz.
+    :return: puzzle solution; Answer should be vzbxxyzz.
     """
 
     password = CURRENT_PASSWORD
@@ -94,16 +95,17 @@ def puzzle_01() -> None:
     while not _is_password_valid(password):
         password = _increment_password(password)
 
-    print_puzzle_solution(password)
+    return password
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=11, puzzle=2)
+def puzzle_02() -> str:
     """
     Santa's password expired again. What's the next one?
 
-    :return: None; Answer should be vzcaabcc.
+    :return: puzzle solution; Answer should be vzcaabcc.
     """
 
     password = CURRENT_PASSWORD
@@ -114,6 +116,6 @@ def puzzle_02() -> None:
     while not _is_password_valid(password):
         password = _increment_password(password)
 
-    print_puzzle_solution(password)
+    return password
 
 ################################################################################
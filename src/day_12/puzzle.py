@@ -9,13 +9,26 @@ Unfortunately, their accounting software uses a peculiar storage format. That's
 where you come in.
 """
 
+from os.path import dirname, join, realpath
 from re import compile
 from json import loads
-from typing import Dict, List
-from src.utils.utils import print_puzzle_solution
+from typing import Dict, List, TextIO, Union
+from src.utils.inputs import load_input, map_input
+from src.utils.registry import solution
 
 RED = "red"
-INPUT_FILE_PATH = "src/day_12/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
+
+
+################################################################################
+
+def _parse_document(f: TextIO) -> Union[Dict, List]:
+    """
+    :param f: opened input file
+    :return: JSON document from the input file
+    """
+
+    return loads(f.read())
 
 
 ################################################################################
@@ -52,25 +65,29 @@ def _object_sum(input_object: [Dict, List], total_sum: int = 0) -> int:
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=12, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     The Accounting-Elves have a JSON document which contains a variety of
     things: arrays, objects, numbers, and strings. Your first job is to simply
     find all of the numbers throughout the document and add them together.
 
-    :return: None; Answer should be 111754.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 111754.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        document = f.read()
-        pattern = compile(r'-*\d+')
-        numbers = map(lambda match: int(match), pattern.findall(document))
-        print_puzzle_solution(sum(numbers))
+    pattern = compile(rb'-*\d+')
+
+    # the numbers are found right in the mapped file, without decoding it
+    with map_input(input_path) as document:
+        return sum(map(lambda match: int(match.group()),
+                       pattern.finditer(document)))
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=12, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Uh oh - the Accounting-Elves have realized that they double-counted
     everything red.
@@ -78,11 +95,11 @@ def puzzle_02() -> None:
     Ignore any object (and all of its children) which has any property with the
     value "red". Do this only for objects ({...}), not arrays ([...]).
 
-    :return: None; Answer should be 65402.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 65402.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        document = loads(f.read())
-        print_puzzle_solution(_object_sum(document))
+    document = load_input(input_path, _parse_document)
+    return _object_sum(document)
 
 ################################################################################
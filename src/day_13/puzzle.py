@@ -9,10 +9,13 @@ everyone gets along! This year, you resolve, will be different. You're going to
 find the optimal seating arrangement and avoid all those awkward conversations.
 """
 
+from os.path import dirname, join, realpath
 from re import compile
-from typing import Tuple
+from typing import Dict, TextIO, Tuple
 from itertools import permutations
-from src.utils.utils import print_puzzle_solution
+from src.utils.counters import counted
+from src.utils.inputs import load_input
+from src.utils.registry import solution
 
 
 ################################################################################
@@ -24,36 +27,52 @@ class Happiness(object):
         GAIN: lambda value: value,
         LOSE: lambda value: -value
     }
-    INPUT_FILE_PATH = "src/day_13/input.txt"
+    # person, gain or lose, happiness value and neighbour; compiled once for
+    # all the lines
+    RULE_PATTERN = compile(
+        r"(\D+) would ({}|{}) (\d+) happiness units? by sitting next to "
+        r"(\D+)\.".format(GAIN, LOSE))
+    INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
     MYSELF = "myself"
 
 ################################################################################
 
-    def __init__(self):
+    def __init__(self, input_path: str = INPUT_FILE_PATH):
         """
         Initializes a dictionary with info about everyone seated at the table
         with their happiness values changes according to their neighbour.
+
+        :param input_path: puzzle input file path
         """
 
-        self._happiness_rules = {}
+        # the cached rules are shared; add_myself() changes this copy
+        self._happiness_rules = {
+            person: dict(neighbours)
+            for person, neighbours in load_input(
+                input_path, self._parse_happiness_rules).items()
+        }
+
+################################################################################
+
+    @classmethod
+    def _parse_happiness_rules(cls, f: TextIO) -> Dict[str, Dict[str, int]]:
+        """
+        :param f: opened input file
+        :return: dict in format person: neighbour: happiness change
+        """
 
-        with open(self.INPUT_FILE_PATH, "r") as f:
-            lines = f.readlines()
+        happiness_rules = {}
 
-            for line in lines:
-                person_pattern = compile(r"(\D+) would")
-                neighbour_pattern = compile(r"by sitting next to (\D+).")
-                function_pattern = compile("{}|{}".format(self.GAIN, self.LOSE))
-                value_pattern = compile(r"\d+")
+        # the lines are streamed; only the rules are kept
+        for line in f:
+            person, function, value, neighbour = \
+                cls.RULE_PATTERN.search(line).groups()
+            happiness = cls.HAPPINESS_FUNCTIONS[function](int(value))
 
-                person = person_pattern.findall(line)[0]
-                neighbour = neighbour_pattern.findall(line)[0]
-                function = function_pattern.findall(line)[0]
-                value = int(value_pattern.findall(line)[0])
-                happiness = self.HAPPINESS_FUNCTIONS[function](value)
+            happiness_rules.setdefault(person, {})
+            happiness_rules[person][neighbour] = happiness
 
-                self._happiness_rules.setdefault(person, {})
-                self._happiness_rules[person][neighbour] = happiness
+        return happiness_rules
 
 ################################################################################
 
@@ -96,7 +115,8 @@ class Happiness(object):
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=13, puzzle=1)
+def puzzle_01(input_path: str = Happiness.INPUT_FILE_PATH) -> int:
     """
     You start by writing up a list of everyone invited and the amount their
     happiness would increase or decrease if they were to find themselves sitting
@@ -107,18 +127,20 @@ def puzzle_01() -> None:
     What is the total change in happiness for the optimal seating arrangement of
     the actual guest list?
 
-    :return: None; Answer should be 709.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 709.
     """
 
-    happiness = Happiness()
-    print_puzzle_solution(max(map(
+    happiness = Happiness(input_path)
+    return max(map(
         lambda seating: happiness.get_seating_happiness(seating),
-        permutations(happiness.family))))
+        counted("permutations", permutations(happiness.family))))
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=13, puzzle=2)
+def puzzle_02(input_path: str = Happiness.INPUT_FILE_PATH) -> int:
     """
     In all the commotion, you realize that you forgot to seat yourself. At this
     point, you're pretty apathetic toward the whole thing, and your happiness
@@ -131,13 +153,14 @@ def puzzle_02() -> None:
     What is the total change in happiness for the optimal seating arrangement
     that actually includes yourself?
 
-    :return: None; Answer should be 668.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 668.
     """
 
-    happiness = Happiness()
+    happiness = Happiness(input_path)
     happiness.add_myself()
-    print_puzzle_solution(max(map(
+    return max(map(
         lambda seating: happiness.get_seating_happiness(seating),
-        permutations(happiness.family))))
+        counted("permutations", permutations(happiness.family))))
 
 ################################################################################
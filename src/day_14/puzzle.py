@@ -9,56 +9,75 @@ rest occasionally to recover their energy. Santa would like to know which of his
 reindeer is fastest, and so he has them race.
 """
 
+from os.path import dirname, join, realpath
 from re import compile
-from typing import Tuple
+from typing import TextIO, Tuple
 from src.day_14.reindeer import Reindeer
-from src.utils.utils import print_puzzle_solution
+from src.utils.inputs import load_input
+from src.utils.registry import solution
 
 RACE_DURATION = 2503
-INPUT_FILE_PATH = "src/day_14/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 
 
 ################################################################################
 
-def _load_reindeer_stats() -> Tuple[Reindeer]:
+def _parse_reindeer_stats(f: TextIO) \
+        -> Tuple[Tuple[str, int, int, int], ...]:
+    """
+    :param f: opened input file
+    :return: name, speed, fly time and rest time of every reindeer
+    """
+
+    pattern = compile(r'\d+')
+    # the lines are streamed; only the stats are kept
+    return tuple((line.split(" ")[0],
+                  int(pattern.findall(line)[0]),
+                  int(pattern.findall(line)[1]),
+                  int(pattern.findall(line)[2]))
+                 for line in f)
+
+
+################################################################################
+
+def _load_reindeer_stats(input_path: str) -> Tuple[Reindeer]:
     """
     Load reindeer stats from the input file. Store it in a tuple of Reindeer
-    objects.
+    objects; new objects are created every time since the race changes them.
 
+    :param input_path: puzzle input file path
     :return: reindeer stats
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        pattern = compile(r'\d+')
-        lines = f.readlines()
-        return tuple(Reindeer(line.split(" ")[0],
-                              int(pattern.findall(line)[0]),
-                              int(pattern.findall(line)[1]),
-                              int(pattern.findall(line)[2]))
-                     for line in lines)
+    return tuple(Reindeer(*stats)
+                 for stats in load_input(input_path,
+                                         _parse_reindeer_stats))
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=14, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Given the descriptions of each reindeer (in the puzzle input), after exactly
     2503 seconds, what distance has the winning reindeer traveled?
 
-    :return: None; Answer should be 2640.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 2640.
     """
 
-    reindeer = _load_reindeer_stats()
+    reindeer = _load_reindeer_stats(input_path)
     [a_reindeer.start() for a_reindeer in reindeer]
     [a_reindeer.advance()
      for _ in range(RACE_DURATION)
      for a_reindeer in reindeer]
-    print_puzzle_solution(max([a_reindeer.distance for a_reindeer in reindeer]))
+    return max([a_reindeer.distance for a_reindeer in reindeer])
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=14, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Seeing how reindeer move in bursts, Santa decides he's not pleased with the
     old scoring system.
@@ -71,10 +90,11 @@ def puzzle_02() -> None:
     Again given the descriptions of each reindeer (in the puzzle input), after
     exactly 2503 seconds, how many points does the winning reindeer have?
 
-    :return: None; Answer should be 1102.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 1102.
     """
 
-    reindeer = _load_reindeer_stats()
+    reindeer = _load_reindeer_stats(input_path)
     [a_reindeer.start() for a_reindeer in reindeer]
 
     for _ in range(RACE_DURATION):
@@ -85,6 +105,6 @@ def puzzle_02() -> None:
         [a_reindeer.award_point() for a_reindeer in reindeer
          if a_reindeer.distance == max_distance]
 
-    print_puzzle_solution(max([a_reindeer.points for a_reindeer in reindeer]))
+    return max([a_reindeer.points for a_reindeer in reindeer])
 
 ################################################################################
@@ -9,12 +9,13 @@ All you have to do is find the right balance of ingredients.
 """
 
 from src.day_15.recipe import Recipe
-from src.utils.utils import print_puzzle_solution
+from src.utils.registry import solution
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=15, puzzle=1)
+def puzzle_01(input_path: str = Recipe.INPUT_FILE_PATH) -> int:
     """
     Your recipe leaves room for exactly 100 teaspoons of ingredients. You make a
     list of the remaining ingredients you could use to finish the recipe (the
@@ -35,17 +36,17 @@ def puzzle_01() -> None:
     Given the ingredients in your kitchen and their properties, what is the
     total score of the highest-scoring cookie you can make?
 
-    :return: None; Answer should be 222870.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 222870.
     """
 
-    recipe = Recipe()
-    print_puzzle_solution(max(recipe.score(values)
-                              for values in recipe.teaspoons))
+    return Recipe(input_path).best_score()
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=15, puzzle=2)
+def puzzle_02(input_path: str = Recipe.INPUT_FILE_PATH) -> int:
     """
     Your cookie recipe becomes wildly popular! Someone asks if you can make
     another recipe that has exactly 500 calories per cookie (so they can use it
@@ -56,12 +57,10 @@ def puzzle_02() -> None:
     total score of the highest-scoring cookie you can make with a calorie total
     of 500?
 
-    :return: None; Answer should be 117936.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 117936.
     """
 
-    recipe = Recipe()
-    print_puzzle_solution(max(recipe.score(values)
-                              for values in recipe.teaspoons
-                              if recipe.is_500_calories(values)))
+    return Recipe(input_path).best_score(exact_calories=True)
 
 ################################################################################
@@ -1,16 +1,41 @@
 __author__ = "Jakub Franěk"
 __email__ = "tofugangsw@gmail.com"
 
-from itertools import product
+from functools import partial
+from itertools import chain, combinations
+from os.path import dirname, join, realpath
 from re import compile
-from math import prod
-from typing import Dict, Tuple
+from math import comb, prod
+from typing import Iterator, NamedTuple, TextIO, Tuple, Union
+from src.utils.backends import MULTIPROCESSING, NUMPY, select_backend, \
+    worker_pool
+from src.utils.inputs import load_input
+
+# smallest numbers of recipes the auto backend scores with NumPy and with the
+# worker pool
+NUMPY_SIZE = 1000
+POOL_SIZE = 100000
+
+
+################################################################################
+
+class Ingredient(NamedTuple):
+    """
+    One ingredient from the input file with its properties.
+    """
+
+    name: str
+    capacity: int
+    durability: int
+    flavor: int
+    texture: int
+    calories: int
 
 
 ################################################################################
 
 class Recipe(object):
-    INPUT_FILE_PATH = "src/day_15/input.txt"
+    INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
     CAPACITY_KEY = "capacity"
     DURABILITY_KEY = "durability"
     FLAVOR_KEY = "flavor"
@@ -21,61 +46,105 @@ class Recipe(object):
                      FLAVOR_KEY,
                      TEXTURE_KEY,
                      CALORIES_KEY)
+    # ingredient name and all its properties; compiled once for all the lines
+    INGREDIENT_PATTERN = compile(r"(.+): {}".format(", ".join(
+        r"{} (-?\d+)".format(key) for key in PROPERTY_KEYS)))
     CALORIES = 500
     TEASPOONS = 100
 
 ################################################################################
 
-    def __init__(self):
+    def __init__(self, input_path: str = INPUT_FILE_PATH):
         """
         Initialize dict of ingredients from the input file.
+
+        :param input_path: puzzle input file path
         """
 
-        with open(self.INPUT_FILE_PATH, "r") as f:
-            self._ingredients = {
-                compile(r"(.+):").findall(line)[0]: {
-                    key: self._get_property(key, line)
-                    for key in self.PROPERTY_KEYS
-                }
-                for line in f.readlines()
-            }
+        self._input_path = input_path
+        self._ingredients = load_input(input_path, self._parse_ingredients)
+        # property values of all the ingredients, one tuple per property in
+        # the order of names; the score sums them up for every combination
+        self._properties = tuple(
+            tuple(getattr(ingredient, key) for ingredient in self._ingredients)
+            for key in self.PROPERTY_KEYS)
 
 ################################################################################
 
-    @staticmethod
-    def _get_property(name: str, line: str) -> int:
+    @classmethod
+    def _parse_ingredients(cls, f: TextIO) -> Tuple[Ingredient, ...]:
         """
-        :param name: property name in the line of ingredient
-        :param line: line of ingredient from the input file
-        :return: ingredient property value
+        :param f: opened input file
+        :return: all the ingredients from the input file
         """
 
-        return int(compile(r"{} (-*\d+)".format(name)).findall(line)[0])
+        ingredients = []
+
+        for line in f:
+            match = cls.INGREDIENT_PATTERN.search(line)
+            if match is not None:
+                name, *properties = match.groups()
+                ingredients.append(Ingredient(
+                    name, *(int(value) for value in properties)))
+
+        return tuple(ingredients)
 
 ################################################################################
 
-    def score(self, teaspoons: Dict[str, int]):
+    def score(self, teaspoons: Tuple[int, ...]):
         """
-        :param teaspoons: dict in format ingredient name: number of teaspoons
+        :param teaspoons: number of teaspoons of every ingredient, in the order
+        of names
         :return: recipe score
         """
 
         # self.PROPERTY_KEYS is used without CALORIES property
-        return prod(max(sum(self._ingredients[name][key] * teaspoons[name]
-                            for name in self.names), 0)
-                    for key in self.PROPERTY_KEYS[:-1])
+        return prod(max(sum(value * amount
+                            for value, amount in zip(values, teaspoons)),
+                        0)
+                    for values in self._properties[:-1])
 
 ################################################################################
 
-    def is_500_calories(self, teaspoons: Dict[str, int]):
+    def is_500_calories(self, teaspoons: Tuple[int, ...]):
         """
-        :param teaspoons: dict in format ingredient name: number of teaspoons
+        :param teaspoons: number of teaspoons of every ingredient, in the order
+        of names
         :return: True if the recipe is exactly 500 calories, False otherwise
         """
 
         return sum(
-            teaspoons[name] * self._ingredients[name][self.CALORIES_KEY]
-            for name in self.names) == self.CALORIES
+            amount * calories
+            for calories, amount in zip(self._properties[-1], teaspoons)) \
+            == self.CALORIES
+
+################################################################################
+
+    def best_score(self, exact_calories: bool = False) -> int:
+        """
+        Scores all the recipes with the engine of the current backend.
+
+        :param exact_calories: if True, only the recipes of exactly 500
+        calories are scored
+        :return: the highest recipe score
+        """
+
+        # recipes made of every number of teaspoons up to all of them
+        recipes = comb(self.TEASPOONS + len(self.names) - 1,
+                       len(self.names) - 1)
+        backend = select_backend(recipes, NUMPY_SIZE, POOL_SIZE)
+
+        if backend == NUMPY:
+            return self._best_score_numpy(exact_calories)
+        elif backend == MULTIPROCESSING:
+            return self._best_score_pool(exact_calories)
+        else:
+            best = max((self.score(teaspoons) for teaspoons in self.teaspoons
+                        if not exact_calories
+                        or self.is_500_calories(teaspoons)), default=None)
+            if best is None:
+                raise ValueError("No recipe to score")
+            return best
 
 ################################################################################
 
@@ -85,23 +154,129 @@ class Recipe(object):
         :return: list of ingredients names
         """
 
-        return tuple(self._ingredients.keys())
+        return tuple(ingredient.name for ingredient in self._ingredients)
 
 ################################################################################
 
     @property
-    def teaspoons(self):
+    def teaspoons(self) -> Iterator[Tuple[int, ...]]:
         """
         Generator function that provides all possible combinations of number of
         teaspoons of all possible ingredients.
 
-        :return: dict in format ingredient name: number of teaspoons
+        :return: number of teaspoons of every ingredient, in the order of names
+        """
+
+        return self._compositions(self.TEASPOONS, len(self.names))
+
+################################################################################
+
+    def _compositions(self, teaspoons: int, ingredients: int) \
+            -> Iterator[Tuple[int, ...]]:
+        """
+        Only the combinations that add up to the number of teaspoons are made,
+        one at a time; no ingredient takes up every teaspoon.
+
+        :param teaspoons: number of teaspoons left to split
+        :param ingredients: number of ingredients left
+        :return: number of teaspoons of every ingredient left
         """
 
-        for values in product(range(self.TEASPOONS), repeat=len(self.names)):
-            if sum(values) == self.TEASPOONS:
-                yield {
-                    self.names[i]: values[i] for i in range(len(self.names))
-                }
+        if ingredients == 1:
+            if teaspoons < self.TEASPOONS:
+                yield (teaspoons, )
+        else:
+            for amount in range(min(teaspoons, self.TEASPOONS - 1) + 1):
+                for rest in self._compositions(teaspoons - amount,
+                                               ingredients - 1):
+                    yield (amount, ) + rest
+
+################################################################################
+
+    def _best_score_numpy(self, exact_calories: bool) -> int:
+        """
+        NumPy engine; all the recipes are scored at once. The recipes come from
+        the positions of the bars between the teaspoons of the ingredients
+        (stars and bars); the ones where an ingredient takes up every teaspoon
+        are left out, as in the other engines.
+
+        :param exact_calories: if True, only the recipes of exactly 500
+        calories are scored
+        :return: the highest recipe score
+        """
+
+        # imported here; NumPy is only needed for its backend
+        import numpy
+
+        ingredients = len(self.names)
+        places = self.TEASPOONS + ingredients - 1
+        recipes = comb(places, ingredients - 1)
+        bars = numpy.fromiter(
+            chain.from_iterable(combinations(range(places), ingredients - 1)),
+            dtype=numpy.int64, count=recipes * (ingredients - 1)).reshape(
+            recipes, ingredients - 1)
+        teaspoons = numpy.diff(numpy.hstack((
+            numpy.full((recipes, 1), -1), bars,
+            numpy.full((recipes, 1), places))), axis=1) - 1
+        teaspoons = teaspoons[teaspoons.max(axis=1) < self.TEASPOONS]
+
+        # property totals of every recipe; one column per property
+        totals = teaspoons @ numpy.array(self._properties,
+                                         dtype=numpy.int64).T
+        if exact_calories:
+            totals = totals[totals[:, -1] == self.CALORIES]
+        # self.PROPERTY_KEYS is used without CALORIES property
+        scores = numpy.clip(totals[:, :-1], 0, None).prod(axis=1)
+        if scores.size == 0:
+            raise ValueError("No recipe to score")
+        return int(scores.max())
+
+################################################################################
+
+    def _best_score_pool(self, exact_calories: bool) -> int:
+        """
+        Worker pool engine; the recipes are split by the teaspoons of the first
+        ingredient and every worker scores the recipes of one amount.
+
+        :param exact_calories: if True, only the recipes of exactly 500
+        calories are scored
+        :return: the highest recipe score
+        """
+
+        # a single ingredient would take up every teaspoon
+        amounts = range(self.TEASPOONS) if len(self.names) > 1 else ()
+
+        with worker_pool() as pool_map:
+            scores = tuple(score for score in pool_map(
+                partial(_best_score_of_amount, self._input_path,
+                        exact_calories), amounts)
+                if score is not None)
+
+        if len(scores) == 0:
+            raise ValueError("No recipe to score")
+        return max(scores)
+
+
+################################################################################
+
+def _best_score_of_amount(input_path: str,
+                          exact_calories: bool,
+                          amount: int) -> Union[int, None]:
+    """
+    :param input_path: puzzle input file path
+    :param exact_calories: if True, only the recipes of exactly 500 calories
+    are scored
+    :param amount: teaspoons of the first ingredient
+    :return: the highest score of the recipes with the amount of the first
+    ingredient; None if there is no such recipe
+    """
+
+    # parsed once per worker; the input cache keeps it
+    recipe = Recipe(input_path)
+    return max((recipe.score(teaspoons) for teaspoons in (
+        (amount, ) + rest for rest in recipe._compositions(
+            recipe.TEASPOONS - amount, len(recipe.names) - 1))
+        if not exact_calories or recipe.is_500_calories(teaspoons)),
+        default=None)
 
 ################################################################################
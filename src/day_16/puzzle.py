@@ -9,8 +9,11 @@ you card. However, there's a small problem: she signed it "From, Aunt Sue".
 You have 500 Aunts named "Sue".
 """
 
+from os.path import dirname, join, realpath
 from re import compile
-from src.utils.utils import print_puzzle_solution
+from typing import Iterable, Tuple
+from src.utils.inputs import stream_lines
+from src.utils.registry import solution
 
 MFCSAM_OUTPUT = {
     "children": 3,
@@ -36,24 +39,39 @@ COMPOUNDS = {
     "cars": lambda value: MFCSAM_OUTPUT["cars"] == value,
     "perfumes": lambda value: MFCSAM_OUTPUT["perfumes"] == value
 }
-INPUT_FILE_PATH = "src/day_16/input.txt"
+# compound name and count; compiled once for all the lines
+COMPOUND_PATTERN = compile(r"([a-z]+): (\d+)")
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 
 
 ################################################################################
 
-def get_compound_count(compound: str, line: str) -> int:
+def parse_compounds(line: str) -> Tuple[Tuple[str, int], ...]:
     """
-    :param compound: compound name
     :param line: one aunt line from the input
-    :return: compound count
+    :return: the compounds remembered about the aunt and their counts
     """
 
-    return int(compile(r"{}: (\d+)".format(compound)).findall(line)[0])
+    return tuple((compound, int(count))
+                 for compound, count in COMPOUND_PATTERN.findall(line))
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+def stream_aunts(input_path: str) -> Iterable[Tuple[Tuple[str, int], ...]]:
+    """
+    :param input_path: puzzle input file path
+    :return: remembered compounds of every aunt, parsed as the input file lines
+    are streamed
+    """
+
+    return map(parse_compounds, stream_lines(input_path))
+
+
+################################################################################
+
+@solution(day=16, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     So, to avoid sending the card to the wrong person, you need to figure out
     which Aunt Sue (which you conveniently number 1 to 500, for sanity) gave you
@@ -95,22 +113,21 @@ def puzzle_01() -> None:
 
     What is the number of the Sue that got you the gift?
 
-    :return: None; Answer should be 40.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 40.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        hits = tuple(len(tuple(filter(
-            lambda compound:
-            compound in line
-            and MFCSAM_OUTPUT[compound] == get_compound_count(compound, line),
-            COMPOUNDS))) for line in lines)
-        print_puzzle_solution(hits.index(max(hits)) + 1)
+    hits = (sum(1 for compound, count in compounds
+                if MFCSAM_OUTPUT.get(compound) == count)
+            for compounds in stream_aunts(input_path))
+    # the first Sue with the most hits; only the best one so far is kept
+    return max(enumerate(hits, start=1), key=lambda item: item[1])[0]
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=16, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     As you're about to send the thank you note, something in the MFCSAM's
     instructions catches your eye. Apparently, it has an outdated
@@ -125,16 +142,14 @@ def puzzle_02() -> None:
 
     What is the number of the real Aunt Sue?
 
-    :return: None; Answer should be 241.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 241.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        hits = tuple(len(tuple(filter(
-            lambda compound:
-            compound in line
-            and COMPOUNDS[compound](get_compound_count(compound, line)),
-            COMPOUNDS))) for line in lines)
-        print_puzzle_solution(hits.index(max(hits)) + 1)
+    hits = (sum(1 for compound, count in compounds
+                if compound in COMPOUNDS and COMPOUNDS[compound](count))
+            for compounds in stream_aunts(input_path))
+    # the first Sue with the most hits; only the best one so far is kept
+    return max(enumerate(hits, start=1), key=lambda item: item[1])[0]
 
 ################################################################################
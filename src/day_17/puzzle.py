@@ -9,46 +9,62 @@ into your refrigerator, you'll need to move it into smaller containers. You take
 an inventory of the capacities of the available containers.
 """
 
-from typing import Tuple
+from os.path import dirname, join, realpath
+from typing import TextIO, Tuple
 from itertools import combinations
-from src.utils.utils import print_puzzle_solution
+from src.utils.inputs import load_input
+from src.utils.registry import solution
 
 EGGNOG_LITRES = 150
-INPUT_FILE_PATH = "src/day_17/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 
 
 ################################################################################
 
-def load_containers() -> Tuple[int]:
+def _parse_containers(f: TextIO) -> Tuple[int, ...]:
     """
+    :param f: opened input file
     :return: list of all containers capacities
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        return tuple([int(line.strip()) for line in f.readlines()])
+    return tuple([int(line.strip()) for line in f.readlines()])
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+def load_containers(input_path: str) -> Tuple[int, ...]:
+    """
+    :param input_path: puzzle input file path
+    :return: list of all containers capacities
+    """
+
+    return load_input(input_path, _parse_containers)
+
+
+################################################################################
+
+@solution(day=17, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Filling all containers entirely, how many different combinations of
     containers can exactly fit all 150 liters of eggnog?
 
-    :return: None; Answer should be 1304.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 1304.
     """
 
-    containers = load_containers()
-    print_puzzle_solution(len(tuple(filter(
-        lambda combination: sum(combination) == EGGNOG_LITRES,
-        [combination
-         for i in range(len(containers))
-         for combination in combinations(containers, i)]))))
+    containers = load_containers(input_path)
+    # combinations are counted one by one as they are made, none is kept
+    return sum(1
+               for i in range(len(containers))
+               for combination in combinations(containers, i)
+               if sum(combination) == EGGNOG_LITRES)
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=17, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     While playing with all the containers in the kitchen, another load of eggnog
     arrives! The shipping and receiving department is requesting as many
@@ -58,16 +74,22 @@ def puzzle_02() -> None:
     eggnog. How many different ways can you fill that number of containers and
     still hold exactly 150 litres?
 
-    :return: None; Answer should be 18.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 18.
     """
 
-    containers = load_containers()
-    combinations_lengths = tuple(map(
-        lambda combination: len(combination),
-        filter(lambda combination: sum(combination) == EGGNOG_LITRES,
-               [combination
-                for i in range(len(containers))
-                for combination in combinations(containers, i)])))
-    print_puzzle_solution(combinations_lengths.count(min(combinations_lengths)))
+    containers = load_containers(input_path)
+
+    # combinations are made from the smallest ones up, so the first number of
+    # containers with any fitting combination is the minimum
+    for i in range(len(containers)):
+        count = sum(1
+                    for combination in combinations(containers, i)
+                    if sum(combination) == EGGNOG_LITRES)
+        if count > 0:
+            return count
+
+    raise ValueError("No combination of containers holds {} litres".format(
+        EGGNOG_LITRES))
 
 ################################################################################
@@ -12,30 +12,61 @@ lighting configuration. With so few lights, he says, you'll have to resort to
 animation.
 """
 
-from src.utils.utils import print_puzzle_solution
+from array import array
+from contextlib import nullcontext
+from functools import partial
+from itertools import chain
+from math import ceil
+from os.path import dirname, join, realpath
+from typing import TextIO, Tuple
+from src.utils.backends import AUTO, MULTIPROCESSING, NUMPY, \
+    available_workers, requested_backend, select_backend, worker_pool
+from src.utils.inputs import load_input
+from src.utils.registry import solution
+from src.utils.shared import SharedArray, attach, share
 
 STEPS = 100
+# smallest animations (number of lights times steps) the auto backend runs
+# with NumPy and with the worker pool
+NUMPY_SIZE = 10000
+POOL_SIZE = 1000000
 
 
 ################################################################################
 
 class Lights(object):
     LIGHT_ON = "#"
-    INPUT_FILE_PATH = "src/day_18/input.txt"
+    INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 
 ################################################################################
 
-    def __init__(self, lights_are_stuck=False):
+    def __init__(self,
+                 lights_are_stuck=False,
+                 input_path: str = INPUT_FILE_PATH):
         """
         Creates a grid of lights from the input file. Stores the information
         whether the four corner lights are stuck on or not.
+
+        :param lights_are_stuck: True if the four corner lights are stuck on
+        :param input_path: puzzle input file path
         """
 
-        with open(self.INPUT_FILE_PATH, "r") as f:
-            self._lights = [[light == self.LIGHT_ON
-                             for light in line.strip()]
-                            for line in f.readlines()]
-            self._lights_are_stuck = lights_are_stuck
+        # the cached grid is shared; stuck lights are set in this copy
+        self._lights = [list(line) for line in load_input(
+            input_path, self._parse_lights)]
+        self._lights_are_stuck = lights_are_stuck
+
+################################################################################
+
+    @classmethod
+    def _parse_lights(cls, f: TextIO) -> Tuple[Tuple[bool, ...], ...]:
+        """
+        :param f: opened input file
+        :return: grid of lights; True for a light which is on
+        """
+
+        return tuple(tuple(light == cls.LIGHT_ON for light in line.strip())
+                     for line in f.readlines())
 
 ################################################################################
 
@@ -47,6 +78,32 @@ class Lights(object):
 
         return sum(line.count(True) for line in self._lights)
 
+################################################################################
+
+    def animate(self, steps: int) -> None:
+        """
+        Advances the grid by the number of steps with the engine of the
+        current backend. Where the auto backend would pick the pure-Python
+        engine, it runs the band engine of the worker pool in this process
+        instead; counting the neighbours row by row is much faster than light
+        by light.
+
+        :param steps: number of steps
+        """
+
+        backend = select_backend(len(self._lights) ** 2 * steps,
+                                 NUMPY_SIZE, POOL_SIZE)
+
+        if backend == NUMPY:
+            self._animate_numpy(steps)
+        elif backend == MULTIPROCESSING:
+            self._animate_pool(steps)
+        elif requested_backend() == AUTO:
+            self._animate_pool(steps, in_process=True)
+        else:
+            for _ in range(steps):
+                self.advance_grid()
+
 ################################################################################
 
     def advance_grid(self) -> None:
@@ -124,10 +181,132 @@ class Lights(object):
         self._lights[len(self._lights) - 1][0] = True
         self._lights[len(self._lights) - 1][len(self._lights) - 1] = True
 
+################################################################################
+
+    def _animate_numpy(self, steps: int) -> None:
+        """
+        NumPy engine; lit neighbours of all the lights are counted at once from
+        eight shifted views of the grid padded with lights which are off.
+
+        :param steps: number of steps
+        """
+
+        # imported here; NumPy is only needed for its backend
+        import numpy
+
+        if self._lights_are_stuck:
+            self._lights_stuck()
+
+        size = len(self._lights)
+        lights = numpy.array(self._lights, dtype=numpy.uint8)
+        padded = numpy.zeros((size + 2, size + 2), dtype=numpy.uint8)
+
+        for _ in range(steps):
+            padded[1:-1, 1:-1] = lights
+            neighbours = (padded[:-2, :-2] + padded[:-2, 1:-1]
+                          + padded[:-2, 2:] + padded[1:-1, :-2]
+                          + padded[1:-1, 2:] + padded[2:, :-2]
+                          + padded[2:, 1:-1] + padded[2:, 2:])
+            lights = ((neighbours == 3)
+                      | ((lights == 1) & (neighbours == 2))).astype(
+                numpy.uint8)
+            if self._lights_are_stuck:
+                lights[(0, 0, -1, -1), (0, -1, 0, -1)] = 1
+
+        self._lights = lights.astype(bool).tolist()
+
+################################################################################
+
+    def _animate_pool(self, steps: int, in_process: bool = False) -> None:
+        """
+        Worker pool engine; every step, the grid is split into bands of rows
+        and every worker advances one band. The grid is kept in shared memory
+        twice, as the current and the next state of the lights, one byte per
+        light; the workers read the current one and write their bands into
+        the next one, then the two swap. Only the band numbers are sent.
+
+        :param steps: number of steps
+        :param in_process: if True, no pool is started; the whole grid is
+        advanced as one band in this process
+        """
+
+        if self._lights_are_stuck:
+            self._lights_stuck()
+
+        size = len(self._lights)
+        workers = 1 if in_process else available_workers()
+        band_rows = ceil(size / workers)
+        bands = tuple((first_row, min(band_rows, size - first_row))
+                      for first_row in range(0, size, band_rows))
+        corners = (0, size - 1, size * (size - 1), size * size - 1)
+
+        with share(array("B", chain.from_iterable(self._lights)) * 2) \
+                as shared_grids, \
+                (nullcontext(map) if in_process else worker_pool()) \
+                as pool_map, \
+                attach(shared_grids) as grids:
+            for step in range(steps):
+                # waits for all the bands of the step
+                tuple(pool_map(partial(_advance_band, shared_grids, size,
+                                       step % 2), bands))
+                if self._lights_are_stuck:
+                    for corner in corners:
+                        grids[(step + 1) % 2 * size * size + corner] = 1
+
+            offset = steps % 2 * size * size
+            self._lights = [
+                [light == 1 for light in grids[
+                    offset + row * size: offset + (row + 1) * size]]
+                for row in range(size)]
+
+
+################################################################################
+
+def _advance_band(shared_grids: SharedArray,
+                  size: int,
+                  current: int,
+                  band: Tuple[int, int]) -> None:
+    """
+    Advances one band of rows of the grid by a step; the same rules as
+    Lights.advance_grid().
+
+    :param shared_grids: current and next state of the grid, one byte per
+    light, as shared by Lights._animate_pool()
+    :param size: grid side length
+    :param current: which of the two grids is the current one; 0 or 1
+    :param band: first row number and number of rows of the band
+    """
+
+    first_row, count = band
+    current_offset = current * size * size
+    next_offset = (1 - current) * size * size
+    empty = bytes(size)
+
+    with attach(shared_grids) as grids:
+        for i in range(first_row, first_row + count):
+            row = bytes(grids[current_offset + i * size:
+                              current_offset + (i + 1) * size])
+            above = empty if i == 0 else bytes(
+                grids[current_offset + (i - 1) * size:
+                      current_offset + i * size])
+            below = empty if i + 1 == size else bytes(
+                grids[current_offset + (i + 1) * size:
+                      current_offset + (i + 2) * size])
+            # lit lights of every column of the three rows, with a column of
+            # lights which are off on both sides
+            columns = [0] + [sum(lights) for lights in zip(above, row, below)] \
+                + [0]
+            grids[next_offset + i * size: next_offset + (i + 1) * size] = \
+                bytes(neighbours == 3 or light == 1 and neighbours == 2
+                      for light, neighbours in zip(row, (
+                          columns[j] + columns[j + 1] + columns[j + 2] - light
+                          for j, light in enumerate(row))))
+
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=18, puzzle=1)
+def puzzle_01(input_path: str = Lights.INPUT_FILE_PATH) -> int:
     """
     Start by setting your lights to the included initial configuration (your
     puzzle input). A # means "on", and a . means "off".
@@ -138,18 +317,19 @@ def puzzle_01() -> None:
     In your grid of 100x100 lights, given your initial configuration, how many
     lights are on after 100 steps?
 
-    :return: None; Answer should be 814.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 814.
     """
 
-    lights = Lights()
-    for _ in range(STEPS):
-        lights.advance_grid()
-    print_puzzle_solution(lights.lit_lights)
+    lights = Lights(input_path=input_path)
+    lights.animate(STEPS)
+    return lights.lit_lights
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=18, puzzle=2)
+def puzzle_02(input_path: str = Lights.INPUT_FILE_PATH) -> int:
     """
     You flip the instructions over; Santa goes on to point out that this is all
     just an implementation of Conway's Game of Life. At least, it was, until you
@@ -160,12 +340,12 @@ def puzzle_02() -> None:
     the four corners always in the on state, how many lights are on after 100
     steps?
 
-    :return: None; Answer should be 924.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 924.
     """
 
-    lights = Lights(lights_are_stuck=True)
-    for _ in range(STEPS):
-        lights.advance_grid()
-    print_puzzle_solution(lights.lit_lights)
+    lights = Lights(lights_are_stuck=True, input_path=input_path)
+    lights.animate(STEPS)
+    return lights.lit_lights
 
 ################################################################################
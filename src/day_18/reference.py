@@ -0,0 +1,172 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Reference engine of day 18, the implementation the puzzles started with, kept
+as it is. Faster engines are checked against it by the differential harness
+(benchmarks/differential.py).
+"""
+
+from os.path import dirname, join, realpath
+from typing import TextIO, Tuple
+from src.utils.inputs import load_input
+
+STEPS = 100
+
+
+################################################################################
+
+class Lights(object):
+    LIGHT_ON = "#"
+    INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
+
+################################################################################
+
+    def __init__(self,
+                 lights_are_stuck=False,
+                 input_path: str = INPUT_FILE_PATH):
+        """
+        Creates a grid of lights from the input file. Stores the information
+        whether the four corner lights are stuck on or not.
+
+        :param lights_are_stuck: True if the four corner lights are stuck on
+        :param input_path: puzzle input file path
+        """
+
+        # the cached grid is shared; stuck lights are set in this copy
+        self._lights = [list(line) for line in load_input(
+            input_path, self._parse_lights)]
+        self._lights_are_stuck = lights_are_stuck
+
+################################################################################
+
+    @classmethod
+    def _parse_lights(cls, f: TextIO) -> Tuple[Tuple[bool, ...], ...]:
+        """
+        :param f: opened input file
+        :return: grid of lights; True for a light which is on
+        """
+
+        return tuple(tuple(light == cls.LIGHT_ON for light in line.strip())
+                     for line in f.readlines())
+
+################################################################################
+
+    @property
+    def lit_lights(self) -> int:
+        """
+        :return: number of lights in the input grid which are turned on
+        """
+
+        return sum(line.count(True) for line in self._lights)
+
+################################################################################
+
+    def advance_grid(self) -> None:
+        """
+        Animates the grid in steps, where each step decides the next
+        configuration based on the current one. Each light's next state (either
+        on or off) depends on its current state and the current states of the
+        eight lights adjacent to it.
+
+        The state a light should have next is based on its current state (on or
+        off) plus the number of neighbors that are on:
+
+        A light which is on stays on when 2 or 3 neighbors are on, and turns off
+        otherwise.
+        A light which is off turns on if exactly 3 neighbors are on, and stays
+        off otherwise.
+        All of the lights update simultaneously; they all consider the same
+        current state before moving to the next.
+        """
+
+        if self._lights_are_stuck:
+            self._lights_stuck()
+
+        self._lights = [[(self._lights[i][j] is True
+                          and self._lit_neighbours(i, j) == 2
+                          or self._lit_neighbours(i, j) == 3)
+                         or (self._lights[i][j] is False
+                             and self._lit_neighbours(i, j) == 3)
+                         for j in range(len(self._lights[i]))]
+                        for i in range(len(self._lights))]
+
+        if self._lights_are_stuck:
+            self._lights_stuck()
+
+################################################################################
+
+    def _lit_neighbours(self, row: int, column: int) -> int:
+        """
+        Gets the current states of the eight lights adjacent to it (including
+        diagonals). Lights on the edge of the grid might have fewer than eight
+        neighbors; the missing ones always count as "off".
+
+        :param row: number of row that specifies the one light which neighbours
+        state we need to get
+        :param column: number of column that specifies the one light which
+        neighbours state we need to get
+        :return: number of lit neighbour lights of the specified light (by row,
+        column arguments)
+        """
+
+        coords = tuple(filter(
+            lambda coord: all(0 <= value < len(self._lights)
+                              for value in coord),
+            ((row - 1, column - 1),
+             (row - 1, column),
+             (row - 1, column + 1),
+             (row, column - 1),
+             (row, column + 1),
+             (row + 1, column - 1),
+             (row + 1, column),
+             (row + 1, column + 1))))
+        return tuple(self._lights[coord[0]][coord[1]]
+                     for coord in coords).count(True)
+
+################################################################################
+
+    def _lights_stuck(self) -> None:
+        """
+        Four lights, one in each corner of the grid is stuck and cannot be
+        turned off.
+        """
+
+        self._lights[0][0] = True
+        self._lights[0][len(self._lights) - 1] = True
+        self._lights[len(self._lights) - 1][0] = True
+        self._lights[len(self._lights) - 1][len(self._lights) - 1] = True
+
+
+################################################################################
+
+def puzzle_01(input_path: str = Lights.INPUT_FILE_PATH) -> int:
+    """
+    Puzzle 1 as solved by the reference engine.
+
+    :param input_path: puzzle input file path
+    :return: puzzle solution
+    """
+
+    lights = Lights(input_path=input_path)
+    for _ in range(STEPS):
+        lights.advance_grid()
+    return lights.lit_lights
+
+
+################################################################################
+
+def puzzle_02(input_path: str = Lights.INPUT_FILE_PATH) -> int:
+    """
+    Puzzle 2 as solved by the reference engine.
+
+    :param input_path: puzzle input file path
+    :return: puzzle solution
+    """
+
+    lights = Lights(lights_are_stuck=True, input_path=input_path)
+    for _ in range(STEPS):
+        lights.advance_grid()
+    return lights.lit_lights
+
+################################################################################
@@ -17,72 +17,112 @@ works by starting with some input molecule and then doing a series of
 replacements, one per step, until it has the right molecule.
 """
 
-from typing import Dict, Tuple
+from functools import partial
+from os.path import dirname, join, realpath
+from typing import Dict, TextIO, Tuple, Union
 from re import compile
-from random import sample
-from src.utils.utils import print_puzzle_solution
+from random import Random
+from src.utils.counters import add, counted
+from src.utils.inputs import load_input
+from src.utils.registry import solution
+from src.utils.stochastic import search
 
-INPUT_FILE_PATH = "src/day_19/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 ELECTRON = "e"
+# left and right side of a replacement rule; compiled once for all the lines
+RULE_PATTERN = compile(r"(.+) => (.+)")
+# reductions tried before giving up; nearly every one succeeds
+REDUCTION_RESTARTS = 1000
 
 
 ################################################################################
 
-def get_rules() -> Dict[str, Tuple[str, ...]]:
+def _parse_rules(f: TextIO) -> Dict[str, Tuple[str, ...]]:
+    """
+    :param f: opened input file
+    :return: replacement rules dict (1:N)
+    """
+
+    lines = f.readlines()
+    rules = dict()
+
+    for line in lines[:-2]:
+        key, value = RULE_PATTERN.search(line.strip()).groups()
+        rules.setdefault(key, [])
+        rules[key].append(value)
+    return {key: tuple(values) for key, values in rules.items()}
+
+
+################################################################################
+
+def get_rules(input_path: str) -> Dict[str, Tuple[str, ...]]:
     """
     Loads the replacement rules from the input file in the original direction,
     from one electron to a medicine molecule. There is usually more than one
     possibility to one left side of a rule, so the keys of the dict are strings
     and values are tuples of replacement possibilities.
 
+    :param input_path: puzzle input file path
     :return: replacement rules dict (1:N)
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        rules = dict()
+    return load_input(input_path, _parse_rules)
 
-        for line in lines[:-2]:
-            key = compile(r"(.+) =>").findall(line.strip())[0]
-            value = compile(r"=> (.+)").findall(line.strip())[0]
-            rules.setdefault(key, [])
-            rules[key].append(value)
-        return rules
+
+################################################################################
+
+def _parse_rules_reversed(f: TextIO) -> Dict[str, str]:
+    """
+    :param f: opened input file
+    :return: replacement rules dict (1:1)
+    """
+
+    lines = f.readlines()
+    return {
+        value: key
+        for key, value in (RULE_PATTERN.search(line.strip()).groups()
+                           for line in lines[:-2])
+    }
 
 
 ################################################################################
 
-def get_rules_reversed() -> Dict[str, str]:
+def get_rules_reversed(input_path: str) -> Dict[str, str]:
     """
     Loads the replacement rules from the input file in the reversed direction,
     from a medicine molecule to one electron. There is always only one possible
     replacement for every left side of a rule, so both keys and values of the
     dict are just strings.
 
+    :param input_path: puzzle input file path
     :return: replacement rules dict (1:1)
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        return {
-            compile(r"=> (.+)").findall(line.strip())[0]:
-                compile(r"(.+) =>").findall(line.strip())[0]
-            for line in lines[:-2]
-        }
+    return load_input(input_path, _parse_rules_reversed)
+
+
+################################################################################
+
+def _parse_molecule(f: TextIO) -> str:
+    """
+    :param f: opened input file
+    :return: medicine molecule
+    """
+
+    return f.readlines()[-1].strip()
 
 
 ################################################################################
 
-def get_molecule() -> str:
+def get_molecule(input_path: str) -> str:
     """
     Loads the medicine molecule from the input file.
 
+    :param input_path: puzzle input file path
     :return: medicine molecule
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        return lines[-1].strip()
+    return load_input(input_path, _parse_molecule)
 
 
 ################################################################################
@@ -103,7 +143,58 @@ def apply_rule(left: str, right: str, index: int, molecule: str) -> str:
 
 ################################################################################
 
-def puzzle_01() -> None:
+def reduce_randomly(rules: Dict[str, str],
+                    molecule: str,
+                    rng: Random) -> Union[int, None]:
+    """
+    One attempt to reduce the molecule to one electron. The reversed rules are
+    applied in a random order for as long as any of them can be applied.
+
+    :param rules: replacement rules in the reversed direction
+    :param molecule: medicine molecule
+    :param rng: random generator of the attempt
+    :return: number of applied rules if the molecule was reduced to one
+    electron, None if the reduction got stuck on a different molecule
+    """
+
+    # count the number of applied rules
+    count = 0
+
+    while True:
+        rule_was_applied = False
+        # shuffle all the rules
+        keys = rng.sample(tuple(rules.keys()), k=len(rules.keys()))
+
+        for key in keys:
+            # try to apply all the rules, one by one
+
+            while True:
+                # try to find the rule left side in the molecule
+                index = molecule.find(key)
+
+                if index == -1:
+                    # no rule left side occurrence in the molecule, move on to
+                    # another rule
+                    break
+                else:
+                    # apply the rule
+                    molecule = apply_rule(key, rules[key], index, molecule)
+                    rule_was_applied = True
+                    count += 1
+
+        if not rule_was_applied:
+            # we went through all the rules without being able to apply a
+            # single one
+            break
+
+    add("rule applications", count)
+    return count if molecule == ELECTRON else None
+
+
+################################################################################
+
+@solution(day=19, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     However, the machine has to be calibrated before it can be used. Calibration
     involves determining the number of molecules that can be generated in one
@@ -114,22 +205,24 @@ def puzzle_01() -> None:
     How many distinct molecules can be created after all the different ways you
     can do one replacement on the medicine molecule?
 
-    :return: None; Answer should be 509.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 509.
     """
 
-    rules = get_rules()
-    molecule = get_molecule()
-    results = set(apply_rule(key, value, index, molecule)
-                  for key in rules
-                  for value in rules[key]
-                  for index in [m.start()
-                                for m in compile(key).finditer(molecule)])
-    print_puzzle_solution(len(results))
+    rules = get_rules(input_path)
+    molecule = get_molecule(input_path)
+    results = set(counted("rule applications", (
+        apply_rule(key, value, index, molecule)
+        for key in rules
+        for value in rules[key]
+        for index in [m.start() for m in compile(key).finditer(molecule)])))
+    return len(results)
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=19, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Now that the machine is calibrated, you're ready to begin molecule
     fabrication.
@@ -141,52 +234,21 @@ def puzzle_02() -> None:
     and the medicine molecule in your puzzle input, what is the fewest number of
     steps to go from e to the medicine molecule?
 
-    :return: None; Answer should be 195.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 195.
     """
 
-    rules = get_rules_reversed()
-    start_molecule = get_molecule()
-    goal_molecule = ELECTRON
-
-    while True:
-        # start with the medicine molecule and try to reduce it to one electron
-        molecule = start_molecule
-        # count the number of applied rules
-        count = 0
-
-        while True:
-            rule_was_applied = False
-            # shuffle all the rules
-            keys = sample(rules.keys(), k=len(rules.keys()))
-
-            for key in keys:
-                # try to apply all the rules, one by one
-
-                while True:
-                    # try to find the rule left side in the molecule
-                    index = molecule.find(key)
-
-                    if index == -1:
-                        # no rule left side occurrence in the molecule, move on
-                        # to another rule
-                        break
-                    else:
-                        # apply the rule
-                        molecule = apply_rule(key, rules[key], index, molecule)
-                        rule_was_applied = True
-                        count += 1
-
-            if not rule_was_applied:
-                # we went through all the rules without being able to apply a
-                # single one
-                break
-
-        if molecule == goal_molecule:
-            # the medicine molecule was successfully reduced to one electron
-            print_puzzle_solution(count)
-            break
-        else:
-            # the reduction result is different to one electron, start over
-            continue
+    # start with the medicine molecule and try to reduce it to one electron;
+    # every successful reduction takes the same number of steps
+    count = search("day 19 reduction",
+                   partial(reduce_randomly, get_rules_reversed(input_path),
+                           get_molecule(input_path)),
+                   REDUCTION_RESTARTS,
+                   accept=lambda steps: True)
+
+    if count is None:
+        raise ValueError("The molecule could not be reduced to {}".format(
+            ELECTRON))
+    return count
 
 ################################################################################
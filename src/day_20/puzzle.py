@@ -8,13 +8,31 @@ To keep the Elves busy, Santa has them deliver some presents by hand,
 door-to-door.
 """
 
+from functools import partial
 from itertools import count
-from src.utils.utils import print_puzzle_solution
+from math import isqrt
+from typing import TYPE_CHECKING, List, Tuple, Union
+from src.utils.backends import NUMPY, PYTHON, select_backend, worker_pool
+from src.utils.progress import Tracker
+from src.utils.registry import solution
+
+if TYPE_CHECKING:
+    import numpy
 
 PUZZLE_INPUT = 29000000
 # generators can be sped up by skipping houses; checking only every 10th house
 # seems to be reasonable enough while speeding up the process enormously
 STEP = 10
+PRESENTS_PER_ELF = 10
+PRESENTS_PER_ELF_2 = 11
+HOUSES_PER_ELF_2 = 50
+# smallest numbers of presents the auto backend looks for with NumPy and with
+# the worker pool
+NUMPY_SIZE = 100000
+POOL_SIZE = 1000000
+# houses sieved at once by the NumPy engine and by one worker of the pool
+NUMPY_BLOCK_SIZE = 2 ** 20
+POOL_BLOCK_SIZE = 2 ** 16
 
 
 ################################################################################
@@ -29,7 +47,7 @@ def house_presents():
 
     for house_number in count(start=0, step=STEP):
         presents = sum(
-            elf_number * 10
+            elf_number * PRESENTS_PER_ELF
             for elf_number in range(1, house_number + 1)
             if house_number % elf_number == 0)
         yield house_number, presents
@@ -47,16 +65,184 @@ def house_presents_2():
 
     for house_number in count(start=0, step=STEP):
         presents = sum(
-            elf_number * 11
+            elf_number * PRESENTS_PER_ELF_2
             for elf_number in range(1, house_number + 1)
             if house_number % elf_number == 0
-            and elf_number * 50 >= house_number)
+            and elf_number * HOUSES_PER_ELF_2 >= house_number)
         yield house_number, presents
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+def sieve_lowest_house(puzzle_input: int,
+                       presents_per_elf: int,
+                       houses_per_elf: Union[int, None],
+                       backend: str) -> int:
+    """
+    NumPy and worker pool engines. Instead of dividing every house number, the
+    elves deliver their presents to blocks of houses in turn (a sieve); the
+    first block with a house that gets enough presents holds the answer. Only
+    every STEP-th house is looked at, as in the generators. The house number
+    times the presents per elf is always enough presents, so the blocks end
+    there at the latest.
+
+    :param puzzle_input: number of presents the house should get
+    :param presents_per_elf: presents each elf delivers per its number
+    :param houses_per_elf: number of houses each elf delivers to; None for
+    infinitely many
+    :param backend: NUMPY or MULTIPROCESSING
+    :return: lowest house number of the house to get at least as many presents
+    as the puzzle input
+    """
+
+    block_size = NUMPY_BLOCK_SIZE if backend == NUMPY else POOL_BLOCK_SIZE
+    houses = puzzle_input // presents_per_elf + STEP + 1
+    blocks = ((first, min(first + block_size, houses))
+              for first in range(0, houses, block_size))
+    tracker = Tracker("day 20 house blocks", "blocks", check_every=1)
+    first_house = partial(_first_house_in_block, puzzle_input,
+                          presents_per_elf, houses_per_elf, backend == NUMPY)
+
+    if backend == NUMPY:
+        first_houses = map(first_house, blocks)
+        for house in tracker.iterate(first_houses):
+            if house is not None:
+                return house
+    else:
+        # leaving the block terminates the workers still sieving
+        with worker_pool() as pool_map:
+            for house in tracker.iterate(pool_map(first_house, blocks)):
+                if house is not None:
+                    return house
+
+    raise ValueError("No house gets {} presents".format(puzzle_input))
+
+
+################################################################################
+
+def _first_house_in_block(puzzle_input: int,
+                          presents_per_elf: int,
+                          houses_per_elf: Union[int, None],
+                          use_numpy: bool,
+                          block: Tuple[int, int]) -> Union[int, None]:
+    """
+    :param puzzle_input: number of presents the house should get
+    :param presents_per_elf: presents each elf delivers per its number
+    :param houses_per_elf: number of houses each elf delivers to; None for
+    infinitely many
+    :param use_numpy: True to sieve with NumPy, False in pure Python
+    :param block: first house number of the block and the house number after
+    its last one
+    :return: lowest house number in the block (every STEP-th) to get at least
+    as many presents as the puzzle input; None if there is no such house
+    """
+
+    first, stop = block
+    # every STEP-th house, counted from the house number 0
+    offset = -first % STEP
+
+    if use_numpy:
+        # imported here; NumPy is only needed for its backend
+        import numpy
+        elf_numbers = _elf_number_sums_numpy(first, stop, houses_per_elf)
+        hits = numpy.flatnonzero(
+            elf_numbers[offset::STEP] * presents_per_elf >= puzzle_input)
+        return None if hits.size == 0 \
+            else first + offset + int(hits[0]) * STEP
+
+    elf_numbers = _elf_number_sums(first, stop, houses_per_elf)
+    for house in range(first + offset, stop, STEP):
+        if elf_numbers[house - first] * presents_per_elf >= puzzle_input:
+            return house
+    return None
+
+
+################################################################################
+
+def _elf_number_sums(first: int,
+                     stop: int,
+                     houses_per_elf: Union[int, None]) -> List[int]:
+    """
+    Every house number is an elf number times the number of the elf's house
+    (multiple). Elves up to the square root of the last house deliver to their
+    houses one by one; the few multiples greater than that pick the elves
+    whose houses they are.
+
+    :param first: first house number of the block
+    :param stop: house number after the last one of the block
+    :param houses_per_elf: number of houses each elf delivers to; None for
+    infinitely many
+    :return: sum of the numbers of the elves who deliver to each house of the
+    block
+    """
+
+    elf_numbers = [0] * (stop - first)
+    root = isqrt(stop - 1)
+    multiples = (stop - 1) // (root + 1)
+    if houses_per_elf is not None:
+        multiples = min(multiples, houses_per_elf)
+
+    for elf in range(1, root + 1):
+        last = stop if houses_per_elf is None \
+            else min(stop, elf * houses_per_elf + 1)
+        for house in range(max(-(-first // elf), 1) * elf, last, elf):
+            elf_numbers[house - first] += elf
+
+    for multiple in range(1, multiples + 1):
+        for elf in range(max(root + 1, -(-first // multiple)),
+                         (stop - 1) // multiple + 1):
+            elf_numbers[elf * multiple - first] += elf
+
+    return elf_numbers
+
+
+################################################################################
+
+def _elf_number_sums_numpy(first: int,
+                           stop: int,
+                           houses_per_elf: Union[int, None]) -> "numpy.ndarray":
+    """
+    The same sums as _elf_number_sums(), with a slice of houses per elf and
+    per multiple.
+
+    :param first: first house number of the block
+    :param stop: house number after the last one of the block
+    :param houses_per_elf: number of houses each elf delivers to; None for
+    infinitely many
+    :return: array of the sums of the numbers of the elves who deliver to each
+    house of the block
+    """
+
+    # imported here; NumPy is only needed for its backend
+    import numpy
+
+    elf_numbers = numpy.zeros(stop - first, dtype=numpy.int64)
+    root = isqrt(stop - 1)
+    multiples = (stop - 1) // (root + 1)
+    if houses_per_elf is not None:
+        multiples = min(multiples, houses_per_elf)
+
+    for elf in range(1, root + 1):
+        last = stop if houses_per_elf is None \
+            else min(stop, elf * houses_per_elf + 1)
+        elf_numbers[max(-(-first // elf), 1) * elf - first:
+                    max(last - first, 0):elf] += elf
+
+    for multiple in range(1, multiples + 1):
+        low = max(root + 1, -(-first // multiple))
+        high = (stop - 1) // multiple
+        if low <= high:
+            elf_numbers[low * multiple - first:
+                        high * multiple - first + 1:multiple] += \
+                numpy.arange(low, high + 1)
+
+    return elf_numbers
+
+
+################################################################################
+
+@solution(day=20, puzzle=1)
+def puzzle_01(puzzle_input: int = PUZZLE_INPUT) -> int:
     """
     He sends them down a street with infinite houses numbered sequentially: 1,
     2, 3, 4, 5, and so on.
@@ -76,21 +262,31 @@ def puzzle_01() -> None:
     What is the lowest house number of the house to get at least as many
     presents as the number in your puzzle input?
 
-    :return: None; Answer should be 665280.
+    :param puzzle_input: number of presents the house should get
+    :return: puzzle solution; Answer should be 665280.
     """
 
-    house_presents_generator = house_presents()
+    backend = select_backend(puzzle_input, NUMPY_SIZE, POOL_SIZE)
+    if backend != PYTHON:
+        return sieve_lowest_house(puzzle_input, PRESENTS_PER_ELF, None,
+                                  backend)
+
+    tracker = Tracker("day 20 houses", "houses", check_every=1)
+    house_presents_generator = tracker.iterate(house_presents())
+    tracker.best = 0
     while True:
         house_number, presents = next(house_presents_generator)
+        # the most presents so far
+        tracker.best = max(tracker.best, presents)
 
-        if presents >= PUZZLE_INPUT:
-            print_puzzle_solution(house_number)
-            break
+        if presents >= puzzle_input:
+            return house_number
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=20, puzzle=2)
+def puzzle_02(puzzle_input: int = PUZZLE_INPUT) -> int:
     """
     The Elves decide they don't want to visit an infinite number of houses.
     Instead, each Elf will stop after delivering presents to 50 houses. To make
@@ -100,15 +296,24 @@ def puzzle_02() -> None:
     With these changes, what is the new lowest house number of the house to get
     at least as many presents as the number in your puzzle input?
 
-    :return: None; Answer should be 705600.
+    :param puzzle_input: number of presents the house should get
+    :return: puzzle solution; Answer should be 705600.
     """
 
-    house_presents_generator = house_presents_2()
+    backend = select_backend(puzzle_input, NUMPY_SIZE, POOL_SIZE)
+    if backend != PYTHON:
+        return sieve_lowest_house(puzzle_input, PRESENTS_PER_ELF_2,
+                                  HOUSES_PER_ELF_2, backend)
+
+    tracker = Tracker("day 20 houses, 50 each", "houses", check_every=1)
+    house_presents_generator = tracker.iterate(house_presents_2())
+    tracker.best = 0
     while True:
         house_number, presents = next(house_presents_generator)
+        # the most presents so far
+        tracker.best = max(tracker.best, presents)
 
-        if presents >= PUZZLE_INPUT:
-            print_puzzle_solution(house_number)
-            break
+        if presents >= puzzle_input:
+            return house_number
 
 ################################################################################
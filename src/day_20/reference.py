@@ -0,0 +1,90 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Reference engine of day 20, the implementation the puzzles started with, kept
+as it is. Faster engines are checked against it by the differential harness
+(benchmarks/differential.py).
+"""
+
+from itertools import count
+
+PUZZLE_INPUT = 29000000
+# generators can be sped up by skipping houses; checking only every 10th house
+# seems to be reasonable enough while speeding up the process enormously
+STEP = 10
+
+
+################################################################################
+
+def house_presents():
+    """
+    Generator of house numbers and number of presents delivered to that house.
+    Rules from puzzle 1 applied.
+
+    :return: house number and number of presents delivered to the house
+    """
+
+    for house_number in count(start=0, step=STEP):
+        presents = sum(
+            elf_number * 10
+            for elf_number in range(1, house_number + 1)
+            if house_number % elf_number == 0)
+        yield house_number, presents
+
+
+################################################################################
+
+def house_presents_2():
+    """
+    Generator of house numbers and number of presents delivered to that house.
+    Rules from puzzle 2 applied.
+
+    :return: house number and number of presents delivered to the house
+    """
+
+    for house_number in count(start=0, step=STEP):
+        presents = sum(
+            elf_number * 11
+            for elf_number in range(1, house_number + 1)
+            if house_number % elf_number == 0
+            and elf_number * 50 >= house_number)
+        yield house_number, presents
+
+
+################################################################################
+
+def puzzle_01(puzzle_input: int = PUZZLE_INPUT) -> int:
+    """
+    Puzzle 1 as solved by the reference engine.
+
+    :param puzzle_input: number of presents the house should get
+    :return: puzzle solution
+    """
+
+    house_presents_generator = house_presents()
+    while True:
+        house_number, presents = next(house_presents_generator)
+
+        if presents >= puzzle_input:
+            return house_number
+
+
+################################################################################
+
+def puzzle_02(puzzle_input: int = PUZZLE_INPUT) -> int:
+    """
+    Puzzle 2 as solved by the reference engine.
+
+    :param puzzle_input: number of presents the house should get
+    :return: puzzle solution
+    """
+
+    house_presents_generator = house_presents_2()
+    while True:
+        house_number, presents = next(house_presents_generator)
+
+        if presents >= puzzle_input:
+            return house_number
+
+################################################################################
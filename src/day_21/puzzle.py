@@ -9,118 +9,148 @@ stuck on a boss. He needs to know what equipment to buy at the shop. He hands
 you the controller.
 """
 
+from os.path import dirname, join, realpath
 from re import compile
 from itertools import product, permutations
 from sys import maxsize
-from typing import Dict, Tuple, Generator
-from src.utils.utils import print_puzzle_solution
+from typing import NamedTuple, Tuple, Generator, TextIO
+from src.utils.counters import counted
+from src.utils.inputs import load_input
+from src.utils.registry import solution
 
-INPUT_FILE_PATH = "src/day_21/input.txt"
-WEAPONS_FILE_PATH = "src/day_21/weapons.txt"
-ARMOR_FILE_PATH = "src/day_21/armor.txt"
-RINGS_FILE_PATH = "src/day_21/rings.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
+WEAPONS_FILE_PATH = join(dirname(realpath(__file__)), "weapons.txt")
+ARMOR_FILE_PATH = join(dirname(realpath(__file__)), "armor.txt")
+RINGS_FILE_PATH = join(dirname(realpath(__file__)), "rings.txt")
 
-KEY_NAME = "Name"
-KEY_COST = "Cost"
-KEY_DAMAGE = "Damage"
-KEY_ARMOR = "Armor"
-KEY_HIT_POINTS = "Hit Points"
+PLAYER_HIT_POINTS = 100
+# boss stats; compiled once
+HIT_POINTS_PATTERN = compile(r"Hit Points: (\d+)")
+DAMAGE_PATTERN = compile(r"Damage: (\d+)")
+ARMOR_PATTERN = compile(r"Armor: (\d+)")
 
 
 ################################################################################
 
-def load_weapons() -> Tuple[Dict[str, int], ...]:
+class Item(NamedTuple):
     """
-    :return: weapons tuple; each weapon is a dict with weapon name, cost, damage
-    and armor values
+    One item from the shop.
     """
 
-    with open(WEAPONS_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        return tuple({
-            KEY_NAME: line.strip().split()[0],
-            KEY_COST: int(line.strip().split()[1]),
-            KEY_DAMAGE: int(line.strip().split()[2]),
-            KEY_ARMOR: int(line.strip().split()[3])
-        } for line in lines[1:])
+    name: str
+    cost: int
+    damage: int
+    armor: int
 
 
 ################################################################################
 
-def load_armor() -> Tuple[Dict[str, int], ...]:
+class Character(NamedTuple):
     """
-    :return: armor tuple; each armor is a dict with weapon name, cost, damage
-    and armor values
+    Stats of the player or the boss at the start of a fight.
     """
 
-    with open(ARMOR_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        return tuple({
-            KEY_NAME: line.strip().split()[0],
-            KEY_COST: int(line.strip().split()[1]),
-            KEY_DAMAGE: int(line.strip().split()[2]),
-            KEY_ARMOR: int(line.strip().split()[3])
-        } for line in lines[1:])
+    hit_points: int
+    damage: int
+    armor: int
 
 
 ################################################################################
 
-def load_rings() -> Tuple[Dict[str, int], ...]:
+def _parse_items(f: TextIO) -> Tuple[Item, ...]:
     """
-    :return: rings tuple; each ring is a dict with weapon name, cost, damage and
-    armor values
+    :param f: opened shop file
+    :return: items tuple; each item has its name, cost, damage and armor values
     """
 
-    with open(RINGS_FILE_PATH, "r") as f:
-        lines = f.readlines()
-        return tuple({
-            KEY_NAME: line.strip().split()[0],
-            KEY_COST: int(line.strip().split()[1]),
-            KEY_DAMAGE: int(line.strip().split()[2]),
-            KEY_ARMOR: int(line.strip().split()[3])
-        } for line in lines[1:])
+    # the first line is the header
+    next(f)
+    items = []
+
+    for line in f:
+        if len(line.strip()) > 0:
+            name, cost, damage, armor = line.split()
+            items.append(Item(name, int(cost), int(damage), int(armor)))
+
+    return tuple(items)
+
+
+################################################################################
+
+def _parse_boss(f: TextIO) -> Character:
+    """
+    :param f: opened input file
+    :return: boss with its hit points, damage and armor values
+    """
+
+    contents = f.read()
+    return Character(int(HIT_POINTS_PATTERN.search(contents).group(1)),
+                     int(DAMAGE_PATTERN.search(contents).group(1)),
+                     int(ARMOR_PATTERN.search(contents).group(1)))
+
+
+################################################################################
+
+def load_weapons() -> Tuple[Item, ...]:
+    """
+    :return: weapons tuple; each weapon has its name, cost, damage and armor
+    values
+    """
+
+    return load_input(WEAPONS_FILE_PATH, _parse_items)
 
 
 ################################################################################
 
-def load_boss() -> Dict[str, int]:
+def load_armor() -> Tuple[Item, ...]:
     """
-    :return: boss dict with its hit points, damage and armor values
+    :return: armor tuple; each armor has its name, cost, damage and armor
+    values
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        contents = f.read()
-        hit_points = int(compile(r"Hit Points: (\d+)").findall(contents)[0])
-        damage = int(compile(r"Damage: (\d+)").findall(contents)[0])
-        armor = int(compile(r"Armor: (\d+)").findall(contents)[0])
+    return load_input(ARMOR_FILE_PATH, _parse_items)
 
-        return {
-            KEY_HIT_POINTS: hit_points,
-            KEY_DAMAGE: damage,
-            KEY_ARMOR: armor
-        }
+
+################################################################################
+
+def load_rings() -> Tuple[Item, ...]:
+    """
+    :return: rings tuple; each ring has its name, cost, damage and armor values
+    """
+
+    return load_input(RINGS_FILE_PATH, _parse_items)
+
+
+################################################################################
+
+def load_boss(input_path: str) -> Character:
+    """
+    :param input_path: puzzle input file path
+    :return: boss with its hit points, damage and armor values; shared, the
+    fight does not change it
+    """
+
+    return load_input(input_path, _parse_boss)
 
 
 ################################################################################
 
-def load_player(equipment: Tuple[Dict[str, int]]) -> Dict[str, int]:
+def load_player(equipment: Tuple[Item, ...]) -> Character:
     """
     :param equipment: player equipment (weapon, armor, left hand ring, right
     hand ring)
-    :return: player dict with its hit points, damage and armor values; the
-    latter two are counted from equipment damage and armor values
+    :return: player with its hit points, damage and armor values; the latter
+    two are counted from equipment damage and armor values
     """
 
-    return {
-        KEY_HIT_POINTS: 100,
-        KEY_DAMAGE: sum(item[KEY_DAMAGE] for item in equipment),
-        KEY_ARMOR: sum(item[KEY_ARMOR] for item in equipment)
-    }
+    return Character(PLAYER_HIT_POINTS,
+                     sum(item.damage for item in equipment),
+                     sum(item.armor for item in equipment))
 
 
 ################################################################################
 
-def equipment_combinations() -> Generator[Tuple[Dict[str, int]], None, None]:
+def equipment_combinations() -> Generator[Tuple[Item, ...], None, None]:
     """
     :return: equipment combinations generator; each equipment combination
     consists of a weapon, armor, left hand ring and right hand ring
@@ -136,28 +166,32 @@ def equipment_combinations() -> Generator[Tuple[Dict[str, int]], None, None]:
 
 ################################################################################
 
-def fight(player: Dict[str, int], boss: Dict[str, int]) -> bool:
+def fight(player: Character, boss: Character) -> bool:
     """
     Simulate player vs boss fight.
 
-    :param player: player dict (hit points, damage, armor)
-    :param boss: boss dict (hit points, damage, armor)
+    :param player: player stats (hit points, damage, armor)
+    :param boss: boss stats (hit points, damage, armor)
     :return: True if the player wins, False if the boss wins
     """
 
+    player_hit_points = player.hit_points
+    boss_hit_points = boss.hit_points
+
     while True:
-        boss[KEY_HIT_POINTS] -= max(player[KEY_DAMAGE] - boss[KEY_ARMOR], 1)
-        if boss[KEY_HIT_POINTS] <= 0:
+        boss_hit_points -= max(player.damage - boss.armor, 1)
+        if boss_hit_points <= 0:
             return True
         else:
-            player[KEY_HIT_POINTS] -= max(boss[KEY_DAMAGE] - player[KEY_ARMOR], 1)
-            if player[KEY_HIT_POINTS] <= 0:
+            player_hit_points -= max(boss.damage - player.armor, 1)
+            if player_hit_points <= 0:
                 return False
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=21, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     In this game, the player (you) and the enemy (the boss) take turns
     attacking. The player always goes first. Each attack reduces the opponent's
@@ -207,25 +241,29 @@ def puzzle_01() -> None:
     You have 100 hit points. The boss's actual stats are in your puzzle input.
     What is the least amount of gold you can spend and still win the fight?
 
-    :return: None; Answer should be 121.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 121.
     """
 
     min_equipment_cost = maxsize
 
-    for equipment in equipment_combinations():
+    boss = load_boss(input_path)
+
+    # every equipment combination is one fight
+    for equipment in counted("fights", equipment_combinations()):
         player = load_player(equipment)
-        boss = load_boss()
-        equipment_cost = sum(item[KEY_COST] for item in equipment)
+        equipment_cost = sum(item.cost for item in equipment)
 
         if fight(player, boss) is True and equipment_cost < min_equipment_cost:
             min_equipment_cost = equipment_cost
 
-    print_puzzle_solution(min_equipment_cost)
+    return min_equipment_cost
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=21, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Turns out the shopkeeper is working with the boss, and can persuade you to
     buy whatever items he wants. The other rules still apply, and he still only
@@ -233,19 +271,22 @@ def puzzle_02() -> None:
 
     What is the most amount of gold you can spend and still lose the fight?
 
-    :return: None; Answer should be 201.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 201.
     """
 
     max_equipment_cost = -maxsize - 1
 
-    for equipment in equipment_combinations():
+    boss = load_boss(input_path)
+
+    # every equipment combination is one fight
+    for equipment in counted("fights", equipment_combinations()):
         player = load_player(equipment)
-        boss = load_boss()
-        equipment_cost = sum(item[KEY_COST] for item in equipment)
+        equipment_cost = sum(item.cost for item in equipment)
 
         if fight(player, boss) is False and equipment_cost > max_equipment_cost:
             max_equipment_cost = equipment_cost
 
-    print_puzzle_solution(max_equipment_cost)
+    return max_equipment_cost
 
 ################################################################################
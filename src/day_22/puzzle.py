@@ -9,12 +9,16 @@ Now he's playing the game with a wizard. Of course, he gets stuck on another
 boss and needs your help again.
 """
 
-from typing import Callable, Tuple, Union
+from functools import partial
+from os.path import dirname, join, realpath
+from typing import Callable, TextIO, Tuple, Union
 from re import compile
 from logging import basicConfig, INFO, info, WARNING, root
-from sys import maxsize
-from random import choice
-from src.utils.utils import print_puzzle_solution
+from random import Random
+from src.utils.counters import add
+from src.utils.inputs import load_input
+from src.utils.registry import solution
+from src.utils.stochastic import search
 
 RANDOM_FIGHTS_COUNT = 1000000
 
@@ -22,7 +26,7 @@ RANDOM_FIGHTS_COUNT = 1000000
 ################################################################################
 
 class Game(object):
-    INPUT_FILE_PATH = "src/day_22/input.txt"
+    INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 
     MAGIC_MISSILE_MANA_COST = 53
     MAGIC_MISSILE_DAMAGE = 4
@@ -55,11 +59,13 @@ class Game(object):
 
 ################################################################################
 
-    def __init__(self):
+    def __init__(self, input_path: str = INPUT_FILE_PATH):
         """
         All instance variables initialized to None because new_game() method is
         used to load the starting values. Loads boss hit points and damage from
         the input file.
+
+        :param input_path: puzzle input file path
         """
 
         self._player_hit_points = None
@@ -72,13 +78,24 @@ class Game(object):
         self._hard_difficulty = None
         self._history = None
         self._boss_hit_points = None
+        # logging set up by the last new_game(); None before the first one
+        self._logging_on = None
+
+        self.BOSS_INIT_HIT_POINTS, self._BOSS_DAMAGE = load_input(
+            input_path, self._parse_boss)
+
+################################################################################
+
+    @staticmethod
+    def _parse_boss(f: TextIO) -> Tuple[int, int]:
+        """
+        :param f: opened input file
+        :return: boss hit points and damage
+        """
 
-        with open(self.INPUT_FILE_PATH, "r") as f:
-            contents = f.read()
-            self.BOSS_INIT_HIT_POINTS = int(
-                compile(r"Hit Points: (\d+)").findall(contents)[0])
-            self._BOSS_DAMAGE = int(
-                compile(r"Damage: (\d+)").findall(contents)[0])
+        contents = f.read()
+        return (int(compile(r"Hit Points: (\d+)").findall(contents)[0]),
+                int(compile(r"Damage: (\d+)").findall(contents)[0]))
 
 ################################################################################
 
@@ -144,8 +161,10 @@ class Game(object):
 
 ################################################################################
 
-    def fight_random(
-            self, hard_difficulty: bool, logging_on: bool = False) -> int:
+    def fight_random(self,
+                     hard_difficulty: bool,
+                     rng: Random,
+                     logging_on: bool = False) -> int:
         """
         Usable for both difficulties (both puzzles, 1 and 2). Set the difficulty
         and choose spells randomly. Best results (win with the lowest mana cost)
@@ -153,6 +172,7 @@ class Game(object):
         methods.
 
         :param hard_difficulty: True for puzzle 2, False for puzzle 1
+        :param rng: random generator choosing the spells
         :param logging_on: if True, additional logging messages are printed
         :return: total fight mana cost in case of a win, -1 in case of a loss
         """
@@ -173,13 +193,14 @@ class Game(object):
                 # counters not yet checked so if it is 1 it will be lowered to
                 # zero and the spell can be cast
                 spells.append(self._poison)
-            if self._mana >= self.RECHARGE_MANA_COST and self._recharge_timer <= 1:
+            if self._mana >= self.RECHARGE_MANA_COST \
+                    and self._recharge_timer <= 1:
                 # counters not yet checked so if it is 1 it will be lowered to
                 # zero and the spell can be cast
                 spells.append(self._recharge)
 
             try:
-                result = self._turn(choice(tuple(spells)))
+                result = self._turn(rng.choice(tuple(spells)))
             except IndexError:
                 # no spell can be cast
                 result = -1
@@ -198,49 +219,49 @@ class Game(object):
         zero if the fight is not over yet
         """
 
-        info("\n--- PLAYER TURN ---")
+        self._log("\n--- PLAYER TURN ---")
         if self._hard_difficulty is True:
-            info("Hard difficulty; player hit points: {} -> {}".format(
-                self._player_hit_points, self._player_hit_points - 1))
+            self._log("Hard difficulty; player hit points: {} -> {}",
+                      self._player_hit_points, self._player_hit_points - 1)
             self._player_hit_points -= 1
 
         if self._player_hit_points <= 0:
-            info("PLAYER LOSES THE GAME!")
+            self._log("PLAYER LOSES THE GAME!")
             return -1
         else:
             self._check_counters()
-            info("Shield timer: {}".format(self._shield_timer))
-            info("Poison timer: {}".format(self._poison_timer))
-            info("Recharge timer: {}".format(self._recharge_timer))
-            info("Player armor: {}".format(self._armor))
-            info("Player hit points: {}".format(self._player_hit_points))
-            info("Player mana: {}".format(self._mana))
+            self._log("Shield timer: {}", self._shield_timer)
+            self._log("Poison timer: {}", self._poison_timer)
+            self._log("Recharge timer: {}", self._recharge_timer)
+            self._log("Player armor: {}", self._armor)
+            self._log("Player hit points: {}", self._player_hit_points)
+            self._log("Player mana: {}", self._mana)
 
             if all(self._mana < mana_cost for mana_cost in self.MANA_COSTS):
-                info("PLAYER LOSES THE GAME!")
+                self._log("PLAYER LOSES THE GAME!")
                 return -1
             else:
                 spell()
 
                 if self._boss_hit_points <= 0:
-                    info("PLAYER WINS THE GAME!")
+                    self._log("PLAYER WINS THE GAME!")
                     return self._total_mana_cost
                 else:
-                    info("\n--- BOSS TURN ---")
+                    self._log("\n--- BOSS TURN ---")
                     self._check_counters()
-                    info("Shield timer: {}".format(self._shield_timer))
-                    info("Poison timer: {}".format(self._poison_timer))
-                    info("Recharge timer: {}".format(self._recharge_timer))
-                    info("Boss hit points: {}".format(self._boss_hit_points))
+                    self._log("Shield timer: {}", self._shield_timer)
+                    self._log("Poison timer: {}", self._poison_timer)
+                    self._log("Recharge timer: {}", self._recharge_timer)
+                    self._log("Boss hit points: {}", self._boss_hit_points)
                     boss_damage = max(self._BOSS_DAMAGE - self._armor, 1)
-                    info("Boss attacks player for {}: {} -> {}".format(
-                        boss_damage,
-                        self._player_hit_points,
-                        self._player_hit_points - boss_damage))
+                    self._log("Boss attacks player for {}: {} -> {}",
+                              boss_damage,
+                              self._player_hit_points,
+                              self._player_hit_points - boss_damage)
                     self._player_hit_points -= boss_damage
 
                     if self._player_hit_points <= 0:
-                        info("PLAYER LOSES THE GAME!")
+                        self._log("PLAYER LOSES THE GAME!")
                         return -1
         return 0
 
@@ -254,15 +275,20 @@ class Game(object):
         :param logging_on: if True, additional logging messages are printed
         """
 
-        # remove all existing handlers so basicConfig() can be called again
-        [root.removeHandler(handler) for handler in root.handlers[:]]
+        add("fights")
+        # a reused game keeps its logging set up from the previous fight
+        if logging_on is not self._logging_on:
+            # remove all existing handlers so basicConfig() can be called again
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
 
-        if logging_on is True:
-            # see the fight logs
-            basicConfig(level=INFO, format='%(message)s')
-        else:
-            # no logs
-            basicConfig(level=WARNING, format='%(message)s')
+            if logging_on is True:
+                # see the fight logs
+                basicConfig(level=INFO, format='%(message)s')
+            else:
+                # no logs
+                basicConfig(level=WARNING, format='%(message)s')
+            self._logging_on = logging_on
 
         self._hard_difficulty = hard_difficulty
         self._player_hit_points = self.PLAYER_INIT_HIT_POINTS
@@ -275,6 +301,20 @@ class Game(object):
         self._history = []
         self._boss_hit_points = self.BOSS_INIT_HIT_POINTS
 
+################################################################################
+
+    def _log(self, message: str, *arguments: object) -> None:
+        """
+        Logs the message only if the logging is on, so a fight without logs
+        does not format the messages at all.
+
+        :param message: message to log, with {} fields for the arguments
+        :param arguments: values to fill in the message fields
+        """
+
+        if self._logging_on is True:
+            info(message.format(*arguments))
+
 ################################################################################
 
     def _check_counters(self) -> None:
@@ -283,22 +323,22 @@ class Game(object):
         """
 
         if self._shield_timer > 0:
-            info("Shield provides additional armor.")
+            self._log("Shield provides additional armor.")
             self._armor = self.SHIELD_ARMOR
             self._shield_timer -= 1
         else:
             self._armor = self.PLAYER_INIT_ARMOR
 
         if self._poison_timer > 0:
-            info("Poison provides additional damage: {} -> {}".format(
-                self._boss_hit_points,
-                self._boss_hit_points - self.POISON_DAMAGE))
+            self._log("Poison provides additional damage: {} -> {}",
+                      self._boss_hit_points,
+                      self._boss_hit_points - self.POISON_DAMAGE)
             self._boss_hit_points -= self.POISON_DAMAGE
             self._poison_timer -= 1
 
         if self._recharge_timer > 0:
-            info("Recharge provides additional mana: {} -> {}".format(
-                self._mana, self._mana + self.RECHARGE_MANA))
+            self._log("Recharge provides additional mana: {} -> {}",
+                      self._mana, self._mana + self.RECHARGE_MANA)
             self._mana += self.RECHARGE_MANA
             self._recharge_timer -= 1
 
@@ -309,16 +349,16 @@ class Game(object):
         Cast the magic missile spell.
         """
 
-        info("Casting magic missile for {} mana: {} -> {}".format(
-            self.MAGIC_MISSILE_MANA_COST,
-            self._mana,
-            self._mana - self.MAGIC_MISSILE_MANA_COST))
+        self._log("Casting magic missile for {} mana: {} -> {}",
+                  self.MAGIC_MISSILE_MANA_COST,
+                  self._mana,
+                  self._mana - self.MAGIC_MISSILE_MANA_COST)
         self._mana -= self.MAGIC_MISSILE_MANA_COST
         self._total_mana_cost += self.MAGIC_MISSILE_MANA_COST
-        info("Damage for {}: {} -> {}".format(
-            self.MAGIC_MISSILE_DAMAGE,
-            self._boss_hit_points,
-            self._boss_hit_points - self.MAGIC_MISSILE_DAMAGE))
+        self._log("Damage for {}: {} -> {}",
+                  self.MAGIC_MISSILE_DAMAGE,
+                  self._boss_hit_points,
+                  self._boss_hit_points - self.MAGIC_MISSILE_DAMAGE)
         self._boss_hit_points -= self.MAGIC_MISSILE_DAMAGE
         self._history.append("Magic missile")
 
@@ -329,21 +369,21 @@ class Game(object):
         Cast the drain spell.
         """
 
-        info("Casting drain for {} mana: {} -> {}".format(
-            self.DRAIN_MANA_COST,
-            self._mana,
-            self._mana - self.DRAIN_MANA_COST))
+        self._log("Casting drain for {} mana: {} -> {}",
+                  self.DRAIN_MANA_COST,
+                  self._mana,
+                  self._mana - self.DRAIN_MANA_COST)
         self._mana -= self.DRAIN_MANA_COST
         self._total_mana_cost += self.DRAIN_MANA_COST
-        info("Damage for {}: {} -> {}".format(
-            self.DRAIN_DAMAGE,
-            self._boss_hit_points,
-            self._boss_hit_points - self.DRAIN_DAMAGE))
+        self._log("Damage for {}: {} -> {}",
+                  self.DRAIN_DAMAGE,
+                  self._boss_hit_points,
+                  self._boss_hit_points - self.DRAIN_DAMAGE)
         self._boss_hit_points -= self.DRAIN_DAMAGE
-        info("Heal for {}: {} -> {}".format(
-            self.DRAIN_HEAL,
-            self._player_hit_points,
-            self._player_hit_points + self.DRAIN_HEAL))
+        self._log("Heal for {}: {} -> {}",
+                  self.DRAIN_HEAL,
+                  self._player_hit_points,
+                  self._player_hit_points + self.DRAIN_HEAL)
         self._player_hit_points += self.DRAIN_HEAL
         self._history.append("Drain")
 
@@ -354,10 +394,10 @@ class Game(object):
         Cast the shield spell.
         """
 
-        info("Casting shield for {} mana: {} -> {}".format(
-            self.SHIELD_MANA_COST,
-            self._mana,
-            self._mana - self.SHIELD_MANA_COST))
+        self._log("Casting shield for {} mana: {} -> {}",
+                  self.SHIELD_MANA_COST,
+                  self._mana,
+                  self._mana - self.SHIELD_MANA_COST)
         self._mana -= self.SHIELD_MANA_COST
         self._total_mana_cost += self.SHIELD_MANA_COST
         self._shield_timer = self.SHIELD_TIMER
@@ -370,10 +410,10 @@ class Game(object):
         Cast the poison spell.
         """
 
-        info("Casting poison for {} mana: {} -> {}".format(
-            self.POISON_MANA_COST,
-            self._mana,
-            self._mana - self.POISON_MANA_COST))
+        self._log("Casting poison for {} mana: {} -> {}",
+                  self.POISON_MANA_COST,
+                  self._mana,
+                  self._mana - self.POISON_MANA_COST)
         self._mana -= self.POISON_MANA_COST
         self._total_mana_cost += self.POISON_MANA_COST
         self._poison_timer = self.POISON_TIMER
@@ -386,10 +426,10 @@ class Game(object):
         Cast the recharge spell.
         """
 
-        info("Casting recharge for {} mana: {} -> {}".format(
-            self.RECHARGE_MANA_COST,
-            self._mana,
-            self._mana - self.RECHARGE_MANA_COST))
+        self._log("Casting recharge for {} mana: {} -> {}",
+                  self.RECHARGE_MANA_COST,
+                  self._mana,
+                  self._mana - self.RECHARGE_MANA_COST)
         self._mana -= self.RECHARGE_MANA_COST
         self._total_mana_cost += self.RECHARGE_MANA_COST
         self._recharge_timer = self.RECHARGE_TIMER
@@ -402,49 +442,57 @@ def fight_random(hard_difficulty: bool,
                  goal_mana_cost: Union[int, None] = None) -> None:
     """
     Set the difficulty and play the game with a random sequence of spells.
+    Every fight is a restart of a seeded search (src.utils.stochastic), so the
+    fights can be spread over worker processes and repeated. The fights of a
+    process reuse one game. The puzzles do not search; they replay the spell
+    sequences found here, one fight each.
 
     If the goal total mana cost is stated, look for spells sequence that results
-    in a win with total mana cost equal to or less to this goal. This can result
-    in an infinite loop if the goal is set impossible (too low)!
-
-    If the goal is not stated, do a set number of fights and get the best result
-    (win with the lowest total mana cost).
+    in a win with total mana cost equal to or less to this goal; the search
+    stops at the first such fight. Otherwise get the best result of all the
+    fights (win with the lowest total mana cost).
 
     Regardless, print the total mana cost and spells sequence that lead to this
     result.
 
     :param hard_difficulty: True for puzzle 2, False for puzzle 1
     :param goal_mana_cost: if stated, look for spells sequence that results in a
-    win with total mana cost equal to or less to this goal; can result in an
-    infinite loop!
+    win with total mana cost equal to or less to this goal
     """
 
-    game = Game()
-
-    if goal_mana_cost is not None:
-        while True:
-            total_mana_cost = game.fight_random(hard_difficulty)
+    best = search("day 22 random fights",
+                  partial(_random_fight, Game(), hard_difficulty),
+                  RANDOM_FIGHTS_COUNT,
+                  None if goal_mana_cost is None
+                  else lambda fight: fight[0] <= goal_mana_cost)
 
-            if total_mana_cost <= goal_mana_cost:
-                print(total_mana_cost, ", ".join(game.history))
-                break
+    if best is None:
+        print("No fight was won")
     else:
-        min_total_mana_cost = maxsize
-        min_total_mana_cost_history = None
+        total_mana_cost, history = best
+        print(total_mana_cost, ", ".join(history))
+
 
-        for _ in range(RANDOM_FIGHTS_COUNT):
-            total_mana_cost = game.fight_random(hard_difficulty)
+################################################################################
 
-            if total_mana_cost != -1 and total_mana_cost < min_total_mana_cost:
-                min_total_mana_cost = total_mana_cost
-                min_total_mana_cost_history = game.history
+def _random_fight(game: Game, hard_difficulty: bool,
+                  rng: Random) -> Union[Tuple[int, Tuple[str, ...]], None]:
+    """
+    :param game: game reused by the fights; every fight starts a new game in it
+    :param hard_difficulty: True for puzzle 2, False for puzzle 1
+    :param rng: random generator choosing the spells
+    :return: total mana cost and spells used in case of a win, None in case of
+    a loss
+    """
 
-        print(min_total_mana_cost, ", ".join(min_total_mana_cost_history))
+    total_mana_cost = game.fight_random(hard_difficulty, rng)
+    return None if total_mana_cost == -1 else (total_mana_cost, game.history)
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=22, puzzle=1)
+def puzzle_01(input_path: str = Game.INPUT_FILE_PATH) -> int:
     """
     In this version, combat still proceeds with the player and the boss taking
     alternating turns. The player still goes first. Now, however, you don't get
@@ -486,18 +534,20 @@ def puzzle_01() -> None:
     still win the fight? (Do not include mana recharge effects as "spending"
     negative mana.)
 
-    :return: None; Answer should be 953.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 953.
     """
 
     # fight_random(hard_difficulty=False)
-    game = Game()
+    game = Game(input_path)
     total_mana_cost = game.fight_easy()
-    print_puzzle_solution(total_mana_cost)
+    return total_mana_cost
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=22, puzzle=2)
+def puzzle_02(input_path: str = Game.INPUT_FILE_PATH) -> int:
     """
     On the next run through the game, you increase the difficulty to hard.
 
@@ -507,12 +557,13 @@ def puzzle_02() -> None:
     With the same starting stats for you and the boss, what is the least amount
     of mana you can spend and still win the fight?
 
-    :return: None; Answer should be 1289.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 1289.
     """
 
     # fight_random(hard_difficulty=True)
-    game = Game()
+    game = Game(input_path)
     total_mana_cost = game.fight_hard()
-    print_puzzle_solution(total_mana_cost)
+    return total_mana_cost
 
 ################################################################################
@@ -10,14 +10,31 @@ computer itself seems to be malfunctioning. She's curious what the program does,
 and would like you to help her run it.
 """
 
+from os.path import dirname, join, realpath
 from re import compile
-from src.utils.utils import print_puzzle_solution
+from typing import NamedTuple, TextIO, Tuple, Union
+from src.utils.counters import add
+from src.utils.inputs import load_input
+from src.utils.registry import solution
+
+
+################################################################################
+
+class ProgramLine(NamedTuple):
+    """
+    One line of the program; register and offset are None if the instruction
+    does not use them.
+    """
+
+    instruction: str
+    register: Union[str, None]
+    offset: Union[int, None]
 
 
 ################################################################################
 
 class Computer(object):
-    INPUT_FILE_PATH = "src/day_23/input.txt"
+    INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
     KEY_REGISTER_A = "a"
     KEY_REGISTER_B = "b"
 
@@ -28,9 +45,10 @@ class Computer(object):
     KEY_INSTRUCTION_JIE = "jie"
     KEY_INSTRUCTION_JIO = "jio"
 
-    KEY_INSTRUCTION = "INSTRUCTION"
-    KEY_REGISTER = "REGISTER"
-    KEY_OFFSET = "OFFSET"
+    # compiled once for all the program lines
+    INSTRUCTION_PATTERN = compile(r"^(\D{3}) ")
+    REGISTER_PATTERN = compile(r" ([a|b])")
+    OFFSET_PATTERN = compile(r" ([+|-]\d+)")
 
 ################################################################################
 
@@ -59,39 +77,39 @@ class Computer(object):
 
 ################################################################################
 
-    def load_program(self) -> None:
+    def load_program(self, input_path: str = INPUT_FILE_PATH) -> None:
         """
         Loads program from the input file. Every program line is represented as
-        a dictionary with an instruction, register and offset (register and
-        offset can be None if this parameter is not used with the specific
+        a record with an instruction, register and offset (register and offset
+        can be None if this parameter is not used with the specific
         instruction).
+
+        :param input_path: puzzle input file path
+        """
+
+        self._program = load_input(input_path, self._parse_program)
+
+################################################################################
+
+    @classmethod
+    def _parse_program(cls, f: TextIO) -> Tuple[ProgramLine, ...]:
+        """
+        :param f: opened input file
+        :return: program lines
         """
 
-        with open(self.INPUT_FILE_PATH, "r") as f:
-            lines = f.readlines()
-            instruction_pattern = compile(r"^(\D{3}) ")
-            register_pattern = compile(r" ([a|b])")
-            offset_pattern = compile(r" ([+|-]\d+)")
-
-            for line in lines:
-                instruction = instruction_pattern.findall(line)[0]
-                program_line = {
-                    self.KEY_INSTRUCTION: instruction
-                }
-                try:
-                    register = register_pattern.findall(line)[0]
-                    program_line[self.KEY_REGISTER] = register
-                except IndexError:
-                    program_line[self.KEY_REGISTER] = None
-                try:
-                    offset = int(offset_pattern.findall(line)[0])
-                    program_line[self.KEY_OFFSET] = offset
-                except IndexError:
-                    program_line[self.KEY_OFFSET] = None
-
-                self._program.append(program_line)
-
-            self._program = tuple(self._program)
+        program = []
+
+        for line in f:
+            instruction = cls.INSTRUCTION_PATTERN.search(line).group(1)
+            register = cls.REGISTER_PATTERN.search(line)
+            offset = cls.OFFSET_PATTERN.search(line)
+            program.append(ProgramLine(
+                instruction,
+                None if register is None else register.group(1),
+                None if offset is None else int(offset.group(1))))
+
+        return tuple(program)
 
 ################################################################################
 
@@ -101,12 +119,15 @@ class Computer(object):
         defined.
         """
 
+        # counted once the program halts
+        executed = 0
+
         while 0 <= self._program_counter < len(self._program):
-            program_line = self._program[self._program_counter]
-            instruction = program_line[self.KEY_INSTRUCTION]
-            register = program_line[self.KEY_REGISTER]
-            offset = program_line[self.KEY_OFFSET]
+            instruction, register, offset = self._program[self._program_counter]
             self._INSTRUCTIONS[instruction](register, offset)
+            executed += 1
+
+        add("instructions executed", executed)
 
 ################################################################################
 
@@ -243,7 +264,8 @@ class Computer(object):
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=23, puzzle=1)
+def puzzle_01(input_path: str = Computer.INPUT_FILE_PATH) -> int:
     """
     The manual explains that the computer supports two registers and six
     instructions (truly, it goes on to remind the reader, a state-of-the-art
@@ -275,31 +297,34 @@ def puzzle_01() -> None:
     What is the value in register b when the program in your puzzle input is
     finished executing?
 
-    :return: None; Answer should be 307.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 307.
     """
 
     computer = Computer()
-    computer.load_program()
+    computer.load_program(input_path)
     computer.run_program()
-    print_puzzle_solution(computer.register_b)
+    return computer.register_b
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=23, puzzle=2)
+def puzzle_02(input_path: str = Computer.INPUT_FILE_PATH) -> int:
     """
     The unknown benefactor is very thankful for releasi-- er, helping little
     Jane Marie with her computer. Definitely not to distract you, what is the
     value in register b after the program is finished executing if register a
     starts as 1 instead?
 
-    :return: None; Answer should be 160.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 160.
     """
 
     computer = Computer()
-    computer.load_program()
+    computer.load_program(input_path)
     computer.register_a = 1
     computer.run_program()
-    print_puzzle_solution(computer.register_b)
+    return computer.register_b
 
 ################################################################################
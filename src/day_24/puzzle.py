@@ -1,8 +1,6 @@
 __author__ = "Jakub Franěk"
 __email__ = "tofugangsw@gmail.com"
 
-from typing import Tuple
-
 """
 --- Day 24: It Hangs in the Balance ---
 
@@ -14,12 +12,30 @@ this year.
 No pressure.
 """
 
-from numpy import prod
+from functools import partial
+from os.path import dirname, join, realpath
+from math import prod
 from sys import maxsize
-from random import sample, randint
-from src.utils.utils import print_puzzle_solution
+from typing import TextIO, Tuple, Union
+from random import Random
+from src.utils.inputs import load_input
+from src.utils.registry import solution
+from src.utils.stochastic import search
+
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
+# the random samples are split between this many independent restarts
+SAMPLE_RESTARTS = 100
+
+
+################################################################################
+
+def _parse_weights(f: TextIO) -> Tuple[int, ...]:
+    """
+    :param f: opened input file
+    :return: package weights
+    """
 
-INPUT_FILE_PATH = "src/day_24/input.txt"
+    return tuple(int(line.strip()) for line in f.readlines())
 
 
 ################################################################################
@@ -44,28 +60,56 @@ def quantum_entanglement_random(weights: Tuple[int],
     :return: minimum quantum entanglement value
     """
 
-    min_passenger_compartment_size = maxsize
-    min_quantum_entanglement = quantum_entanglement_bound
+    best = search("day 24 {} compartments".format(compartments),
+                  partial(_sample_groups, weights, compartments,
+                          loop_count // SAMPLE_RESTARTS,
+                          quantum_entanglement_bound),
+                  SAMPLE_RESTARTS)
+    return quantum_entanglement_bound if best is None else best[1]
+
+
+################################################################################
+
+def _sample_groups(weights: Tuple[int],
+                   compartments: int,
+                   loop_count: int,
+                   quantum_entanglement_bound: int,
+                   rng: Random) -> Union[Tuple[int, int], None]:
+    """
+    One restart of the random search for the passenger compartment packages.
+
+    :param weights: list of package weights
+    :param compartments: number of sleigh compartments
+    :param loop_count: number of random samples
+    :param quantum_entanglement_bound: discard all the found quantum
+    entanglements values that are over this value
+    :param rng: random generator of the restart
+    :return: number of packages and quantum entanglement of the best sample,
+    None if no sample had the desired sum
+    """
+
+    best = None
     desired_weight = sum(weights) / compartments
 
     for _ in range(loop_count):
-        sample_size = randint(1, len(weights) - 1)
-        packages = sample(weights, sample_size)
+        sample_size = rng.randint(1, len(weights) - 1)
+        packages = rng.sample(weights, sample_size)
 
         if sum(packages) == desired_weight:
-            if len(packages) <= min_passenger_compartment_size:
-                min_passenger_compartment_size = len(packages)
-                quantum_entanglement = prod(packages)
+            # fewer packages first, then lower quantum entanglement
+            group = (len(packages), prod(packages))
 
-                if quantum_entanglement < min_quantum_entanglement:
-                    min_quantum_entanglement = quantum_entanglement
+            if group[1] < quantum_entanglement_bound \
+                    and (best is None or group < best):
+                best = group
 
-    return min_quantum_entanglement
+    return best
 
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=24, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     Santa has provided you a list of the weights of every package he needs to
     fit on the sleigh. The packages need to be split into three groups of
@@ -91,18 +135,19 @@ def puzzle_01() -> None:
     What is the quantum entanglement of the first group of packages in the ideal
     configuration?
 
-    :return: None; Answer should be 10439961859.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 10439961859.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        weights = tuple(int(line.strip()) for line in f.readlines())
-        min_quantum_entanglement = quantum_entanglement_random(weights, 3)
-        print_puzzle_solution(min_quantum_entanglement)
+    weights = load_input(input_path, _parse_weights)
+    min_quantum_entanglement = quantum_entanglement_random(weights, 3)
+    return min_quantum_entanglement
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=24, puzzle=2)
+def puzzle_02(input_path: str = INPUT_FILE_PATH) -> int:
     """
     That's weird... the sleigh still isn't balancing.
 
@@ -111,12 +156,12 @@ def puzzle_02() -> None:
     Balance the sleigh again, but this time, separate the packages into four
     groups instead of three. The other constraints still apply.
 
-    :return: None; Answer should be 72050269.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 72050269.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        weights = tuple(int(line.strip()) for line in f.readlines())
-        min_quantum_entanglement = quantum_entanglement_random(weights, 4)
-        print_puzzle_solution(min_quantum_entanglement)
+    weights = load_input(input_path, _parse_weights)
+    min_quantum_entanglement = quantum_entanglement_random(weights, 4)
+    return min_quantum_entanglement
 
 ################################################################################
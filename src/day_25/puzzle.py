@@ -18,16 +18,33 @@ You look up the support number for the manufacturer and give them a call. Good
 thing, too - that 49th star wasn't going to earn itself.
 """
 
+from os.path import dirname, join, realpath
 from re import compile
-from typing import Generator, Tuple
-from src.utils.utils import print_puzzle_solution
+from typing import Generator, TextIO, Tuple
+from src.utils.inputs import load_input
+from src.utils.registry import solution
 
-INPUT_FILE_PATH = "src/day_25/input.txt"
+INPUT_FILE_PATH = join(dirname(realpath(__file__)), "input.txt")
 FIRST_CODE = 20151125
 FACTOR = 252533
 DIVIDER = 33554393
 
 
+################################################################################
+
+def _parse_coordinates(f: TextIO) -> Tuple[int, int]:
+    """
+    :param f: opened input file
+    :return: row and column of the code from the console message
+    """
+
+    message = f.read()
+    row_pattern = compile(r"row (\d+)")
+    column_pattern = compile(r"column (\d+)")
+    return (int(row_pattern.findall(message)[0]),
+            int(column_pattern.findall(message)[0]))
+
+
 ################################################################################
 
 def manual_code() -> Generator[Tuple[int, int, int], None, None]:
@@ -97,7 +114,8 @@ def manual_code() -> Generator[Tuple[int, int, int], None, None]:
 
 ################################################################################
 
-def puzzle_01() -> None:
+@solution(day=25, puzzle=1)
+def puzzle_01(input_path: str = INPUT_FILE_PATH) -> int:
     """
     "Oh, that machine is quite old!", they tell you. "That model went out of
     support six minutes ago, and we just finished shredding all of the manuals.
@@ -110,31 +128,28 @@ def puzzle_01() -> None:
     Santa looks nervous. Your puzzle input contains the message on the machine's
     console. What code do you give the machine?
 
-    :return: None; Answer should be 2650453.
+    :param input_path: puzzle input file path
+    :return: puzzle solution; Answer should be 2650453.
     """
 
-    with open(INPUT_FILE_PATH, "r") as f:
-        message = f.read()
-        row_pattern = compile(r"row (\d+)")
-        column_pattern = compile(r"column (\d+)")
-        desired_row = int(row_pattern.findall(message)[0])
-        desired_column = int(column_pattern.findall(message)[0])
-        manual_code_generator = manual_code()
+    desired_row, desired_column = load_input(input_path,
+                                             _parse_coordinates)
+    manual_code_generator = manual_code()
 
-        while True:
-            result = next(manual_code_generator)
-            code = result[0]
-            row = result[1]
-            column = result[2]
+    while True:
+        result = next(manual_code_generator)
+        code = result[0]
+        row = result[1]
+        column = result[2]
 
-            if row == desired_row and column == desired_column:
-                print_puzzle_solution(code)
-                break
+        if row == desired_row and column == desired_column:
+            return code
 
 
 ################################################################################
 
-def puzzle_02() -> None:
+@solution(day=25, puzzle=2)
+def puzzle_02() -> str:
     """
     The machine springs to life, then falls silent again. It beeps.
     "Insufficient fuel", the console reads. "Fifty stars are required before
@@ -162,6 +177,6 @@ def puzzle_02() -> None:
     any. Hover your mouse over them, and the easter egg will appear.
     """
 
-    print_puzzle_solution("Snow begins to fall.")
+    return "Snow begins to fall."
 
 ################################################################################
@@ -0,0 +1,168 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Execution backends of the grid, search and numeric days (day 6 and day 18
+lights, day 15 recipe scoring, day 20 house sums). Each of them has a
+pure-Python engine, a NumPy-vectorized engine and an engine which splits the
+work over a pool of worker processes; the backend picks one of them for every
+puzzle run in this process:
+
+    python           the pure-Python engine, always
+    numpy            the NumPy engine; NumPy must be installed
+    multiprocessing  the worker pool engine
+    auto             NumPy for inputs of at least the day's NumPy size, if
+                     installed; otherwise the worker pool for inputs of at
+                     least the day's pool size, if there is more than one core;
+                     otherwise pure Python
+
+Small inputs do not pay for importing NumPy, allocating arrays or starting
+processes that way. NumPy is never imported unless its engine runs. The pool
+engines of the grid days hand their parsed input to the workers in shared
+memory (src/utils/shared.py) instead of pickling it into every task.
+"""
+
+from contextlib import contextmanager
+from os import cpu_count
+from typing import Callable, Iterable, Iterator, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+PYTHON = "python"
+NUMPY = "numpy"
+MULTIPROCESSING = "multiprocessing"
+AUTO = "auto"
+BACKENDS = (AUTO, PYTHON, NUMPY, MULTIPROCESSING)
+
+_backend = AUTO
+# True in the worker processes of the puzzle runner and the daemon pools
+_pool_worker = False
+# None until first looked up
+_numpy_installed: Union[bool, None] = None
+
+
+################################################################################
+
+def set_backend(backend: str = AUTO) -> None:
+    """
+    :param backend: backend of the puzzles run in this process; one of
+    BACKENDS
+    """
+
+    global _backend
+
+    if backend not in BACKENDS:
+        raise ValueError("Unknown backend {}; expected one of {}".format(
+            backend, ", ".join(BACKENDS)))
+    _backend = backend
+
+
+################################################################################
+
+def requested_backend() -> str:
+    """
+    :return: backend set for the puzzles run in this process; AUTO unless
+    another one was set
+    """
+
+    return _backend
+
+
+################################################################################
+
+def set_pool_worker(pool_worker: bool = True) -> None:
+    """
+    Marks the current process as a worker of a pool which already runs
+    puzzles side by side, one per core. Its pool engines then keep to a single
+    worker; a pool of their own in every such worker would start about as
+    many processes as there are cores squared.
+
+    :param pool_worker: True in a worker of a puzzle pool
+    """
+
+    global _pool_worker
+
+    _pool_worker = pool_worker
+
+
+################################################################################
+
+def numpy_installed() -> bool:
+    """
+    :return: True if NumPy can be imported; it is looked up, not imported
+    """
+
+    global _numpy_installed
+
+    if _numpy_installed is None:
+        # imported here; only the backend selection needs to look it up
+        from importlib.util import find_spec
+        _numpy_installed = find_spec("numpy") is not None
+    return _numpy_installed
+
+
+################################################################################
+
+def available_workers() -> int:
+    """
+    :return: number of worker processes of the pool engines; 1 in the workers
+    of the puzzle pools (see set_pool_worker()) and in daemonic processes
+    (supervised puzzle runs), which can not have children
+    """
+
+    if _pool_worker:
+        return 1
+    # imported here; only the pool engines need to know about the process
+    from multiprocessing import current_process
+    if current_process().daemon:
+        return 1
+    return cpu_count() or 1
+
+
+################################################################################
+
+def select_backend(size: int, numpy_size: int, pool_size: int) -> str:
+    """
+    :param size: input size in the natural unit of the day
+    :param numpy_size: smallest input the auto backend solves with NumPy
+    :param pool_size: smallest input the auto backend solves with the worker
+    pool
+    :return: backend of the engine to run; PYTHON, NUMPY or MULTIPROCESSING
+    """
+
+    if _backend != AUTO:
+        return _backend
+    if size >= numpy_size and numpy_installed():
+        return NUMPY
+    if size >= pool_size and available_workers() > 1:
+        return MULTIPROCESSING
+    return PYTHON
+
+
+################################################################################
+
+@contextmanager
+def worker_pool() -> Iterator[Callable[[Callable[[T], R], Iterable[T]],
+                                       Iterator[R]]]:
+    """
+    Pool of worker processes of the multiprocessing engines, one per core.
+    The pool's map is lazy and keeps the order of the items; leaving the block
+    terminates the workers still running. With a single worker, the items are
+    mapped in this process instead.
+
+    :return: map function of the pool; takes a picklable function and the
+    items, returns an iterator of the results
+    """
+
+    workers = available_workers()
+    if workers == 1:
+        yield map
+        return
+
+    # imported here; the pool is not needed for the other backends
+    from multiprocessing import Pool
+    with Pool(workers) as pool:
+        yield pool.imap
+
+################################################################################
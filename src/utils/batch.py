@@ -0,0 +1,222 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Solves one day for every input file in a directory. The inputs are spread over
+a pool of worker processes and every answer is written as a JSON line as soon
+as its puzzle finishes:
+
+    {"day": 9, "puzzle": 1, "input": "inputs/001.txt", "answer": 141,
+     "wall_time": 0.012, "cpu_time": 0.012, "timed_out": false, "error": null,
+     "operations": {"permutations": 40320}}
+
+Operations are null unless counted (--count-operations). A puzzle which fails
+on an input is reported with its error and the batch goes on. Days 4, 10, 11
+and 20 have their inputs written in the source code, so there is nothing to
+batch for them.
+
+Run from the repository root:
+
+    python -m src.utils.batch 9 inputs/ -o answers.jsonl
+"""
+
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from os import listdir
+from os.path import isfile, join
+from sys import stderr, stdout
+from time import perf_counter
+from typing import Dict, TextIO, Tuple, Union
+from src.utils.backends import AUTO, BACKENDS
+from src.utils.history import DEFAULT_HISTORY_PATH
+from src.utils.inputs import DEFAULT_MEMORY_LIMIT
+from src.utils.registry import get_puzzle
+from src.utils.runner import DAYS, PUZZLES, PuzzleResult, RunOptions, \
+    run_inputs
+
+INPUT_PARAMETER = "input_path"
+
+
+################################################################################
+
+def input_files(directory: str) -> Tuple[str, ...]:
+    """
+    :param directory: directory with puzzle inputs
+    :return: paths of all regular files in the directory, sorted by name
+    """
+
+    return tuple(path for path in (join(directory, name)
+                                   for name in sorted(listdir(directory)))
+                 if isfile(path))
+
+
+################################################################################
+
+def accepts_input(day: int, puzzle: int) -> bool:
+    """
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :return: True if the puzzle can be given an input file, False if its input
+    is written in the source code
+    """
+
+    # imported here; only the batch needs to look at the signatures
+    from inspect import signature
+    return INPUT_PARAMETER in signature(get_puzzle(day, puzzle)).parameters
+
+
+################################################################################
+
+def result_fields(result: PuzzleResult) -> Dict[str, object]:
+    """
+    :param result: puzzle result
+    :return: fields of the result's JSON object
+    """
+
+    return {
+        "day": result.day,
+        "puzzle": result.puzzle,
+        "input": result.input_path,
+        "answer": result.answer,
+        "wall_time": round(result.wall_time, 6),
+        "cpu_time": round(result.cpu_time, 6),
+        "timed_out": result.timed_out,
+        "error": result.error,
+        "operations": result.operation_counts
+    }
+
+
+################################################################################
+
+def format_result(result: PuzzleResult) -> str:
+    """
+    :param result: puzzle result
+    :return: the result as a JSON line, without the line break
+    """
+
+    return dumps(result_fields(result))
+
+
+################################################################################
+
+def run_batch(day: int,
+              directory: str,
+              puzzles: Tuple[int, ...],
+              workers: Union[int, None],
+              options: RunOptions,
+              output: TextIO) -> Tuple[PuzzleResult, ...]:
+    """
+    Solves the puzzles for every input in the directory and writes the results
+    as they come.
+
+    :param day: day number (1-25)
+    :param directory: directory with puzzle inputs
+    :param puzzles: puzzle numbers to run for every input
+    :param workers: maximum number of worker processes; None uses all cores
+    :param options: run options applied to every worker
+    :param output: where to write the JSON lines
+    :return: results in the order the puzzles finished
+    """
+
+    puzzles = tuple(puzzle for puzzle in puzzles
+                    if accepts_input(day, puzzle))
+    if len(puzzles) == 0:
+        raise ValueError(
+            "Day {} has its input in the source code".format(day))
+
+    results = []
+
+    for result in run_inputs(day, puzzles, input_files(directory), workers,
+                             options._replace(catch_errors=True)):
+        output.write(format_result(result) + "\n")
+        output.flush()
+        results.append(result)
+
+    return tuple(results)
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Solve a directory of Advent of Code "
+                                        "2015 inputs")
+    parser.add_argument("day", type=int, choices=DAYS)
+    parser.add_argument("directory", help="directory with the puzzle inputs")
+    parser.add_argument("-p", "--puzzles", type=int, nargs="+",
+                        default=PUZZLES, choices=PUZZLES, metavar="PUZZLE",
+                        help="puzzles to run for each input (default: both)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("--input-cache-mb", type=float,
+                        default=DEFAULT_MEMORY_LIMIT / 2 ** 20,
+                        help="memory limit of the parsed input cache in each "
+                             "worker (MiB)")
+    parser.add_argument("-t", "--time-limit", type=float, default=None,
+                        help="cancel puzzles running longer (seconds); each "
+                             "puzzle then runs in its own process")
+    parser.add_argument("-c", "--count-operations", action="store_true",
+                        help="count hot path operations for every input")
+    parser.add_argument("--backend", choices=BACKENDS, default=AUTO,
+                        help="engine of the grid, search and numeric days "
+                             "(default: auto)")
+    parser.add_argument("-o", "--output", default=None,
+                        help="JSON lines file (default: standard output)")
+    parser.add_argument("--metrics", default=None, metavar="PATH",
+                        help="also write the results to an OpenMetrics "
+                             "(.prom) file")
+    parser.add_argument("--history", nargs="?", const=DEFAULT_HISTORY_PATH,
+                        default=None, metavar="PATH",
+                        help="append the timings to the SQLite history "
+                             "(default path: .cache/history.sqlite)")
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Solves the specified directory of inputs.
+    """
+
+    arguments = parse_arguments()
+    options = RunOptions(
+        input_cache_limit=int(arguments.input_cache_mb * 2 ** 20),
+        time_limit=arguments.time_limit,
+        count_operations=arguments.count_operations,
+        backend=arguments.backend)
+    start = perf_counter()
+
+    if arguments.output is None:
+        results = run_batch(arguments.day, arguments.directory,
+                            arguments.puzzles, arguments.workers, options,
+                            stdout)
+    else:
+        with open(arguments.output, "w") as f:
+            results = run_batch(arguments.day, arguments.directory,
+                                arguments.puzzles, arguments.workers, options,
+                                f)
+
+    elapsed = perf_counter() - start
+    failed = len(tuple(result for result in results
+                       if result.timed_out or result.error is not None))
+    solved = len(results) - failed
+
+    if arguments.metrics is not None:
+        # imported here; the export is not needed for the usual runs
+        from src.utils.metrics import write_metrics
+        write_metrics(results, arguments.metrics)
+
+    if arguments.history is not None:
+        # imported here; the history is not needed for the usual runs
+        from src.utils.history import record_results
+        record_results(results, "batch", arguments.backend, arguments.history)
+
+    print("{} solved, {} failed in {:.3f} s ({:.1f} puzzles/s)".format(
+        solved, failed, elapsed, (solved + failed) / elapsed),
+        file=stderr)
+
+################################################################################
@@ -0,0 +1,115 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Opt-in operation counters of the puzzle hot paths (hashes computed,
+permutations evaluated, fights simulated, ...). Counting is off by default;
+while it is off, add() returns right away and counted() hands the iterable
+back untouched, so the puzzles pay one function call per counted loop, not one
+per iteration. Loops counted with a local variable report it once at the end.
+
+The counts are kept per process; the runner resets them before every puzzle
+and reports them in its result.
+"""
+
+from typing import Dict, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_enabled = False
+# operation name: count
+_counts: Dict[str, int] = {}
+
+
+################################################################################
+
+def enable_counters(enabled: bool = True) -> None:
+    """
+    :param enabled: True to start counting in this process, False to stop
+    """
+
+    global _enabled
+
+    _enabled = enabled
+
+
+################################################################################
+
+def counters_enabled() -> bool:
+    """
+    :return: True if the operations are counted in this process
+    """
+
+    return _enabled
+
+
+################################################################################
+
+def reset_counters() -> None:
+    """
+    Forgets all the counts.
+    """
+
+    _counts.clear()
+
+
+################################################################################
+
+def counters() -> Dict[str, int]:
+    """
+    :return: copy of the counts; operation name: count
+    """
+
+    return dict(_counts)
+
+
+################################################################################
+
+def add(name: str, amount: int = 1) -> None:
+    """
+    :param name: operation name
+    :param amount: number of operations done
+    """
+
+    if _enabled:
+        _counts[name] = _counts.get(name, 0) + amount
+
+
+################################################################################
+
+def counted(name: str, iterable: Iterable[T]) -> Iterable[T]:
+    """
+    :param name: operation name; every item taken from the iterable is one
+    operation
+    :param iterable: iterable of a hot loop
+    :return: the iterable itself if counting is off, otherwise an iterator
+    which counts the items as they are taken
+    """
+
+    if not _enabled:
+        return iterable
+    return _count_items(name, iterable)
+
+
+################################################################################
+
+def _count_items(name: str, iterable: Iterable[T]) -> Iterator[T]:
+    """
+    Generator function that counts the items in bulk when the iteration ends,
+    even if it does not run to the end.
+
+    :param name: operation name
+    :param iterable: counted iterable
+    :return: items of the iterable
+    """
+
+    items = 0
+
+    try:
+        for item in iterable:
+            items += 1
+            yield item
+    finally:
+        add(name, items)
+
+################################################################################
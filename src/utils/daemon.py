@@ -0,0 +1,508 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Resident solver. The daemon keeps a pool of worker processes with every day
+module imported and the parsed inputs cached, and answers requests over a
+local Unix domain socket. A request is one JSON line; an input path of null,
+or none at all, solves the bundled input:
+
+    {"day": 9, "puzzle": 1, "input_path": "/abs/path/inputs/001.txt"}
+
+and every request gets one JSON line back; the fields of the batch results
+and whether the answer was cached:
+
+    {"day": 9, "puzzle": 1, "input": "/abs/path/inputs/001.txt",
+     "answer": 141, "wall_time": 0.000012, ..., "cached": true}
+
+A connection may send any number of requests; connections are served at the
+same time and their puzzles are solved by the pool. Answers are kept in memory
+for as long as the modification time and size of their input files stay the
+same, so a repeated request costs a few stat calls. Bundled inputs use the
+result cache on disk too. A puzzle which fails is reported with its error.
+There is no time limit; a stuck puzzle keeps its worker busy.
+
+Run from the repository root:
+
+    python -m src.utils.daemon -w 4
+    python -m src.utils.daemon --ask 9 1 --input inputs/001.txt
+"""
+
+from argparse import ArgumentParser, Namespace
+from collections import OrderedDict
+from json import dumps, loads
+from os import remove, stat, umask
+from os.path import dirname, exists, join, realpath
+from signal import SIGTERM, signal
+from socket import AF_UNIX, SOCK_STREAM, socket
+from socketserver import StreamRequestHandler, ThreadingUnixStreamServer
+from sys import exit
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+from src.utils.backends import AUTO, BACKENDS
+from src.utils.batch import accepts_input, result_fields
+from src.utils.inputs import DEFAULT_MEMORY_LIMIT
+from src.utils.registry import get_puzzle
+from src.utils.result_cache import SOURCE_DIRECTORY, day_files, load_result, \
+    store_result
+from src.utils.runner import DAYS, PUZZLES, PuzzleResult, RunOptions, \
+    initialize_worker, run_puzzle
+from src.utils.stochastic import DEFAULT_SEED
+from src.utils.watch import Fingerprint
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_SOCKET_PATH = join(dirname(SOURCE_DIRECTORY), ".cache", "daemon.sock")
+# the socket is created readable and writable by its owner only; anyone who
+# can connect can make the daemon read any file it can
+SOCKET_UMASK = 0o177
+# answers kept in memory; the least recently used ones are dropped first
+MAX_ANSWERS = 1024
+
+# day number, puzzle number and real input file path (None for the bundled
+# input)
+Request = Tuple[int, int, Union[str, None]]
+# input files of a request with their fingerprints and the result solved for
+# them
+Answer = Tuple[Tuple[Tuple[str, Fingerprint], ...], PuzzleResult]
+
+
+################################################################################
+
+class SolverDaemon(object):
+
+################################################################################
+
+    def __init__(self,
+                 workers: Union[int, None] = None,
+                 options: RunOptions = RunOptions(),
+                 use_result_cache: bool = True):
+        """
+        Starts the worker pool and waits until every worker has imported the
+        day modules, before any connection is served.
+
+        :param workers: number of worker processes; None uses all cores
+        :param options: run options applied to every worker
+        :param use_result_cache: if False, the result cache on disk is neither
+        read nor written
+        """
+
+        self._workers = workers
+        self._options = options._replace(catch_errors=True)
+        self._use_result_cache = use_result_cache
+        # answers in the least recently used order
+        self._answers: "OrderedDict[Request, Answer]" = OrderedDict()
+        self._lock = Lock()
+        self._executor = self._start_pool()
+
+################################################################################
+
+    def answer(self,
+               day: int,
+               puzzle: int,
+               input_path: Union[str, None] = None) -> PuzzleResult:
+        """
+        :param day: day number (1-25)
+        :param puzzle: puzzle number (1 or 2)
+        :param input_path: real input file path; None for the bundled input
+        :return: result of the puzzle; from memory or the result cache if the
+        inputs did not change since it was solved
+        """
+
+        start = perf_counter()
+        request = (day, puzzle, input_path)
+        fingerprints = self._fingerprints(day, input_path)
+
+        with self._lock:
+            known = self._answers.get(request)
+            if known is not None:
+                if known[0] == fingerprints:
+                    self._answers.move_to_end(request)
+                else:
+                    # the inputs changed; the answer is stale
+                    del self._answers[request]
+                    known = None
+        if known is not None:
+            return known[1]._replace(wall_time=perf_counter() - start,
+                                     cpu_time=0.0, cached=True)
+
+        if input_path is None and self._use_result_cache:
+            answer = load_result(day, puzzle, self._options.seed)
+            if answer is not None:
+                result = PuzzleResult(day, puzzle, perf_counter() - start,
+                                      0.0, answer, True)
+                self._remember(request, fingerprints, result)
+                return result
+
+        result = self._solve(day, puzzle, input_path)
+        if result.error is None:
+            self._remember(request, fingerprints, result)
+            if input_path is None and self._use_result_cache:
+                store_result(day, puzzle, result.answer,
+                             self._options.seed)
+        return result
+
+################################################################################
+
+    def _remember(self,
+                  request: Request,
+                  fingerprints: Tuple[Tuple[str, Fingerprint], ...],
+                  result: PuzzleResult) -> None:
+        """
+        Keeps the answer in memory, dropping the least recently used answers
+        over the limit.
+
+        :param request: day, puzzle and input file path
+        :param fingerprints: input files of the request with their fingerprints
+        :param result: result solved for the inputs
+        """
+
+        with self._lock:
+            self._answers[request] = (fingerprints, result)
+            self._answers.move_to_end(request)
+            while len(self._answers) > MAX_ANSWERS:
+                self._answers.popitem(last=False)
+
+################################################################################
+
+    def respond(self, line: bytes) -> str:
+        """
+        :param line: one request line
+        :return: JSON line of the answer, without the line break; a JSON object
+        with just the error for invalid requests
+        """
+
+        try:
+            day, puzzle, input_path = self._parse_request(line)
+        except ValueError as exception:
+            return dumps({"error": str(exception)})
+
+        result = self.answer(day, puzzle, input_path)
+        return dumps(dict(result_fields(result), cached=result.cached))
+
+################################################################################
+
+    def close(self) -> None:
+        """
+        Stops the worker pool; puzzles still being solved are abandoned.
+        """
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+################################################################################
+
+    def _start_pool(self) -> "ProcessPoolExecutor":
+        """
+        :return: worker pool with all its workers started
+        """
+
+        # imported here; the client does not need the pool
+        from concurrent.futures import ProcessPoolExecutor, wait
+        from os import cpu_count
+
+        workers = self._workers if self._workers is not None \
+            else cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=workers,
+                                       initializer=_initialize_daemon_worker,
+                                       initargs=(self._options,))
+        # one task per worker makes them all start now
+        wait([executor.submit(int) for _ in range(workers)])
+        return executor
+
+################################################################################
+
+    def _solve(self,
+               day: int,
+               puzzle: int,
+               input_path: Union[str, None]) -> PuzzleResult:
+        """
+        Solves the puzzle in the pool. A worker which dies breaks the whole
+        pool; a new one is started for the next requests.
+
+        :param day: day number (1-25)
+        :param puzzle: puzzle number (1 or 2)
+        :param input_path: real input file path; None for the bundled input
+        :return: result of the puzzle
+        """
+
+        # imported here; the client does not need the pool
+        from concurrent.futures.process import BrokenProcessPool
+
+        executor = self._executor
+        try:
+            return executor.submit(run_puzzle, day, puzzle, self._options,
+                                   input_path).result()
+        except BrokenProcessPool as exception:
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = self._start_pool()
+            return PuzzleResult(day, puzzle, 0.0, 0.0, None,
+                                input_path=input_path, error="{}: {}".format(
+                                    type(exception).__name__, exception))
+
+################################################################################
+
+    @staticmethod
+    def _fingerprints(day: int, input_path: Union[str, None]) \
+            -> Tuple[Tuple[str, Fingerprint], ...]:
+        """
+        :param day: day number (1-25)
+        :param input_path: real input file path; None for the bundled input
+        :return: every input file of the request with its modification time
+        in nanoseconds and size; None for missing files
+        """
+
+        paths = day_files(day)[0] if input_path is None else (input_path, )
+        fingerprints = []
+
+        for path in paths:
+            try:
+                status = stat(path)
+                fingerprints.append((status.st_mtime_ns, status.st_size))
+            except FileNotFoundError:
+                fingerprints.append(None)
+
+        # files added to or removed from the day directory change the paths
+        return tuple(zip(paths, fingerprints))
+
+################################################################################
+
+    @staticmethod
+    def _parse_request(line: bytes) -> Request:
+        """
+        :param line: one request line
+        :return: day number, puzzle number and real input file path of the
+        request
+        :raise ValueError: if the request is not valid
+        """
+
+        request = loads(line)
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+
+        day = request.get("day")
+        puzzle = request.get("puzzle")
+        input_path = request.get("input_path")
+        if not isinstance(day, int) or day not in DAYS \
+                or not isinstance(puzzle, int) or puzzle not in PUZZLES:
+            raise ValueError("No puzzle {} of day {}".format(puzzle, day))
+        if input_path is not None:
+            if not isinstance(input_path, str):
+                raise ValueError("Input path must be a string or null")
+            if not accepts_input(day, puzzle):
+                raise ValueError(
+                    "Day {} has its input in the source code".format(day))
+            input_path = realpath(input_path)
+
+        return day, puzzle, input_path
+
+
+################################################################################
+
+class _RequestHandler(StreamRequestHandler):
+
+################################################################################
+
+    def handle(self) -> None:
+        """
+        Answers the request lines of one connection in order.
+        """
+
+        for line in self.rfile:
+            if len(line.strip()) == 0:
+                continue
+            response = self.server.solver.respond(line)
+            self.wfile.write((response + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+################################################################################
+
+class SolverServer(ThreadingUnixStreamServer):
+    # connection threads do not keep the daemon from stopping
+    daemon_threads = True
+
+################################################################################
+
+    def __init__(self, socket_path: str, solver: SolverDaemon):
+        """
+        :param socket_path: Unix domain socket path
+        :param solver: daemon which answers the requests
+        """
+
+        self.solver = solver
+        super().__init__(socket_path, _RequestHandler)
+
+################################################################################
+
+    def server_bind(self) -> None:
+        """
+        Creates the socket file with the 0o600 permissions; it is never
+        accessible to others, not even between binding and a chmod.
+        """
+
+        previous_umask = umask(SOCKET_UMASK)
+        try:
+            super().server_bind()
+        finally:
+            umask(previous_umask)
+
+
+################################################################################
+
+def _initialize_daemon_worker(options: RunOptions) -> None:
+    """
+    Applies the run options to the worker process and imports every day
+    module.
+
+    :param options: run options
+    """
+
+    initialize_worker(options, pool_worker=True)
+    for day in DAYS:
+        for puzzle in PUZZLES:
+            get_puzzle(day, puzzle)
+
+
+################################################################################
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """
+    Removes the socket file of a daemon which is gone.
+
+    :param socket_path: Unix domain socket path
+    :raise RuntimeError: if a daemon still listens on the socket
+    """
+
+    if not exists(socket_path):
+        return
+
+    with socket(AF_UNIX, SOCK_STREAM) as connection:
+        try:
+            connection.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            remove(socket_path)
+            return
+    raise RuntimeError("A daemon already listens on {}".format(socket_path))
+
+
+################################################################################
+
+def serve(socket_path: str = DEFAULT_SOCKET_PATH,
+          workers: Union[int, None] = None,
+          options: RunOptions = RunOptions(),
+          use_result_cache: bool = True) -> None:
+    """
+    Answers requests until interrupted or terminated, then removes the socket.
+
+    :param socket_path: Unix domain socket path
+    :param workers: number of worker processes; None uses all cores
+    :param options: run options applied to every worker
+    :param use_result_cache: if False, the result cache on disk is neither
+    read nor written
+    """
+
+    # imported here; only the daemon creates the socket directory
+    from os import makedirs
+
+    makedirs(dirname(socket_path), exist_ok=True)
+    _remove_stale_socket(socket_path)
+    solver = SolverDaemon(workers, options, use_result_cache)
+    # terminating the daemon cleans up as an interrupt does
+    signal(SIGTERM, lambda signal_number, frame: exit(0))
+
+    try:
+        with SolverServer(socket_path, solver) as server:
+            server.serve_forever()
+    finally:
+        solver.close()
+        if exists(socket_path):
+            remove(socket_path)
+
+
+################################################################################
+
+def ask(day: int,
+        puzzle: int,
+        input_path: Union[str, None] = None,
+        socket_path: str = DEFAULT_SOCKET_PATH) -> Dict[str, object]:
+    """
+    Client side of the daemon.
+
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :param input_path: puzzle input file path; None for the bundled input
+    :param socket_path: Unix domain socket path of the daemon
+    :return: fields of the daemon's answer
+    """
+
+    with socket(AF_UNIX, SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        connection.sendall((dumps({
+            "day": day,
+            "puzzle": puzzle,
+            "input_path": None if input_path is None else realpath(input_path)
+        }) + "\n").encode("utf-8"))
+        with connection.makefile("rb") as f:
+            return loads(f.readline())
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Resident Advent of Code 2015 solver "
+                                        "on a Unix domain socket")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH,
+                        help="socket path (default: .cache/daemon.sock)")
+    parser.add_argument("--ask", type=int, nargs=2, default=None,
+                        metavar=("DAY", "PUZZLE"),
+                        help="ask the running daemon for an answer instead "
+                             "of starting one")
+    parser.add_argument("--input", default=None,
+                        help="input file path of the --ask request (default: "
+                             "the bundled input)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("--input-cache-mb", type=float,
+                        default=DEFAULT_MEMORY_LIMIT / 2 ** 20,
+                        help="memory limit of the parsed input cache in each "
+                             "worker (MiB)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="neither use nor store cached solutions on disk")
+    parser.add_argument("--backend", choices=BACKENDS, default=AUTO,
+                        help="engine of the grid, search and numeric days "
+                             "(default: auto)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="random seed of the puzzles solved by random "
+                             "search (days 19 and 24)")
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Starts the daemon, or asks it for an answer.
+    """
+
+    arguments = parse_arguments()
+
+    if arguments.ask is not None:
+        print(dumps(ask(arguments.ask[0], arguments.ask[1], arguments.input,
+                        arguments.socket)))
+    else:
+        try:
+            serve(arguments.socket, arguments.workers, RunOptions(
+                input_cache_limit=int(arguments.input_cache_mb * 2 ** 20),
+                seed=arguments.seed,
+                backend=arguments.backend), not arguments.no_cache)
+        except KeyboardInterrupt:
+            exit(0)
+
+################################################################################
@@ -0,0 +1,740 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Synthetic puzzle inputs of any size. Every generated input has the same format
+as the bundled input of its day and the same random seed always produces the
+same input, so benchmarks on generated inputs are repeatable.
+
+The size of an input is given either directly, in the natural unit of the day
+(characters, lines, nodes, grid side length, ...), or as a scale factor of the
+bundled input size. Days 4, 10, 11 and 20 have their inputs written in the
+source code, so there is nothing to generate for them.
+
+Run from the repository root:
+
+    python -m src.utils.generators 9 --size 10 --seed 1 -o /tmp/day_09.txt
+    python -m src.utils.generators 1 --scale 1000 -o /tmp/day_01.txt
+"""
+
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from os import replace
+from os.path import dirname, join, realpath
+from random import Random
+from re import compile
+from string import ascii_lowercase, ascii_uppercase
+from typing import Callable, Dict, Iterator, List, Union
+
+SOURCE_DIRECTORY = dirname(dirname(realpath(__file__)))
+DEFAULT_SEED = 2015
+DEFAULT_JSON_DEPTH = 6
+CHUNK_SIZE = 64 * 1024
+TEMPORARY_SUFFIX = ".tmp"
+
+# size of the bundled input of every day in the natural unit of the day; scale
+# factor 1 generates an input of this size
+BUNDLED_SIZES = {
+    1: 7000,     # characters
+    2: 1000,     # boxes
+    3: 8192,     # characters
+    5: 1000,     # strings
+    6: 1000,     # grid side length
+    7: 339,      # wires
+    8: 300,      # string literals
+    9: 8,        # locations
+    12: 3000,    # JSON values
+    13: 8,       # guests
+    14: 9,       # reindeer
+    15: 4,       # ingredients
+    16: 500,     # aunts
+    17: 20,      # containers
+    18: 100,     # grid side length
+    19: 195,     # replacement steps
+    21: 103,     # boss hit points
+    22: 55,      # boss hit points
+    23: 40,      # instructions setting up register a
+    24: 28,      # packages
+    25: 3000     # row of the requested code
+}
+
+
+################################################################################
+
+def _name(index: int, alphabet: str = ascii_lowercase) -> str:
+    """
+    :param index: name number
+    :param alphabet: letters to use
+    :return: unique name made of letters only (a, b, ..., z, aa, ab, ...)
+    """
+
+    name = ""
+    index += 1
+
+    while index > 0:
+        index, remainder = divmod(index - 1, len(alphabet))
+        name = alphabet[remainder] + name
+
+    return name
+
+
+################################################################################
+
+def _capitalized_name(index: int) -> str:
+    """
+    :param index: name number
+    :return: unique capitalized name made of letters only, without digits or
+    the word "to" (day 9 splits the lines by it)
+    """
+
+    return _name(index, ascii_uppercase).capitalize() + "x"
+
+
+################################################################################
+
+def _brackets(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 1: random stream of floor up and floor down instructions. Santa always
+    ends up in the basement at some point.
+
+    :param rng: random numbers generator
+    :param size: number of characters
+    :return: input chunks
+    """
+
+    floor = 0
+    basement = False
+    written = 0
+
+    while written < size:
+        chunk = "".join(rng.choices("()", k=min(CHUNK_SIZE, size - written)))
+        for character in chunk:
+            floor += 1 if character == "(" else -1
+            basement = basement or floor < 0
+        written += len(chunk)
+        if written >= size and not basement:
+            chunk += ")" * (floor + 1)
+        yield chunk
+
+
+################################################################################
+
+def _boxes(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 2: box dimensions.
+
+    :param rng: random numbers generator
+    :param size: number of boxes
+    :return: input lines
+    """
+
+    for i in range(size):
+        yield "{}x{}x{}{}".format(rng.randint(1, 30), rng.randint(1, 30),
+                                  rng.randint(1, 30),
+                                  "\n" if i < size - 1 else "")
+
+
+################################################################################
+
+def _directions(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 3: directions from the elf.
+
+    :param rng: random numbers generator
+    :param size: number of characters
+    :return: input chunks
+    """
+
+    for start in range(0, size, CHUNK_SIZE):
+        yield "".join(rng.choices("^v<>", k=min(CHUNK_SIZE, size - start)))
+
+
+################################################################################
+
+def _strings(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 5: naughty or nice strings.
+
+    :param rng: random numbers generator
+    :param size: number of strings
+    :return: input lines
+    """
+
+    for _ in range(size):
+        yield "".join(rng.choices(ascii_lowercase, k=16)) + "\n"
+
+
+################################################################################
+
+def _light_instructions(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 6: light instructions over a square grid.
+
+    :param rng: random numbers generator
+    :param size: grid side length
+    :return: input lines
+    """
+
+    for _ in range(300):
+        left, right = sorted(rng.randrange(size) for _ in range(2))
+        top, bottom = sorted(rng.randrange(size) for _ in range(2))
+        yield "{} {},{} through {},{}\n".format(
+            rng.choice(("turn on", "turn off", "toggle")),
+            left, top, right, bottom)
+
+
+################################################################################
+
+def _circuit(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 7: circuit of wires and gates in random order. Wire b gets a direct
+    signal and wire a is connected to the last wire, so the circuit can be
+    overridden the same way as the bundled one.
+
+    A chain of wires carries the signal of b to a. Its links are plain
+    connections, NOT gates and rotations made of shift and OR gates, each
+    masked back to 16 bits by an AND gate, so no link loses any bit of the
+    signal. The other wires get random gates on the wires of the chain.
+
+    :param rng: random numbers generator
+    :param size: number of wires
+    :return: input lines
+    """
+
+    # names "a" and "b" (0 and 1) are reserved
+    wires = [_name(i + 2) for i in range(max(size - 2, 2))]
+    lines = ["{} -> b\n".format(rng.randrange(65536)),
+             "b -> {}\n".format(wires[0]),
+             "{} -> {}\n".format(rng.randrange(65536), wires[1])]
+    # wires with a 16-bit signal; the first one is the end of the chain
+    chain = wires[0]
+    signals = [wires[0], wires[1]]
+    i = 2
+
+    while i < len(wires):
+        x = chain
+        left = len(wires) - i
+        link = rng.randrange(4)
+        if link == 0 and left >= 2:
+            lines += ["NOT {} -> {}\n".format(x, wires[i]),
+                      "65535 AND {} -> {}\n".format(wires[i], wires[i + 1])]
+            chain = wires[i + 1]
+            i += 2
+        elif link == 1 and left >= 4:
+            shift = rng.randint(1, 15)
+            lines += ["{} LSHIFT {} -> {}\n".format(x, shift, wires[i]),
+                      "{} RSHIFT {} -> {}\n".format(x, 16 - shift,
+                                                     wires[i + 1]),
+                      "{} OR {} -> {}\n".format(wires[i], wires[i + 1],
+                                                 wires[i + 2]),
+                      "65535 AND {} -> {}\n".format(wires[i + 2],
+                                                     wires[i + 3])]
+            chain = wires[i + 3]
+            i += 4
+        elif link == 2:
+            lines.append("{} -> {}\n".format(x, wires[i]))
+            chain = wires[i]
+            i += 1
+        else:
+            # a branch off the chain; nothing reads it
+            x = rng.choice(signals)
+            y = rng.choice(signals)
+            lines.append(rng.choice((
+                "{} AND {} -> {}\n".format(x, y, wires[i]),
+                "{} OR {} -> {}\n".format(x, y, wires[i]),
+                "1 AND {} -> {}\n".format(x, wires[i]),
+                "{} LSHIFT {} -> {}\n".format(x, rng.randint(1, 3), wires[i]),
+                "{} RSHIFT {} -> {}\n".format(x, rng.randint(1, 15),
+                                               wires[i]),
+                "NOT {} -> {}\n".format(x, wires[i]),
+                "{} -> {}\n".format(x, wires[i]))))
+            i += 1
+            continue
+        signals.append(chain)
+
+    lines.append("{} -> a\n".format(chain))
+    rng.shuffle(lines)
+    yield from lines
+
+
+################################################################################
+
+def _string_literals(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 8: double-quoted string literals with escape sequences.
+
+    :param rng: random numbers generator
+    :param size: number of string literals
+    :return: input lines
+    """
+
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(1, 30)):
+            kind = rng.random()
+            if kind < 0.05:
+                parts.append("\\\\")
+            elif kind < 0.1:
+                parts.append("\\\"")
+            elif kind < 0.15:
+                parts.append("\\x{:02x}".format(rng.randrange(256)))
+            else:
+                parts.append(rng.choice(ascii_lowercase))
+        yield "\"{}\"\n".format("".join(parts))
+
+
+################################################################################
+
+def _distances(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 9: distances between every pair of locations.
+
+    :param rng: random numbers generator
+    :param size: number of locations
+    :return: input lines
+    """
+
+    locations = [_capitalized_name(i) for i in range(size)]
+
+    for i in range(size):
+        for j in range(i + 1, size):
+            yield "{} to {} = {}\n".format(
+                locations[i], locations[j], rng.randint(1, 150))
+
+
+################################################################################
+
+def _json_value(rng: Random, budget: List[int], depth: int) \
+        -> Union[Dict, List, int, str]:
+    """
+    :param rng: random numbers generator
+    :param budget: number of values still to be generated (shared by the
+    whole document)
+    :param depth: remaining nesting depth
+    :return: JSON value; nested objects and arrays while depth and budget allow
+    """
+
+    budget[0] -= 1
+    kind = rng.random()
+
+    if depth > 0 and budget[0] > 0 and kind < 0.3:
+        length = rng.randint(1, 8)
+        if kind < 0.15:
+            return {ascii_lowercase[i]: _json_value(rng, budget, depth - 1)
+                    for i in range(length)}
+        return [_json_value(rng, budget, depth - 1) for _ in range(length)]
+    if kind < 0.7:
+        return rng.randint(-50, 200)
+    return rng.choice(("red", "green", "blue", "orange", "violet", "yellow"))
+
+
+################################################################################
+
+def _json_document(rng: Random, size: int, depth: int = DEFAULT_JSON_DEPTH) \
+        -> Iterator[str]:
+    """
+    Day 12: JSON document of arrays, objects, numbers and strings.
+
+    :param rng: random numbers generator
+    :param size: approximate number of values
+    :param depth: maximum nesting depth
+    :return: input
+    """
+
+    budget = [size]
+    document = []
+
+    while budget[0] > 0:
+        document.append(_json_value(rng, budget, depth))
+
+    yield dumps(document, separators=(",", ":"))
+
+
+################################################################################
+
+def _happiness(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 13: happiness changes of every guest next to every other guest.
+
+    :param rng: random numbers generator
+    :param size: number of guests
+    :return: input lines
+    """
+
+    guests = [_capitalized_name(i) for i in range(size)]
+
+    for guest in guests:
+        for neighbour in guests:
+            if guest != neighbour:
+                yield "{} would {} {} happiness units by sitting next to " \
+                      "{}.\n".format(guest, rng.choice(("gain", "lose")),
+                                     rng.randint(1, 100), neighbour)
+
+
+################################################################################
+
+def _reindeer(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 14: reindeer descriptions.
+
+    :param rng: random numbers generator
+    :param size: number of reindeer
+    :return: input lines
+    """
+
+    for i in range(size):
+        yield "{} can fly {} km/s for {} seconds, but then must rest for {} " \
+              "seconds.\n".format(_capitalized_name(i), rng.randint(2, 30),
+                                  rng.randint(2, 20), rng.randint(20, 170))
+
+
+################################################################################
+
+def _ingredients(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 15: ingredients and their properties per teaspoon. Two ingredients
+    are planted with 5 - d and 5 + d calories, so half of the teaspoons of
+    each always makes a recipe of exactly 500 calories for puzzle 2.
+
+    :param rng: random numbers generator
+    :param size: number of ingredients
+    :return: input lines
+    """
+
+    calories = [rng.randint(1, 9) for _ in range(size)]
+    if size >= 2:
+        first, second = rng.sample(range(size), 2)
+        difference = rng.randint(0, 4)
+        calories[first] = 5 - difference
+        calories[second] = 5 + difference
+
+    for i in range(size):
+        yield "{}: capacity {}, durability {}, flavor {}, texture {}, " \
+              "calories {}\n".format(_capitalized_name(i),
+                                     *(rng.randint(-3, 5) for _ in range(4)),
+                                     calories[i])
+
+
+################################################################################
+
+def _aunts(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 16: things remembered about every aunt. Two aunts are planted, one
+    matching the MFCSAM output exactly and one matching it by the ranges of
+    puzzle 2; each of them matches only by the rules of its own puzzle. Every
+    other aunt has a compound that matches by neither rules, so both answers
+    are unique.
+
+    :param rng: random numbers generator
+    :param size: number of aunts
+    :return: input lines
+    """
+
+    output = {"children": 3, "cats": 7, "samoyeds": 2, "pomeranians": 3,
+              "akitas": 0, "vizslas": 0, "goldfish": 5, "trees": 3, "cars": 2,
+              "perfumes": 1}
+    # compounds read as ranges by puzzle 2; cats and trees are greater than
+    # the output, pomeranians and goldfish fewer
+    greater = ("cats", "trees")
+    fewer = ("pomeranians", "goldfish")
+    # values of every compound that match neither the output exactly nor its
+    # range
+    wrong = {compound: [value for value in range(11)
+                        if value != count
+                        and not (compound in greater and value > count)
+                        and not (compound in fewer and value < count)]
+             for compound, count in output.items()}
+    exact, ranges = rng.sample(range(size), 2)
+
+    for i in range(size):
+        compounds = rng.sample(sorted(output), 3)
+        if i == exact:
+            # the exact count of a range compound fails puzzle 2
+            if not any(compound in greater + fewer for compound in compounds):
+                compounds[0] = rng.choice(greater + fewer)
+            values = [output[compound] for compound in compounds]
+        elif i == ranges:
+            compounds = ["cats", "trees", "goldfish"]
+            values = [output["cats"] + 2, output["trees"] + 2,
+                      output["goldfish"] - 2]
+        else:
+            values = [rng.choice(wrong[compounds[0]])] + \
+                     [rng.randint(0, 10) for _ in compounds[1:]]
+        yield "Sue {}: {}\n".format(i + 1, ", ".join(
+            "{}: {}".format(compound, value)
+            for compound, value in zip(compounds, values)))
+
+
+################################################################################
+
+def _containers(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 17: container capacities.
+
+    :param rng: random numbers generator
+    :param size: number of containers
+    :return: input lines
+    """
+
+    for _ in range(size):
+        yield "{}\n".format(rng.randint(1, 50))
+
+
+################################################################################
+
+def _lights_grid(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 18: initial configuration of a square grid of lights.
+
+    :param rng: random numbers generator
+    :param size: grid side length
+    :return: input lines
+    """
+
+    for _ in range(size):
+        yield "".join(rng.choices("#.", k=size)) + "\n"
+
+
+################################################################################
+
+def _medicine(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 19: replacement rules of the bundled input and a medicine molecule
+    built from one electron by applying random rules, always to the leftmost
+    element that has any. Molecules built in any other order are rarely
+    reduced back to the electron by the randomized search of puzzle 2.
+
+    :param rng: random numbers generator
+    :param size: number of replacement steps
+    :return: input lines
+    """
+
+    with open(join(SOURCE_DIRECTORY, "day_19", "input.txt"), "r") as f:
+        rule_lines = f.readlines()[:-2]
+
+    rules = {}
+    for line in rule_lines:
+        left, right = line.strip().split(" => ")
+        rules.setdefault(left, []).append(right)
+
+    element_pattern = compile(r"[A-Z][a-z]?|e")
+    molecule = ["e"]
+    # everything left of the leftmost replaceable element stays as it is
+    i = 0
+
+    for _ in range(size):
+        while i < len(molecule) and molecule[i] not in rules:
+            i += 1
+        if i == len(molecule):
+            break
+        molecule[i:i + 1] = element_pattern.findall(
+            rng.choice(rules[molecule[i]]))
+
+    yield from rule_lines
+    yield "\n"
+    yield "".join(molecule) + "\n"
+
+
+################################################################################
+
+def _boss_21(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 21: boss stats.
+
+    :param rng: random numbers generator
+    :param size: boss hit points
+    :return: input lines
+    """
+
+    yield "Hit Points: {}\nDamage: {}\nArmor: {}\n".format(
+        size, rng.randint(5, 10), rng.randint(1, 4))
+
+
+################################################################################
+
+def _boss_22(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 22: boss stats.
+
+    :param rng: random numbers generator
+    :param size: boss hit points
+    :return: input lines
+    """
+
+    yield "Hit Points: {}\nDamage: {}\n".format(size, rng.randint(5, 10))
+
+
+################################################################################
+
+def _program(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 23: program with the structure of the bundled one; register a is set
+    up differently for a starting at 0 and at 1, then the Collatz sequence of
+    register a is counted in register b. The program always finishes.
+
+    :param rng: random numbers generator
+    :param size: number of instructions setting up register a
+    :return: input lines
+    """
+
+    first = ["inc a"] + [rng.choice(("inc a", "tpl a"))
+                         for _ in range(max(size // 2 - 1, 0))]
+    second = [rng.choice(("inc a", "tpl a"))
+              for _ in range(max(size - len(first), 1))]
+    lines = (["jio a, +{}".format(len(first) + 2)] + first
+             + ["jmp +{}".format(len(second) + 1)] + second
+             + ["jio a, +8", "inc b", "jie a, +4", "tpl a", "inc a", "jmp +2",
+                "hlf a", "jmp -7"])
+    yield "\n".join(lines) + "\n"
+
+
+################################################################################
+
+def _packages(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 24: package weights which can be split both into three and into four
+    groups of the same weight; they are built from twelve groups of the same
+    weight.
+
+    :param rng: random numbers generator
+    :param size: number of packages (at least 12)
+    :return: input lines
+    """
+
+    size = max(size, 12)
+    group_sizes = [size // 12 + (1 if i < size % 12 else 0) for i in range(12)]
+    target = 10 * max(group_sizes) + rng.randint(0, 100)
+    weights = []
+
+    for group_size in group_sizes:
+        cuts = sorted(rng.sample(range(1, target), group_size - 1))
+        weights += [end - start
+                    for start, end in zip([0] + cuts, cuts + [target])]
+
+    for weight in sorted(weights):
+        yield "{}\n".format(weight)
+
+
+################################################################################
+
+def _console_message(rng: Random, size: int) -> Iterator[str]:
+    """
+    Day 25: console message with the requested row and column.
+
+    :param rng: random numbers generator
+    :param size: row of the requested code
+    :return: input
+    """
+
+    yield "To continue, please consult the code grid in the manual.  Enter " \
+          "the code at row {}, column {}.\n".format(
+            size, max(size + rng.randint(-100, 100), 1))
+
+
+################################################################################
+
+GENERATORS: Dict[int, Callable[..., Iterator[str]]] = {
+    1: _brackets,
+    2: _boxes,
+    3: _directions,
+    5: _strings,
+    6: _light_instructions,
+    7: _circuit,
+    8: _string_literals,
+    9: _distances,
+    12: _json_document,
+    13: _happiness,
+    14: _reindeer,
+    15: _ingredients,
+    16: _aunts,
+    17: _containers,
+    18: _lights_grid,
+    19: _medicine,
+    21: _boss_21,
+    22: _boss_22,
+    23: _program,
+    24: _packages,
+    25: _console_message
+}
+
+
+################################################################################
+
+def scaled_size(day: int, scale: float) -> int:
+    """
+    :param day: day number
+    :param scale: scale factor of the bundled input size
+    :return: input size in the natural unit of the day
+    """
+
+    return max(round(BUNDLED_SIZES[day] * scale), 1)
+
+
+################################################################################
+
+def write_input(day: int,
+                path: str,
+                size: int,
+                seed: int = DEFAULT_SEED,
+                **options) -> None:
+    """
+    Writes a synthetic input of the day to a file.
+
+    :param day: day number
+    :param path: output file path
+    :param size: input size in the natural unit of the day
+    :param seed: random seed; the same seed always gives the same input
+    :param options: additional day specific options (depth for day 12)
+    """
+
+    try:
+        generator = GENERATORS[day]
+    except KeyError:
+        raise ValueError("Day {} has no input file to generate".format(day))
+
+    # written next to the target first, so a bundled input can be overwritten
+    # with its generated variant (day 19 reads its rules from the bundled one)
+    temporary_path = path + TEMPORARY_SUFFIX
+    with open(temporary_path, "w") as f:
+        for chunk in generator(Random(seed), size, **options):
+            f.write(chunk)
+    replace(temporary_path, path)
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Synthetic Advent of Code 2015 inputs")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--size", type=int,
+                      help="input size in the natural unit of the day")
+    size.add_argument("--scale", type=float, default=1.0,
+                      help="scale factor of the bundled input size")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--depth", type=int, default=DEFAULT_JSON_DEPTH,
+                        help="maximum nesting depth of the day 12 document")
+    parser.add_argument("-o", "--output", required=True)
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Writes the specified synthetic input.
+    """
+
+    arguments = parse_arguments()
+    write_input(arguments.day,
+                arguments.output,
+                arguments.size if arguments.size is not None
+                else scaled_size(arguments.day, arguments.scale),
+                arguments.seed,
+                **({"depth": arguments.depth} if arguments.day == 12 else {}))
+
+################################################################################
@@ -0,0 +1,400 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Timing history of the puzzle runs in a local SQLite database. The runner, the
+batch solver and the benchmark suite append their results with --history, one
+row per puzzle run:
+
+    recorded_at     UTC time of the run (ISO 8601)
+    source          runner, batch or benchmark
+    git_commit      checked out commit, with a -dirty suffix if the tracked
+                    files differ from it; NULL outside a git work tree
+    python_version  version of the interpreter
+    day, puzzle     puzzle
+    input           "bundled" or the path of the input file
+    backend         backend the run was started with (auto, python, ...)
+    duration        wall time (seconds)
+    peak_memory     peak allocated memory (bytes); NULL unless measured
+
+Cached answers, timed out and failed runs are not recorded; they do not time
+the solver. The report compares two selections of the history, each given as
+a commit (prefix) or a date range FROM..TO (UTC dates, both inclusive, either
+may be left out), and lists the puzzles whose median duration or peak memory
+changed by more than the threshold. A duration change must also exceed the
+noise of both selections (their median absolute deviations) and
+--min-seconds.
+
+Run from the repository root:
+
+    python advent_of_code_2015.py -d 6 18 --history
+    python -m src.utils.history 1473407 HEAD
+    python -m src.utils.history 2026-10-01..2026-10-07 2026-10-08..
+"""
+
+from argparse import ArgumentParser, Namespace
+from os import makedirs
+from os.path import dirname, join, realpath
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, \
+    Sequence, Tuple, Union
+from src.utils.runner import PuzzleResult
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+REPOSITORY_ROOT = dirname(dirname(dirname(realpath(__file__))))
+DEFAULT_HISTORY_PATH = join(REPOSITORY_ROOT, ".cache", "history.sqlite")
+DIRTY_SUFFIX = "-dirty"
+BUNDLED = "bundled"
+RANGE_SEPARATOR = ".."
+# the commit the working tree is on; resolved before the history is searched
+HEAD = "HEAD"
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_MIN_SECONDS = 0.001
+DURATION = "duration"
+PEAK_MEMORY = "peak memory"
+# quantity: words for a decrease and an increase
+DIRECTIONS = {
+    DURATION: ("FASTER", "SLOWER"),
+    PEAK_MEMORY: ("SMALLER", "LARGER")
+}
+CHANGE_LINE = "{:<7} {:02d}/{} {} ({}) {}: {} -> {} ({:+.1%}, {} vs {} runs)"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    recorded_at TEXT NOT NULL,
+    source TEXT NOT NULL,
+    git_commit TEXT,
+    python_version TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    puzzle INTEGER NOT NULL,
+    input TEXT NOT NULL,
+    backend TEXT NOT NULL,
+    duration REAL NOT NULL,
+    peak_memory INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_git_commit ON runs (git_commit);
+CREATE INDEX IF NOT EXISTS runs_recorded_at ON runs (recorded_at);
+"""
+INSERT_STATEMENT = "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+SELECT_STATEMENT = ("SELECT day, puzzle, input, backend, duration, peak_memory "
+                    "FROM runs WHERE {}")
+COMMIT_CONDITION = "git_commit LIKE ?"
+FROM_CONDITION = "recorded_at >= ?"
+TO_CONDITION = "recorded_at < ?"
+
+# day, puzzle, input and backend of a run
+RunKey = Tuple[int, int, str, str]
+
+
+################################################################################
+
+class Change(NamedTuple):
+    """
+    Significant change of one puzzle between two selections of the history.
+    """
+
+    key: RunKey
+    # duration or peak memory
+    quantity: str
+    baseline: float
+    candidate: float
+    baseline_runs: int
+    candidate_runs: int
+
+    @property
+    def relative_change(self) -> float:
+        """
+        :return: relative change of the median (0.1 means 10 % more)
+        """
+
+        return self.candidate / self.baseline - 1
+
+    def __str__(self) -> str:
+        """
+        :return: the change in a human readable form
+        """
+
+        if self.quantity == DURATION:
+            values = ("{:.4f} s".format(self.baseline),
+                      "{:.4f} s".format(self.candidate))
+        else:
+            values = ("{:.0f} KiB".format(self.baseline / 2 ** 10),
+                      "{:.0f} KiB".format(self.candidate / 2 ** 10))
+        return CHANGE_LINE.format(
+            DIRECTIONS[self.quantity][self.relative_change > 0], *self.key,
+            self.quantity, *values,
+            self.relative_change, self.baseline_runs, self.candidate_runs)
+
+
+################################################################################
+
+def _git(*arguments: str) -> Union[str, None]:
+    """
+    :param arguments: git command line arguments
+    :return: standard output of the command without the trailing newline;
+    None if git is missing or the command failed
+    """
+
+    # imported here; git is only asked when the history is used
+    from subprocess import DEVNULL, run
+    try:
+        process = run(("git", ) + arguments, cwd=REPOSITORY_ROOT,
+                      capture_output=True, text=True, stdin=DEVNULL)
+    except OSError:
+        return None
+    return process.stdout.strip() if process.returncode == 0 else None
+
+
+################################################################################
+
+def current_commit() -> Union[str, None]:
+    """
+    :return: hash of the checked out commit, with DIRTY_SUFFIX if the tracked
+    files differ from it; None outside a git work tree
+    """
+
+    commit = _git("rev-parse", "HEAD")
+    if commit is None:
+        return None
+    # git diff --quiet fails (None) when there are differences
+    return commit if _git("diff", "--quiet", "HEAD") is not None \
+        else commit + DIRTY_SUFFIX
+
+
+################################################################################
+
+def _connect(path: str) -> "Connection":
+    """
+    :param path: history database path
+    :return: connection to the database; the table is created if missing
+    """
+
+    # imported here; the database is not needed for the usual runs
+    from sqlite3 import connect
+    makedirs(dirname(realpath(path)), exist_ok=True)
+    connection = connect(path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+################################################################################
+
+def record_results(results: Iterable[PuzzleResult],
+                   source: str,
+                   backend: str,
+                   path: str = DEFAULT_HISTORY_PATH) -> int:
+    """
+    Appends the solver runs among the results to the history. Cached answers,
+    timed out and failed runs are left out.
+
+    :param results: puzzle results
+    :param source: what ran the puzzles (runner, batch, benchmark, ...)
+    :param backend: backend the puzzles were run with
+    :param path: history database path
+    :return: number of recorded runs
+    """
+
+    # imported here; the clock and the platform are not needed for the usual
+    # runs
+    from datetime import datetime, timezone
+    from platform import python_version
+    recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    commit = current_commit()
+    version = python_version()
+    rows = [(recorded_at, source, commit, version, result.day, result.puzzle,
+             BUNDLED if result.input_path is None else result.input_path,
+             backend, result.wall_time, result.peak_memory)
+            for result in results
+            if not result.cached and not result.timed_out
+            and result.error is None]
+
+    connection = _connect(path)
+    try:
+        with connection:
+            connection.executemany(INSERT_STATEMENT, rows)
+    finally:
+        connection.close()
+    return len(rows)
+
+
+################################################################################
+
+def selection_condition(selection: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    :param selection: commit, commit hash prefix or UTC date range FROM..TO
+    (ISO dates, both inclusive, either may be left out)
+    :return: SQL condition selecting the runs and its parameters
+    """
+
+    # imported here; the dates are not needed for the usual runs
+    from datetime import date, timedelta
+
+    if RANGE_SEPARATOR not in selection:
+        # commits recorded with uncommitted changes match their commit too
+        commit = _git("rev-parse", "--verify", "--quiet",
+                      selection + "^{commit}")
+        return COMMIT_CONDITION, \
+            ((selection if commit is None else commit) + "%", )
+
+    first, last = selection.split(RANGE_SEPARATOR, 1)
+    conditions = []
+    parameters = []
+    if first != "":
+        conditions.append(FROM_CONDITION)
+        parameters.append(date.fromisoformat(first).isoformat())
+    if last != "":
+        conditions.append(TO_CONDITION)
+        parameters.append(
+            (date.fromisoformat(last) + timedelta(days=1)).isoformat())
+    return " AND ".join(conditions) if len(conditions) > 0 else "1", \
+        tuple(parameters)
+
+
+################################################################################
+
+def load_runs(selection: str,
+              path: str = DEFAULT_HISTORY_PATH) \
+        -> Dict[RunKey, List[Tuple[float, Union[int, None]]]]:
+    """
+    :param selection: commit or date range; see selection_condition()
+    :param path: history database path
+    :return: dict in format run key: duration and peak memory of every
+    selected run
+    """
+
+    condition, parameters = selection_condition(selection)
+    runs: Dict[RunKey, List[Tuple[float, Union[int, None]]]] = {}
+
+    connection = _connect(path)
+    try:
+        for day, puzzle, input_name, backend, duration, peak_memory \
+                in connection.execute(SELECT_STATEMENT.format(condition),
+                                      parameters):
+            runs.setdefault((day, puzzle, input_name, backend), []).append(
+                (duration, peak_memory))
+    finally:
+        connection.close()
+    return runs
+
+
+################################################################################
+
+def _median_absolute_deviation(values: Sequence[float]) -> float:
+    """
+    :param values: measured values
+    :return: median absolute deviation of the values from their median
+    """
+
+    # imported here; the statistics are only needed for the report
+    from statistics import median
+    center = median(values)
+    return median(abs(value - center) for value in values)
+
+
+################################################################################
+
+def compare_runs(baseline: Dict[RunKey, List[Tuple[float, Union[int, None]]]],
+                 candidate: Dict[RunKey, List[Tuple[float, Union[int, None]]]],
+                 threshold: float = DEFAULT_THRESHOLD,
+                 min_seconds: float = DEFAULT_MIN_SECONDS) -> List[Change]:
+    """
+    Compares the medians of the runs both selections have. A duration change
+    is significant if it is over the threshold, over min_seconds and over the
+    sum of the median absolute deviations of both selections; a peak memory
+    change if it is over the threshold.
+
+    :param baseline: runs of the baseline selection
+    :param candidate: runs of the candidate selection
+    :param threshold: relative change of the median (0.1 means 10 %)
+    :param min_seconds: smallest duration change considered
+    :return: significant changes, the largest relative ones first
+    """
+
+    # imported here; the statistics are only needed for the report
+    from statistics import median
+    changes = []
+
+    for key in sorted(baseline.keys() & candidate.keys()):
+        baseline_durations = [duration for duration, _ in baseline[key]]
+        candidate_durations = [duration for duration, _ in candidate[key]]
+        baseline_median = median(baseline_durations)
+        candidate_median = median(candidate_durations)
+        difference = abs(candidate_median - baseline_median)
+        if baseline_median > 0 \
+                and difference > threshold * baseline_median \
+                and difference > min_seconds \
+                and difference > _median_absolute_deviation(
+                    baseline_durations) + _median_absolute_deviation(
+                    candidate_durations):
+            changes.append(Change(
+                key, DURATION, baseline_median, candidate_median,
+                len(baseline_durations), len(candidate_durations)))
+
+        baseline_memory = [memory for _, memory in baseline[key]
+                           if memory is not None]
+        candidate_memory = [memory for _, memory in candidate[key]
+                            if memory is not None]
+        if len(baseline_memory) == 0 or len(candidate_memory) == 0:
+            continue
+        baseline_median = median(baseline_memory)
+        candidate_median = median(candidate_memory)
+        if baseline_median > 0 and abs(candidate_median - baseline_median) \
+                > threshold * baseline_median:
+            changes.append(Change(
+                key, PEAK_MEMORY, baseline_median, candidate_median,
+                len(baseline_memory), len(candidate_memory)))
+
+    changes.sort(key=lambda change: abs(change.relative_change), reverse=True)
+    return changes
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Compare two selections of the "
+                                        "Advent of Code 2015 timing history")
+    parser.add_argument("baseline",
+                        help="commit or UTC date range FROM..TO")
+    parser.add_argument("candidate",
+                        help="commit or UTC date range FROM..TO")
+    parser.add_argument("-t", "--threshold", type=float,
+                        default=DEFAULT_THRESHOLD,
+                        help="relative change of the median reported")
+    parser.add_argument("--min-seconds", type=float,
+                        default=DEFAULT_MIN_SECONDS,
+                        help="smallest duration change reported")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH,
+                        metavar="PATH", help="history database")
+    arguments = parser.parse_args()
+    for selection in (arguments.baseline, arguments.candidate):
+        try:
+            selection_condition(selection)
+        except ValueError as error:
+            parser.error("invalid date range {}: {}".format(selection, error))
+    return arguments
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Prints the puzzles whose performance changed between the selections.
+    """
+
+    arguments = parse_arguments()
+    baseline_runs = load_runs(arguments.baseline, arguments.history)
+    candidate_runs = load_runs(arguments.candidate, arguments.history)
+    common = len(baseline_runs.keys() & candidate_runs.keys())
+
+    print("{} puzzles in the baseline, {} in the candidate, {} in both".format(
+        len(baseline_runs), len(candidate_runs), common))
+    for change in compare_runs(baseline_runs, candidate_runs,
+                               arguments.threshold, arguments.min_seconds):
+        print(change)
+
+################################################################################
@@ -0,0 +1,246 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from mmap import mmap, ACCESS_READ
+from os import stat
+from os.path import realpath
+from sys import getsizeof
+from typing import Any, Callable, Iterator, TextIO, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+# parsed inputs in the least recently used order; key is a tuple of the input
+# file real path, its modification time and the parser
+_cache = OrderedDict()
+_cache_size = 0
+_memory_limit = DEFAULT_MEMORY_LIMIT
+
+
+################################################################################
+
+def read_text(f: TextIO) -> str:
+    """
+    Parser which keeps the whole input file as it is.
+
+    :param f: opened input file
+    :return: input file contents
+    """
+
+    return f.read()
+
+
+################################################################################
+
+def read_lines(f: TextIO) -> Tuple[str, ...]:
+    """
+    Parser which splits the input file to lines.
+
+    :param f: opened input file
+    :return: input file lines, including the line endings
+    """
+
+    return tuple(f.readlines())
+
+
+################################################################################
+
+def load_input(path: str, parser: Callable[[TextIO], T]) -> T:
+    """
+    Parses the input file with the given parser, or returns the structure
+    parsed before if the file has not changed since. Every caller gets the same
+    object, so it must not be modified.
+
+    :param path: input file path
+    :param parser: function that takes the opened input file and returns the
+    parsed structure
+    :return: parsed structure
+    """
+
+    global _cache_size
+
+    path = realpath(path)
+    key = (path, stat(path).st_mtime_ns, parser)
+
+    try:
+        _cache.move_to_end(key)
+        return _cache[key][0]
+    except KeyError:
+        pass
+
+    with open(path, "r") as f:
+        parsed = parser(f)
+
+    size = _deep_size(parsed)
+    if size <= _memory_limit:
+        _cache[key] = (parsed, size)
+        _cache_size += size
+        _evict()
+
+    return parsed
+
+
+################################################################################
+
+def stream_lines(path: str, block_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    Reads the input file lazily, block by block, for line-oriented inputs that
+    are processed one line at a time. Only the current block is kept in memory
+    and the first lines are available before the whole file is read. Lines are
+    not cached; every caller reads the file again.
+
+    :param path: input file path
+    :param block_size: size of the blocks read from the file in bytes
+    :return: input file lines, including the line endings
+    """
+
+    with open(path, "r", buffering=block_size) as f:
+        yield from f
+
+
+################################################################################
+
+@contextmanager
+def map_input(path: str) -> Iterator[Union[mmap, bytes]]:
+    """
+    Maps the input file to memory read-only, for inputs too big to be read
+    into a string. Nothing is read or decoded up front; the operating system
+    pages the file in as it is scanned, so memory does not grow with the input
+    size. The mapping supports find, readline, slicing (which copies) and
+    regular expressions on bytes patterns. It is not cached; every caller maps
+    the file again.
+
+    :param path: input file path
+    :return: read-only mapping of the input file; empty bytes for an empty
+    file, which can not be mapped
+    """
+
+    with open(path, "rb") as f:
+        if stat(path).st_size == 0:
+            yield b""
+            return
+
+        mapping = mmap(f.fileno(), 0, access=ACCESS_READ)
+        try:
+            yield mapping
+        finally:
+            mapping.close()
+
+
+################################################################################
+
+def read_chunks(buffer: Union[mmap, bytes],
+                size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    :param buffer: mapped input file
+    :param size: chunk size in bytes
+    :return: consecutive chunks of the input; only one is copied out of the
+    mapping at a time
+    """
+
+    for start in range(0, len(buffer), size):
+        yield buffer[start:start + size]
+
+
+################################################################################
+
+def read_mapped_lines(buffer: Union[mmap, bytes]) -> Iterator[bytes]:
+    """
+    :param buffer: mapped input file
+    :return: lines of the input, including the line endings; only one is
+    copied out of the mapping at a time
+    """
+
+    start = 0
+
+    while start < len(buffer):
+        end = buffer.find(b"\n", start)
+        end = len(buffer) if end == -1 else end + 1
+        yield buffer[start:end]
+        start = end
+
+
+################################################################################
+
+def set_memory_limit(limit: int) -> None:
+    """
+    Sets how much memory the parsed inputs may take; least recently used
+    inputs are evicted when over the limit. Inputs bigger than the limit are
+    not cached at all.
+
+    :param limit: memory limit in bytes
+    """
+
+    global _memory_limit
+
+    _memory_limit = limit
+    _evict()
+
+
+################################################################################
+
+def clear_cache() -> None:
+    """
+    Forgets all the parsed inputs.
+    """
+
+    global _cache_size
+
+    _cache.clear()
+    _cache_size = 0
+
+
+################################################################################
+
+def _evict() -> None:
+    """
+    Evicts the least recently used inputs until the cache fits the memory
+    limit.
+    """
+
+    global _cache_size
+
+    while _cache_size > _memory_limit:
+        _, (_, size) = _cache.popitem(last=False)
+        _cache_size -= size
+
+
+################################################################################
+
+def _deep_size(obj: Any) -> int:
+    """
+    Estimates memory taken by the object and everything it contains. Objects
+    shared by several containers are counted once.
+
+    :param obj: measured object
+    :return: estimated size in bytes
+    """
+
+    seen = set()
+    stack = [obj]
+    size = 0
+
+    # iterative; deeply nested inputs (JSON documents) would exceed the
+    # recursion limit
+    while len(stack) > 0:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif hasattr(item, "__dict__"):
+            stack.append(vars(item))
+
+    return size
+
+################
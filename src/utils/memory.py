@@ -0,0 +1,63 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Resident set size of the current process, as the operating system sees it. On
+Linux the peak is read from /proc and can be reset between puzzles; elsewhere
+it falls back to getrusage, whose peak covers the whole life of the process.
+"""
+
+from sys import platform
+from typing import Union
+
+PROC_STATUS_PATH = "/proc/self/status"
+PROC_CLEAR_REFS_PATH = "/proc/self/clear_refs"
+# written to clear_refs, resets the peak resident set size
+CLEAR_PEAK_RSS = "5"
+PEAK_RSS_PREFIX = "VmHWM:"
+KILOBYTE = 1024
+
+
+################################################################################
+
+def reset_peak_rss() -> None:
+    """
+    Starts measuring the peak resident set size again from the current one, if
+    the system allows it.
+    """
+
+    try:
+        with open(PROC_CLEAR_REFS_PATH, "w") as f:
+            f.write(CLEAR_PEAK_RSS)
+    except OSError:
+        pass
+
+
+################################################################################
+
+def peak_rss() -> Union[int, None]:
+    """
+    :return: peak resident set size of the current process in bytes since the
+    last reset, or None if the system does not tell
+    """
+
+    try:
+        with open(PROC_STATUS_PATH, "r") as f:
+            for line in f:
+                if line.startswith(PEAK_RSS_PREFIX):
+                    # "VmHWM:     10240 kB"
+                    return int(line.split()[1]) * KILOBYTE
+    except OSError:
+        pass
+
+    try:
+        from resource import getrusage, RUSAGE_SELF
+    except ImportError:
+        # Windows
+        return None
+
+    peak = getrusage(RUSAGE_SELF).ru_maxrss
+    # kilobytes everywhere but on macOS
+    return peak if platform == "darwin" else peak * KILOBYTE
+
+################################################################################
@@ -0,0 +1,146 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+OpenMetrics text export of puzzle results, one gauge sample per puzzle and
+metric. The file is meant for the node-exporter textfile collector, so it is
+written next to its target first and then renamed; the collector never reads a
+half-written file.
+"""
+
+from os import replace
+from typing import Callable, Iterable, List, Tuple, Union
+from zlib import crc32
+from src.utils.runner import PuzzleResult
+
+METRIC_PREFIX = "aoc2015_puzzle_"
+TEMPORARY_SUFFIX = ".tmp"
+OPERATIONS_METRIC = "operations"
+OPERATIONS_HELP = "Hot path operations done by the puzzle."
+
+# metric name, unit, help text and the value of a result; None leaves the
+# sample out
+METRICS: Tuple[Tuple[str, Union[str, None], str,
+                     Callable[[PuzzleResult], Union[float, None]]], ...] = (
+    ("duration_seconds", "seconds", "Wall time of the puzzle run.",
+     lambda result: result.wall_time),
+    ("cpu_seconds", "seconds", "CPU time of the puzzle run.",
+     lambda result: result.cpu_time),
+    ("peak_memory_bytes", "bytes",
+     "Peak memory allocated by the puzzle (tracemalloc).",
+     lambda result: result.peak_memory),
+    ("peak_rss_bytes", "bytes", "Peak resident set size of the process.",
+     lambda result: result.peak_rss),
+    ("answer_checksum", None, "CRC-32 of the puzzle answer.",
+     lambda result: None if result.answer is None
+     else answer_checksum(result.answer)),
+    ("cache_hit", None, "1 if the answer came from the result cache.",
+     lambda result: int(result.cached)),
+    ("timed_out", None, "1 if the puzzle ran past its time limit.",
+     lambda result: int(result.timed_out)),
+    ("failed", None, "1 if the puzzle raised an error.",
+     lambda result: int(result.error is not None))
+)
+
+
+################################################################################
+
+def answer_checksum(answer: Union[int, str]) -> int:
+    """
+    Answers may be strings, gauges are numbers; the checksum changes whenever
+    the answer does.
+
+    :param answer: puzzle answer
+    :return: CRC-32 of the answer text
+    """
+
+    return crc32(str(answer).encode("utf-8"))
+
+
+################################################################################
+
+def format_metrics(results: Iterable[PuzzleResult]) -> str:
+    """
+    :param results: puzzle results
+    :return: the results in the OpenMetrics text format
+    """
+
+    results = tuple(results)
+    lines: List[str] = []
+
+    for name, unit, description, value in METRICS:
+        samples = [(result, value(result)) for result in results]
+        samples = [(result, sample) for result, sample in samples
+                   if sample is not None]
+        if len(samples) == 0:
+            continue
+
+        name = METRIC_PREFIX + name
+        lines.append("# TYPE {} gauge".format(name))
+        if unit is not None:
+            lines.append("# UNIT {} {}".format(name, unit))
+        lines.append("# HELP {} {}".format(name, description))
+        lines.extend("{}{{{}}} {}".format(name, _labels(result), sample)
+                     for result, sample in samples)
+
+    counted = tuple(result for result in results
+                    if result.operation_counts is not None)
+    if len(counted) > 0:
+        name = METRIC_PREFIX + OPERATIONS_METRIC
+        lines.append("# TYPE {} gauge".format(name))
+        lines.append("# HELP {} {}".format(name, OPERATIONS_HELP))
+        lines.extend("{}{{{},operation=\"{}\"}} {}".format(
+            name, _labels(result), _escape(operation), count)
+            for result in counted
+            for operation, count in sorted(result.operation_counts.items()))
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+################################################################################
+
+def write_metrics(results: Iterable[PuzzleResult], path: str) -> None:
+    """
+    Writes the results to an OpenMetrics (.prom) file.
+
+    :param results: puzzle results
+    :param path: output file path
+    """
+
+    temporary_path = path + TEMPORARY_SUFFIX
+    with open(temporary_path, "w") as f:
+        f.write(format_metrics(results))
+    replace(temporary_path, path)
+
+
+################################################################################
+
+def _labels(result: PuzzleResult) -> str:
+    """
+    :param result: puzzle result
+    :return: labels of the result samples; input path only for inputs other
+    than the bundled one
+    """
+
+    labels = [("day", "{:02d}".format(result.day)),
+              ("puzzle", str(result.puzzle))]
+    if result.input_path is not None:
+        labels.append(("input", result.input_path))
+
+    return ",".join('{}="{}"'.format(name, _escape(value))
+                    for name, value in labels)
+
+
+################################################################################
+
+def _escape(value: str) -> str:
+    """
+    :param value: label value
+    :return: label value with backslashes, quotes and line breaks escaped
+    """
+
+    return value.replace("\\", "\\\\").replace("\"", "\\\"") \
+        .replace("\n", "\\n")
+
+################################################################################
@@ -0,0 +1,176 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Profiles single puzzle runs with cProfile. Every run leaves two files behind:
+the raw statistics (.pstats), for pstats or snakeviz, and collapsed stacks
+(.collapsed), one "frame;frame;frame microseconds" line per call path, which
+flamegraph.pl, speedscope and inferno accept as they are.
+"""
+
+from cProfile import Profile
+from os import makedirs
+from os.path import basename, dirname, join, realpath, relpath, sep
+from pstats import Stats
+from time import perf_counter, process_time
+from typing import Dict, List, Set, Tuple
+from src.utils.registry import get_puzzle
+from src.utils.runner import PuzzleResult
+
+REPOSITORY_ROOT = dirname(dirname(dirname(realpath(__file__))))
+PROFILE_DIRECTORY = join(REPOSITORY_ROOT, ".cache", "profiles")
+PROFILE_FILE_NAME = "day_{:02d}-puzzle_{}"
+STATS_EXTENSION = ".pstats"
+COLLAPSED_EXTENSION = ".collapsed"
+FRAME_DENOMINATOR = ";"
+# call paths that took less are left out of the collapsed stacks
+MINIMUM_PATH_TIME = 1e-6
+
+# pstats function key; file name, line number and function name
+Function = Tuple[str, int, str]
+
+
+################################################################################
+
+def profile_puzzle(day: int,
+                   puzzle: int,
+                   directory: str = PROFILE_DIRECTORY) \
+        -> Tuple[PuzzleResult, str, str]:
+    """
+    Runs one puzzle under cProfile and saves the statistics and the collapsed
+    stacks. The day module is imported beforehand so the import is not
+    profiled. Times in the result include the profiler overhead.
+
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :param directory: where to save the profile files
+    :return: puzzle result, path to the .pstats file and path to the
+    .collapsed file
+    """
+
+    function = get_puzzle(day, puzzle)
+    profile = Profile()
+
+    wall_start = perf_counter()
+    cpu_start = process_time()
+    answer = profile.runcall(function)
+    cpu_time = process_time() - cpu_start
+    wall_time = perf_counter() - wall_start
+
+    makedirs(directory, exist_ok=True)
+    path = join(directory, PROFILE_FILE_NAME.format(day, puzzle))
+    stats = Stats(profile)
+    stats.dump_stats(path + STATS_EXTENSION)
+
+    with open(path + COLLAPSED_EXTENSION, "w") as f:
+        for stack, microseconds in sorted(collapse_stacks(stats).items()):
+            f.write("{} {}\n".format(FRAME_DENOMINATOR.join(stack),
+                                     microseconds))
+
+    return (PuzzleResult(day, puzzle, wall_time, cpu_time, answer),
+            path + STATS_EXTENSION, path + COLLAPSED_EXTENSION)
+
+
+################################################################################
+
+def collapse_stacks(stats: Stats) -> Dict[Tuple[str, ...], int]:
+    """
+    cProfile only records caller-callee pairs, not whole stacks. The stacks
+    are rebuilt by walking the call graph down from the functions nobody
+    called (or only by themselves); time of a function called from several
+    places is split between the call paths in the same ratio as its callers'
+    shares of its cumulative time. Recursive calls are folded into the first
+    occurrence of the function on the path.
+
+    :param stats: profile statistics
+    :return: self time in microseconds of every call path
+    """
+
+    # function: (primitive calls, calls, self time, cumulative time, callers)
+    table = stats.stats
+    callees: Dict[Function, List[Function]] = {}
+
+    for function, (_, _, _, _, callers) in table.items():
+        for caller in callers:
+            callees.setdefault(caller, []).append(function)
+
+    stacks: Dict[Tuple[str, ...], int] = {}
+    # nested comprehensions on one line share a single key, so the outer one
+    # may look like it was only ever called by itself; it starts a stack too
+    roots = [function for function, (_, _, _, _, callers) in table.items()
+             if len(set(callers) - {function}) == 0]
+
+    for root in roots:
+        _collapse(table, callees, root, table[root][3], (), set(), stacks)
+
+    return stacks
+
+
+################################################################################
+
+def _collapse(table: Dict,
+              callees: Dict[Function, List[Function]],
+              function: Function,
+              path_time: float,
+              stack: Tuple[str, ...],
+              on_stack: Set[Function],
+              stacks: Dict[Tuple[str, ...], int]) -> None:
+    """
+    Adds the function called through the given stack and everything it called
+    to the collapsed stacks.
+
+    :param table: pstats statistics table
+    :param callees: functions called by every function
+    :param function: current function
+    :param path_time: cumulative time of the function spent on this path
+    :param stack: frame names of the callers, outermost first
+    :param on_stack: functions already on the stack
+    :param stacks: collapsed stacks being built
+    """
+
+    _, _, self_time, cumulative_time, _ = table[function]
+    share = path_time / cumulative_time if cumulative_time > 0 else 0.0
+    stack += (_frame_name(function), )
+    on_stack = on_stack | {function}
+
+    microseconds = round(self_time * share * 1e6)
+    if microseconds > 0:
+        stacks[stack] = stacks.get(stack, 0) + microseconds
+
+    for callee in callees.get(function, ()):
+        if callee in on_stack:
+            continue
+        # cumulative time of the callee when called by this function
+        callee_time = table[callee][4][function][3] * share
+        if callee_time >= MINIMUM_PATH_TIME:
+            _collapse(table, callees, callee, callee_time, stack, on_stack,
+                      stacks)
+
+
+################################################################################
+
+def _frame_name(function: Function) -> str:
+    """
+    :param function: pstats function key
+    :return: frame name for the collapsed stacks, like
+    "src/day_18/puzzle.py:99(_lit_neighbours)"; repository files are
+    relative to its root, other files keep just their names and built-ins
+    their function names
+    """
+
+    file_name, line_number, name = function
+
+    if file_name == "~":
+        # built-in functions
+        frame = name
+    else:
+        if file_name.startswith(REPOSITORY_ROOT + sep):
+            file_name = relpath(file_name, REPOSITORY_ROOT)
+        else:
+            file_name = basename(file_name)
+        frame = "{}:{}({})".format(file_name, line_number, name)
+
+    # the denominator would split the frame in two
+    return frame.replace(FRAME_DENOMINATOR, ",")
+
+################################################################################
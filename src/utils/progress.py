@@ -0,0 +1,124 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Progress reports of the long-running searches (day 4 hashes, day 20 houses,
+random search restarts of days 19, 22 and 24). A tracked loop prints its
+position, its rate and the best result so far to the standard error output,
+at most once per interval:
+
+    day 04 hashes: 4,194,304 hashes (812,345 hashes/s), best -
+
+Reporting is off by default. While it is off, a tracker hands the iterable of
+its loop back untouched, so the loop runs exactly as it would without it; when
+on, the clock is only read every CHECK_EVERY items, or as often as the tracker
+is told to.
+"""
+
+from sys import stderr
+from time import perf_counter
+from typing import Iterable, Iterator, TypeVar, Union
+
+T = TypeVar("T")
+
+DEFAULT_REPORT_INTERVAL = 5.0
+# items taken between two looks at the clock
+CHECK_EVERY = 1024
+
+# seconds between two reports; None turns the reports off
+_interval: Union[float, None] = None
+
+
+################################################################################
+
+def set_progress_interval(interval: Union[float, None]) -> None:
+    """
+    :param interval: seconds between two reports of a tracked loop; None turns
+    the reports off
+    """
+
+    global _interval
+
+    _interval = interval
+
+
+################################################################################
+
+class Tracker(object):
+
+################################################################################
+
+    def __init__(self, name: str, unit: str, check_every: int = CHECK_EVERY):
+        """
+        Creates a tracker of one loop. The loop may store its best result so
+        far in the best attribute; it is shown in the reports.
+
+        :param name: loop name shown in the reports
+        :param unit: what the loop items are (hashes, houses, ...)
+        :param check_every: items taken between two looks at the clock; 1 for
+        loops with slow items
+        """
+
+        self.best = None
+        self._name = name
+        self._unit = unit
+        self._check_every = check_every
+
+################################################################################
+
+    def iterate(self, iterable: Iterable[T]) -> Iterable[T]:
+        """
+        :param iterable: iterable of the tracked loop
+        :return: the iterable itself if the reports are off, otherwise an
+        iterator which reports the progress as the items are taken
+        """
+
+        if _interval is None:
+            return iterable
+        return self._report_items(iterable, _interval)
+
+################################################################################
+
+    def _report_items(self, iterable: Iterable[T], interval: float) \
+            -> Iterator[T]:
+        """
+        Generator function that reports the progress while the items are taken
+        and once more when the loop is over, even if it did not run to the end.
+
+        :param iterable: iterable of the tracked loop
+        :param interval: seconds between two reports
+        :return: items of the iterable
+        """
+
+        start = perf_counter()
+        next_report = start + interval
+        next_check = self._check_every
+        position = 0
+
+        try:
+            for item in iterable:
+                position += 1
+                if position >= next_check:
+                    next_check += self._check_every
+                    now = perf_counter()
+                    if now >= next_report:
+                        next_report = now + interval
+                        self._report(position, now - start)
+                yield item
+        finally:
+            self._report(position, perf_counter() - start)
+
+################################################################################
+
+    def _report(self, position: int, elapsed: float) -> None:
+        """
+        :param position: number of items taken so far
+        :param elapsed: seconds since the loop started
+        """
+
+        rate = position / elapsed if elapsed > 0 else 0.0
+        print("{}: {:,} {} ({:,.0f} {}/s), best {}".format(
+            self._name, position, self._unit, rate, self._unit,
+            "-" if self.best is None else self.best), file=stderr, flush=True)
+
+################################################################################
@@ -0,0 +1,61 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+from importlib import import_module
+from typing import Callable, Dict, Tuple, Union
+
+MODULE_NAME = "src.day_{:02d}.puzzle"
+
+# registered puzzle functions; key is a tuple of day number and puzzle number
+PUZZLES: Dict[Tuple[int, int], Callable[[], Union[int, str]]] = {}
+
+
+################################################################################
+
+def solution(day: int, puzzle: int) -> Callable:
+    """
+    Decorator which registers a puzzle function under its day and puzzle
+    number. The function itself is left intact and returns the solution.
+
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :return: decorator registering the puzzle function
+    """
+
+    def decorator(function: Callable[[], Union[int, str]]) \
+            -> Callable[[], Union[int, str]]:
+        PUZZLES[(day, puzzle)] = function
+        return function
+
+    return decorator
+
+
+################################################################################
+
+def get_puzzle(day: int, puzzle: int) -> Callable[[], Union[int, str]]:
+    """
+    Imports the day module if it was not imported yet; importing it registers
+    both of its puzzles.
+
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :return: registered puzzle function
+    """
+
+    if (day, puzzle) not in PUZZLES:
+        import_module(MODULE_NAME.format(day))
+    return PUZZLES[(day, puzzle)]
+
+
+################################################################################
+
+def solve(day: int, puzzle: int) -> Union[int, str]:
+    """
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :return: puzzle solution
+    """
+
+    return get_puzzle(day, puzzle)()
+
+################################################################################
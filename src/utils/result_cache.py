@@ -0,0 +1,146 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+from hashlib import sha256
+from json import dump, load
+from os import listdir, makedirs, remove
+from os.path import dirname, isfile, join, realpath
+from typing import Tuple, Union
+from src.utils.stochastic import DEFAULT_SEED
+
+SOURCE_DIRECTORY = dirname(dirname(realpath(__file__)))
+DAY_DIRECTORY = join(SOURCE_DIRECTORY, "day_{:02d}")
+# shared modules every puzzle runs on (registry, inputs, backends, ...)
+UTILS_DIRECTORY = join(SOURCE_DIRECTORY, "utils")
+CACHE_DIRECTORY = join(dirname(SOURCE_DIRECTORY), ".cache", "results")
+RESULT_FILE_NAME = "{:02d}-{}-{}.json"
+SOURCE_EXTENSION = ".py"
+KEY_ANSWER = "answer"
+
+
+################################################################################
+
+def day_files(day: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    :param day: day number (1-25)
+    :return: input files and source files of the day, both sorted by name;
+    every file in the day directory that is not Python source is an input
+    """
+
+    directory = DAY_DIRECTORY.format(day)
+    paths = tuple(join(directory, name) for name in sorted(listdir(directory))
+                  if isfile(join(directory, name)))
+    return (tuple(path for path in paths
+                  if not path.endswith(SOURCE_EXTENSION)),
+            tuple(path for path in paths if path.endswith(SOURCE_EXTENSION)))
+
+
+################################################################################
+
+def _hash_files(paths: Tuple[str, ...]) -> str:
+    """
+    :param paths: hashed files
+    :return: SHA-256 hex digest of the names and contents of the files
+    """
+
+    digest = sha256()
+
+    for path in paths:
+        digest.update(path[len(SOURCE_DIRECTORY):].encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(sha256(f.read()).digest())
+
+    return digest.hexdigest()
+
+
+################################################################################
+
+def _utils_sources() -> Tuple[str, ...]:
+    """
+    :return: source files of the shared modules, sorted by name
+    """
+
+    return tuple(join(UTILS_DIRECTORY, name)
+                 for name in sorted(listdir(UTILS_DIRECTORY))
+                 if name.endswith(SOURCE_EXTENSION))
+
+
+################################################################################
+
+def result_key(day: int, seed: int = DEFAULT_SEED) -> str:
+    """
+    :param day: day number (1-25)
+    :param seed: random seed of the puzzles solved by random search
+    :return: key which changes whenever the day inputs, the source code of the
+    day or of the shared modules, or the seed change
+    """
+
+    inputs, sources = day_files(day)
+    return sha256("{}:{}:{}:{}".format(
+        _hash_files(inputs), _hash_files(sources),
+        _hash_files(_utils_sources()), seed).encode("utf-8")).hexdigest()
+
+
+################################################################################
+
+def load_result(day: int,
+                puzzle: int,
+                seed: int = DEFAULT_SEED) -> Union[int, str, None]:
+    """
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :param seed: random seed of the puzzles solved by random search
+    :return: cached solution, or None if the puzzle was not solved yet with the
+    current inputs, source code and seed
+    """
+
+    path = join(CACHE_DIRECTORY,
+                RESULT_FILE_NAME.format(day, puzzle, result_key(day, seed)))
+
+    try:
+        with open(path, "r") as f:
+            return load(f)[KEY_ANSWER]
+    except (FileNotFoundError, ValueError, KeyError):
+        # missing or damaged entry
+        return None
+
+
+################################################################################
+
+def store_result(day: int,
+                 puzzle: int,
+                 answer: Union[int, str],
+                 seed: int = DEFAULT_SEED) -> None:
+    """
+    Stores the solution for the current inputs, source code and seed.
+
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :param answer: puzzle solution
+    :param seed: random seed of the puzzles solved by random search
+    """
+
+    makedirs(CACHE_DIRECTORY, exist_ok=True)
+    path = join(CACHE_DIRECTORY,
+                RESULT_FILE_NAME.format(day, puzzle, result_key(day, seed)))
+
+    with open(path, "w") as f:
+        dump({KEY_ANSWER: answer}, f)
+
+
+################################################################################
+
+def clear_results() -> None:
+    """
+    Removes all the cached solutions.
+    """
+
+    try:
+        names = listdir(CACHE_DIRECTORY)
+    except FileNotFoundError:
+        return
+
+    for name in names:
+        remove(join(CACHE_DIRECTORY, name))
+
+################################################################################
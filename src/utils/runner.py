@@ -0,0 +1,456 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+from time import perf_counter, process_time
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, \
+    NamedTuple, Tuple, Union
+from src.utils.backends import AUTO, set_backend, set_pool_worker
+from src.utils.counters import counters, enable_counters, reset_counters
+from src.utils.inputs import DEFAULT_MEMORY_LIMIT, set_memory_limit
+from src.utils.memory import peak_rss, reset_peak_rss
+from src.utils.progress import set_progress_interval
+from src.utils.registry import get_puzzle
+from src.utils.result_cache import load_result, store_result
+from src.utils.stochastic import DEFAULT_SEED, configure
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+
+DAYS = tuple(range(1, 26))
+PUZZLES = (1, 2)
+TIMED_OUT = "TIMED OUT"
+
+# day number, puzzle number and input file path (None for the bundled input)
+Task = Tuple[int, int, Union[str, None]]
+
+
+################################################################################
+
+class RunOptions(NamedTuple):
+    """
+    Settings applied to every process which runs puzzles.
+    """
+
+    input_cache_limit: int = DEFAULT_MEMORY_LIMIT
+    measure_memory: bool = False
+    # wall-clock seconds per puzzle; None lets the puzzles run for as long as
+    # they need
+    time_limit: Union[float, None] = None
+    # if True, exceptions raised by the puzzles are reported in their results
+    # instead of stopping the run
+    catch_errors: bool = False
+    # seed of the puzzles solved by random search
+    seed: int = DEFAULT_SEED
+    # if True, the hot path operations of the puzzles are counted
+    count_operations: bool = False
+    # seconds between two progress reports of the long searches; None for no
+    # reports
+    progress_interval: Union[float, None] = None
+    # execution backend of the grid, search and numeric days
+    backend: str = AUTO
+
+
+################################################################################
+
+class PuzzleResult(NamedTuple):
+    """
+    Outcome of one puzzle run.
+    """
+
+    day: int
+    puzzle: int
+    wall_time: float
+    cpu_time: float
+    # None if the puzzle timed out or failed
+    answer: Union[int, str, None]
+    cached: bool = False
+    # bytes; None unless memory was measured
+    peak_memory: Union[int, None] = None
+    peak_rss: Union[int, None] = None
+    timed_out: bool = False
+    # None for the bundled input
+    input_path: Union[str, None] = None
+    # exception raised by the puzzle, if caught
+    error: Union[str, None] = None
+    # operation name: count; None unless the operations were counted
+    operation_counts: Union[Dict[str, int], None] = None
+
+
+################################################################################
+
+def run_puzzle(day: int,
+               puzzle: int,
+               options: RunOptions = RunOptions(),
+               input_path: Union[str, None] = None) -> PuzzleResult:
+    """
+    Runs one puzzle and measures how long it took. The day module is imported
+    beforehand so the import is not measured.
+
+    Memory measurement traces every Python allocation, which slows the puzzle
+    down; times measured along with it are not comparable to the usual ones.
+
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :param options: run options; with measure_memory, peak memory allocated by
+    the puzzle (tracemalloc) and peak resident set size of the process are
+    measured too, with count_operations, the hot path operations are counted
+    :param input_path: puzzle input file path; None for the bundled input
+    :return: puzzle result with wall time, CPU time and the answer
+    """
+
+    function = get_puzzle(day, puzzle)
+    arguments = () if input_path is None else (input_path, )
+    peak_memory = None
+    error = None
+
+    if options.measure_memory:
+        # imported here; tracing is not needed for the usual runs
+        import tracemalloc
+        reset_peak_rss()
+        tracemalloc.start()
+
+    enable_counters(options.count_operations)
+    reset_counters()
+
+    wall_start = perf_counter()
+    cpu_start = process_time()
+
+    try:
+        answer = function(*arguments)
+    except Exception as exception:
+        if not options.catch_errors:
+            raise
+        answer = None
+        error = "{}: {}".format(type(exception).__name__, exception)
+    finally:
+        cpu_time = process_time() - cpu_start
+        wall_time = perf_counter() - wall_start
+        if options.measure_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    return PuzzleResult(
+        day, puzzle, wall_time, cpu_time, answer, False, peak_memory,
+        peak_rss() if options.measure_memory else None, False, input_path,
+        error, counters() if options.count_operations else None)
+
+
+################################################################################
+
+def initialize_worker(options: RunOptions, pool_worker: bool = False) -> None:
+    """
+    Applies the run options to the current process.
+
+    :param options: run options
+    :param pool_worker: True in a worker of a pool running puzzles side by
+    side; its pool engines then keep to a single worker
+    """
+
+    set_memory_limit(options.input_cache_limit)
+    configure(options.seed)
+    set_progress_interval(options.progress_interval)
+    set_backend(options.backend)
+    set_pool_worker(pool_worker)
+
+
+################################################################################
+
+def run_puzzles(days: Iterable[int],
+                puzzles: Iterable[int],
+                workers: int = None,
+                options: RunOptions = RunOptions(),
+                use_result_cache: bool = True) -> Tuple[PuzzleResult, ...]:
+    """
+    Runs every requested puzzle of every requested day. Solutions stored in the
+    result cache for the current inputs and source code are used instead of
+    running the puzzle again, unless memory is measured or operations are
+    counted; cached solutions have no measurements.
+
+    :param days: day numbers to run
+    :param puzzles: puzzle numbers to run for each day
+    :param workers: maximum number of worker processes; None uses all cores
+    :param options: run options applied to every worker
+    :param use_result_cache: if False, the result cache is neither read nor
+    written
+    :return: results sorted by day and puzzle number
+    """
+
+    tasks = tuple((day, puzzle, None) for day in days for puzzle in puzzles)
+    results = []
+
+    if use_result_cache and not options.measure_memory \
+            and not options.count_operations:
+        for day, puzzle, _ in tasks:
+            start = perf_counter()
+            answer = load_result(day, puzzle, options.seed)
+            if answer is not None:
+                results.append(PuzzleResult(
+                    day, puzzle, perf_counter() - start, 0.0, answer, True))
+        solved = set((result.day, result.puzzle) for result in results)
+        tasks = tuple(task for task in tasks if task[:2] not in solved)
+
+    for result in _run_tasks(tasks, workers, options):
+        results.append(result)
+        if use_result_cache and not result.timed_out \
+                and result.error is None:
+            store_result(result.day, result.puzzle, result.answer,
+                         options.seed)
+
+    return tuple(sorted(results, key=lambda result: result[:2]))
+
+
+################################################################################
+
+def run_inputs(day: int,
+               puzzles: Iterable[int],
+               input_paths: Iterable[str],
+               workers: int = None,
+               options: RunOptions = RunOptions()) -> Iterator[PuzzleResult]:
+    """
+    Solves the puzzles of one day for many different inputs. The result cache
+    is not used; it only knows the bundled inputs.
+
+    :param day: day number (1-25)
+    :param puzzles: puzzle numbers to run for every input
+    :param input_paths: puzzle input file paths
+    :param workers: maximum number of worker processes; None uses all cores
+    :param options: run options applied to every worker
+    :return: results in the order the puzzles finished, as soon as they finish
+    """
+
+    return _run_tasks(tuple((day, puzzle, input_path)
+                            for input_path in input_paths
+                            for puzzle in puzzles), workers, options)
+
+
+################################################################################
+
+def _run_tasks(tasks: Tuple[Task, ...],
+               workers: Union[int, None],
+               options: RunOptions) -> Iterator[PuzzleResult]:
+    """
+    Runs all the puzzles at the same time, each one in a separate process of
+    the pool. A single puzzle (or a single worker) is run in this process
+    instead, so short runs do not pay for starting the pool.
+
+    :param tasks: day and puzzle numbers and input file paths of the puzzles
+    to run
+    :param workers: maximum number of worker processes; None uses all cores
+    :param options: run options applied to every worker
+    :return: results in the order the puzzles finished, as soon as they finish
+    """
+
+    if len(tasks) == 0:
+        return
+
+    if options.time_limit is not None:
+        yield from _run_supervised(tasks, workers, options)
+        return
+
+    if len(tasks) == 1 or workers == 1:
+        initialize_worker(options)
+        for day, puzzle, input_path in tasks:
+            yield run_puzzle(day, puzzle, options, input_path)
+        return
+
+    # imported here; the pool machinery is not needed for single-puzzle runs
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=initialize_worker,
+                             initargs=(options, True)) as executor:
+        futures = [executor.submit(run_puzzle, day, puzzle, options,
+                                   input_path)
+                   for day, puzzle, input_path in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+################################################################################
+
+def _run_supervised(tasks: Tuple[Task, ...],
+                    workers: Union[int, None],
+                    options: RunOptions) -> Iterator[PuzzleResult]:
+    """
+    Runs every puzzle in its own process, at most the given number at the same
+    time. A puzzle still running when its time limit is up is terminated and
+    reported as timed out, so one stuck puzzle does not hold up the others.
+    Pool workers can not be terminated one by one, hence a process per puzzle.
+
+    :param tasks: day and puzzle numbers and input file paths of the puzzles
+    to run
+    :param workers: maximum number of worker processes; None uses all cores
+    :param options: run options applied to every worker
+    :return: results in the order the puzzles finished, as soon as they finish
+    """
+
+    # imported here; supervision is not needed for the usual runs
+    from multiprocessing import Pipe, Process
+    from multiprocessing.connection import wait
+    from os import cpu_count
+
+    workers = workers if workers is not None else cpu_count() or 1
+    pending = list(tasks)
+    # receiving end of the result pipe: process, task and start time
+    running = {}
+
+    while len(pending) > 0 or len(running) > 0:
+        while len(pending) > 0 and len(running) < workers:
+            task = pending.pop(0)
+            receiver, sender = Pipe(duplex=False)
+            process = Process(target=_run_supervised_puzzle,
+                              args=task + (options, sender), daemon=True)
+            process.start()
+            # only the worker writes to the pipe
+            sender.close()
+            running[receiver] = (process, task, perf_counter())
+
+        deadline = min(start for _, _, start in running.values()) \
+            + options.time_limit
+        for receiver in wait(tuple(running.keys()),
+                             max(deadline - perf_counter(), 0)):
+            process, (day, puzzle, _), _ = running.pop(receiver)
+            try:
+                result = receiver.recv()
+            except EOFError:
+                result = RuntimeError(
+                    "Day {} puzzle {} worker exited unexpectedly".format(
+                        day, puzzle))
+            receiver.close()
+            process.join()
+            if isinstance(result, BaseException):
+                for other, *_ in running.values():
+                    other.terminate()
+                raise result
+            yield result
+
+        for receiver, (process, task, start) in tuple(running.items()):
+            elapsed = perf_counter() - start
+            if elapsed >= options.time_limit:
+                process.terminate()
+                process.join()
+                receiver.close()
+                del running[receiver]
+                day, puzzle, input_path = task
+                yield PuzzleResult(day, puzzle, elapsed, 0.0, None,
+                                   timed_out=True, input_path=input_path)
+
+
+################################################################################
+
+def _run_supervised_puzzle(day: int,
+                           puzzle: int,
+                           input_path: Union[str, None],
+                           options: RunOptions,
+                           sender: "Connection") -> None:
+    """
+    Runs one puzzle in a supervised worker process and sends its result, or
+    the exception it raised, back through the pipe.
+
+    :param day: day number (1-25)
+    :param puzzle: puzzle number (1 or 2)
+    :param input_path: puzzle input file path; None for the bundled input
+    :param options: run options
+    :param sender: sending end of the result pipe
+    """
+
+    initialize_worker(options)
+
+    try:
+        sender.send(run_puzzle(day, puzzle, options, input_path))
+    except Exception as exception:
+        sender.send(exception)
+    finally:
+        sender.close()
+
+
+################################################################################
+
+def timed_out(results: Iterable[PuzzleResult]) -> Tuple[PuzzleResult, ...]:
+    """
+    :param results: puzzle results
+    :return: results of the puzzles cancelled for running out of time
+    """
+
+    return tuple(result for result in results if result.timed_out)
+
+
+################################################################################
+
+def over_memory_budget(results: Iterable[PuzzleResult],
+                       budget: int) -> Tuple[PuzzleResult, ...]:
+    """
+    The budget is compared to the peak memory allocated by the puzzle itself;
+    unlike the resident set size, it does not depend on what else the worker
+    process ran before.
+
+    :param results: puzzle results with measured memory
+    :param budget: memory allowed for every puzzle in bytes
+    :return: results of the puzzles which took more memory than allowed
+    """
+
+    return tuple(result for result in results
+                 if result.peak_memory is not None
+                 and result.peak_memory > budget)
+
+
+################################################################################
+
+def format_results_table(results: Iterable[PuzzleResult]) -> str:
+    """
+    :param results: puzzle results
+    :return: table with wall time, CPU time and answer of every puzzle; peak
+    memory and peak resident set size too if any puzzle has them measured
+    """
+
+    results = tuple(results)
+    memory = any(result.peak_memory is not None for result in results)
+
+    header = ["{:>3}  {:>6}  {:>10}  {:>10}  {:>6}".format(
+        "DAY", "PUZZLE", "WALL (s)", "CPU (s)", "CACHED")]
+    if memory:
+        header.append("{:>10}  {:>10}".format("PEAK (MiB)", "RSS (MiB)"))
+    lines: List[str] = ["  ".join(header + ["ANSWER"])]
+
+    for result in results:
+        line = ["{:>3}  {:>6}  {:>10.3f}  {:>10.3f}  {:>6}".format(
+            result.day, result.puzzle, result.wall_time, result.cpu_time,
+            "yes" if result.cached else "no")]
+        if memory:
+            line.append("{:>10}  {:>10}".format(
+                *(_format_mebibytes(value)
+                  for value in (result.peak_memory, result.peak_rss))))
+        lines.append("  ".join(line + [
+            TIMED_OUT if result.timed_out
+            else result.error if result.error is not None
+            else str(result.answer)]))
+
+    return "\n".join(lines)
+
+
+################################################################################
+
+def format_operation_counts(results: Iterable[PuzzleResult]) -> str:
+    """
+    :param results: puzzle results
+    :return: one line for every operation counted in every puzzle
+    """
+
+    return "\n".join(
+        "{:02d}/{}  {:<24}  {:>14,}".format(result.day, result.puzzle, name,
+                                            count)
+        for result in results if result.operation_counts is not None
+        for name, count in sorted(result.operation_counts.items()))
+
+
+################################################################################
+
+def _format_mebibytes(value: Union[int, None]) -> str:
+    """
+    :param value: memory in bytes, or None if not measured
+    :return: memory in MiB, or a dash if not measured
+    """
+
+    return "-" if value is None else "{:.3f}".format(value / 2 ** 20)
+
+################################################################################
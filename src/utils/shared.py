@@ -0,0 +1,92 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Parsed numeric inputs shared with the worker processes of the pool engines
+(src/utils/backends.py). The parent process packs the numbers once into a flat
+buffer of shared memory; the tasks only carry its name, and every worker
+attaches to it by the name and reads the numbers in place, so nothing is
+pickled per task and no worker keeps a copy of its own. A NumPy engine can
+wrap the same buffer with numpy.frombuffer().
+
+    with share(array("q", values)) as shared:
+        pool_map(partial(task, shared), items)
+
+    def task(shared, item):
+        with attach(shared) as values:
+            ...
+"""
+
+from array import array
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, NamedTuple
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+# shared memory attached in this process so far; a worker attaches once, not
+# once per task
+_attached: Dict[str, "SharedMemory"] = {}
+
+
+################################################################################
+
+class SharedArray(NamedTuple):
+    """
+    Picklable handle of a flat array in shared memory.
+    """
+
+    name: str
+    # array module type code of the items
+    typecode: str
+    length: int
+
+
+################################################################################
+
+@contextmanager
+def share(values: array) -> Iterator[SharedArray]:
+    """
+    Copies the values to a new block of shared memory. Leaving the block frees
+    the memory; the workers must be done with it by then.
+
+    :param values: values to share
+    :return: handle of the shared values, for the workers to attach to
+    """
+
+    # imported here; shared memory is only needed by the pool engines
+    from multiprocessing.shared_memory import SharedMemory
+
+    # a block can not be empty
+    memory = SharedMemory(create=True,
+                          size=max(len(values) * values.itemsize, 1))
+    try:
+        memory.buf[:len(values) * values.itemsize] = values.tobytes()
+        yield SharedArray(memory.name, values.typecode, len(values))
+    finally:
+        # attached here too if the pool map ran in this process
+        attached = _attached.pop(memory.name, None)
+        if attached is not None:
+            attached.close()
+        memory.close()
+        memory.unlink()
+
+
+################################################################################
+
+def attach(shared: SharedArray) -> memoryview:
+    """
+    :param shared: handle of shared values
+    :return: writable view of the values; released at the end of a with block,
+    it must be released before the memory is freed
+    """
+
+    memory = _attached.get(shared.name)
+    if memory is None:
+        # imported here; shared memory is only needed by the pool engines
+        from multiprocessing.shared_memory import SharedMemory
+        memory = _attached[shared.name] = SharedMemory(shared.name)
+    return memory.buf[:shared.length * array(shared.typecode).itemsize].cast(
+        shared.typecode)
+
+################################################################################
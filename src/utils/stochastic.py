@@ -0,0 +1,261 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Harness for the puzzles solved by random search (days 19 and 24, and day 22's
+fight_random() which found the spell sequences of its puzzles). A search
+is a number of independent restarts; restart number i always gets its own
+random generator seeded with the search seed and i, so the same seed gives the
+same answer no matter how many workers run the restarts. The lowest answer of
+all the restarts wins, unless the search has a target: then it stops at the
+first restart (in restart order) whose answer meets it, and every worker still
+running is terminated.
+
+Run from the repository root:
+
+    python -m src.utils.stochastic 19 2 --seed 7 -w 4
+"""
+
+from argparse import ArgumentParser, Namespace
+from functools import partial
+from math import ceil
+from random import Random
+from time import perf_counter
+from typing import Callable, Iterator, List, NamedTuple, Tuple, TypeVar, \
+    Union
+from src.utils.progress import DEFAULT_REPORT_INTERVAL, Tracker, \
+    set_progress_interval
+
+T = TypeVar("T")
+
+DEFAULT_SEED = 2015
+# restarts are handed to the workers in chunks; more chunks per worker make
+# the early stop react sooner, fewer cost less inter-process traffic
+CHUNKS_PER_WORKER = 16
+
+_seed = DEFAULT_SEED
+_workers = 1
+# telemetry of the searches run in this process since the last configure()
+_telemetry: List["Telemetry"] = []
+
+
+################################################################################
+
+class Telemetry(NamedTuple):
+    """
+    Statistics of one search.
+    """
+
+    name: str
+    seed: int
+    workers: int
+    # restarts the search was allowed and restarts actually evaluated
+    restarts: int
+    attempts: int
+    wall_time: float
+    # None if no restart found anything
+    best: Union[object, None]
+    best_restart: Union[int, None]
+    time_to_best: Union[float, None]
+    stopped_early: bool
+
+    @property
+    def attempts_per_second(self) -> float:
+        """
+        :return: restarts evaluated per second of wall time
+        """
+
+        return self.attempts / self.wall_time if self.wall_time > 0 else 0.0
+
+
+################################################################################
+
+def configure(seed: int = DEFAULT_SEED, workers: int = 1) -> None:
+    """
+    Sets the seed and the number of worker processes of the searches run in
+    this process and forgets the telemetry recorded so far. The puzzle runner
+    configures its processes with a single worker: its pool already runs
+    puzzles side by side, one per core, and a pool per search in every worker
+    would start more processes than there are cores (its supervised workers
+    are daemonic and could not start one at all).
+
+    :param seed: random seed of every search
+    :param workers: number of worker processes of every search
+    """
+
+    global _seed, _workers
+
+    _seed = seed
+    _workers = workers
+    _telemetry.clear()
+
+
+################################################################################
+
+def telemetry() -> Tuple[Telemetry, ...]:
+    """
+    :return: telemetry of the searches run in this process since the last
+    configure(), in the order they finished
+    """
+
+    return tuple(_telemetry)
+
+
+################################################################################
+
+def search(name: str,
+           attempt: Callable[[Random], Union[T, None]],
+           restarts: int,
+           accept: Union[Callable[[T], bool], None] = None) -> Union[T, None]:
+    """
+    Runs independent restarts of a randomized attempt and records telemetry
+    of the search.
+
+    :param name: search name shown in the telemetry
+    :param attempt: picklable function that takes a seeded random generator
+    and returns the answer it found, or None if it found nothing
+    :param restarts: maximum number of restarts
+    :param accept: target; the search stops at the first answer for which it
+    returns True; None runs all the restarts
+    :return: the accepted answer, or the lowest answer of all the restarts;
+    None if no restart found anything
+    """
+
+    workers = max(min(_workers, restarts), 1)
+    best = None
+    best_restart = None
+    time_to_best = None
+    attempts = 0
+    stopped_early = False
+    start = perf_counter()
+
+    answers = _restarts(attempt, restarts, workers)
+    tracker = Tracker(name, "restarts", check_every=1)
+
+    for restart, answer in tracker.iterate(answers):
+        attempts += 1
+        if answer is None:
+            continue
+        target_met = accept is not None and accept(answer)
+        if target_met or best is None or answer < best:
+            best = answer
+            best_restart = restart
+            time_to_best = perf_counter() - start
+            tracker.best = best
+        if target_met:
+            stopped_early = True
+            break
+
+    # stops the workers still running
+    answers.close()
+
+    _telemetry.append(Telemetry(
+        name, _seed, workers, restarts, attempts, perf_counter() - start, best,
+        best_restart, time_to_best, stopped_early))
+    return best
+
+
+################################################################################
+
+def _restarts(attempt: Callable[[Random], Union[T, None]],
+              restarts: int,
+              workers: int) -> Iterator[Tuple[int, Union[T, None]]]:
+    """
+    Generator function that runs the restarts, in this process for a single
+    worker, otherwise in a pool. Answers come in the restart order either way.
+    Closing the generator terminates the pool with all its workers.
+
+    :param attempt: randomized attempt
+    :param restarts: number of restarts
+    :param workers: number of worker processes
+    :return: restart number and its answer
+    """
+
+    if workers == 1:
+        for restart in range(restarts):
+            yield _restart(attempt, _seed, restart)
+        return
+
+    # imported here; the pool is not needed for single worker searches
+    from multiprocessing import Pool
+
+    # leaving the block terminates the workers still running
+    with Pool(workers) as pool:
+        yield from pool.imap(
+            partial(_restart, attempt, _seed), range(restarts),
+            chunksize=ceil(restarts / (workers * CHUNKS_PER_WORKER)))
+
+
+################################################################################
+
+def _restart(attempt: Callable[[Random], Union[T, None]],
+             seed: int,
+             restart: int) -> Tuple[int, Union[T, None]]:
+    """
+    :param attempt: randomized attempt
+    :param seed: search seed
+    :param restart: restart number
+    :return: restart number and the answer of the attempt
+    """
+
+    return restart, attempt(Random("{}:{}".format(seed, restart)))
+
+
+################################################################################
+
+def parse_arguments() -> Namespace:
+    """
+    :return: command line arguments
+    """
+
+    parser = ArgumentParser(description="Seeded run of an Advent of Code 2015 "
+                                        "puzzle solved by random search")
+    parser.add_argument("day", type=int, choices=(19, 24))
+    parser.add_argument("puzzle", type=int, choices=(1, 2))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of worker processes of the search")
+    parser.add_argument("--progress", nargs="?", type=float,
+                        const=DEFAULT_REPORT_INTERVAL, default=None,
+                        metavar="SECONDS",
+                        help="report progress of the search to stderr")
+    return parser.parse_args()
+
+
+################################################################################
+
+if __name__ == "__main__":
+    """
+    Runs the specified puzzle and prints its answer with the telemetry of its
+    searches.
+    """
+
+    # imported here; the registry is only needed to run a whole puzzle
+    from src.utils.registry import solve
+    # the puzzles use the imported module, not this __main__ one
+    from src.utils import stochastic
+
+    arguments = parse_arguments()
+    stochastic.configure(arguments.seed, arguments.workers)
+    set_progress_interval(arguments.progress)
+    print("DAY {:02d}; puzzle {}: {}".format(
+        arguments.day, arguments.puzzle,
+        solve(arguments.day, arguments.puzzle)))
+
+    for search_telemetry in stochastic.telemetry():
+        print("{}: seed {}, {} workers, {}/{} restarts in {:.3f} s "
+              "({:.1f}/s), best {} from restart {} after {} s{}".format(
+                search_telemetry.name,
+                search_telemetry.seed,
+                search_telemetry.workers,
+                search_telemetry.attempts,
+                search_telemetry.restarts,
+                search_telemetry.wall_time,
+                search_telemetry.attempts_per_second,
+                search_telemetry.best,
+                search_telemetry.best_restart,
+                "-" if search_telemetry.time_to_best is None
+                else "{:.3f}".format(search_telemetry.time_to_best),
+                "; stopped early" if search_telemetry.stopped_early else ""))
+
+################################################################################
@@ -0,0 +1,164 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Watch mode. The input files of the watched days (every file in the day
+directory that is not Python source, so day 21's weapons, armor and rings
+files too) are polled; only the days whose inputs changed are solved again and
+all the other answers are served from memory. Days 4, 10, 11 and 20 have their
+inputs written in the source code, so they are solved just once.
+"""
+
+from hashlib import sha256
+from os import stat
+from time import sleep
+from typing import Callable, Dict, Iterable, Tuple, Union
+from src.utils.result_cache import day_files
+from src.utils.runner import PuzzleResult, RunOptions, run_puzzles
+
+DEFAULT_INTERVAL = 1.0
+
+# modification time in nanoseconds and size in bytes; None for missing files
+Fingerprint = Union[Tuple[int, int], None]
+
+
+################################################################################
+
+class InputWatcher(object):
+
+################################################################################
+
+    def __init__(self, days: Iterable[int]):
+        """
+        Takes the first look at the input files of the days.
+
+        :param days: watched day numbers (1-25)
+        """
+
+        self._days = tuple(days)
+        # input file path: fingerprint and content hash
+        self._files: Dict[str, Tuple[Fingerprint, Union[str, None]]] = {}
+        # input file paths of every day
+        self._paths: Dict[int, Tuple[str, ...]] = {}
+        self.changed_days()
+
+################################################################################
+
+    def changed_days(self) -> Tuple[int, ...]:
+        """
+        A file is only hashed when its modification time or size changed, so
+        polling costs a stat call per file. Touching a file without changing
+        its contents does not count as a change.
+
+        :return: days with any input file changed, added or removed since the
+        last call
+        """
+
+        return tuple(day for day in self._days if self._day_changed(day))
+
+################################################################################
+
+    def _day_changed(self, day: int) -> bool:
+        """
+        :param day: day number (1-25)
+        :return: True if any input file of the day changed since the last
+        look, False otherwise
+        """
+
+        paths, _ = day_files(day)
+        changed = paths != self._paths.get(day, paths)
+        self._paths[day] = paths
+
+        for path in paths:
+            changed = self._file_changed(path) or changed
+
+        return changed
+
+################################################################################
+
+    def _file_changed(self, path: str) -> bool:
+        """
+        :param path: input file path
+        :return: True if contents of the file changed since the last look,
+        False otherwise
+        """
+
+        try:
+            status = stat(path)
+            fingerprint = (status.st_mtime_ns, status.st_size)
+        except FileNotFoundError:
+            fingerprint = None
+
+        known = self._files.get(path)
+        if known is not None and known[0] == fingerprint:
+            return False
+
+        content_hash = self._hash(path) if fingerprint is not None else None
+        self._files[path] = (fingerprint, content_hash)
+        # the first look only records the file
+        return known is not None and content_hash != known[1]
+
+################################################################################
+
+    @staticmethod
+    def _hash(path: str) -> Union[str, None]:
+        """
+        :param path: input file path
+        :return: SHA-256 hex digest of the file contents; None if the file was
+        removed in the meantime
+        """
+
+        try:
+            with open(path, "rb") as f:
+                return sha256(f.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+
+
+################################################################################
+
+def watch(days: Iterable[int],
+          puzzles: Iterable[int],
+          workers: Union[int, None],
+          options: RunOptions,
+          use_result_cache: bool,
+          report: Callable[[Tuple[PuzzleResult, ...], Tuple[int, ...]], None],
+          interval: float = DEFAULT_INTERVAL) -> None:
+    """
+    Solves the puzzles, then keeps solving the puzzles of the days whose
+    inputs changed until interrupted. Errors raised by the puzzles are
+    reported in their results, so a half-edited input does not stop watching.
+
+    :param days: day numbers to run
+    :param puzzles: puzzle numbers to run for each day
+    :param workers: maximum number of worker processes; None uses all cores
+    :param options: run options applied to every worker
+    :param use_result_cache: if True, solutions stored on disk for the same
+    inputs and source code are used and new solutions are stored
+    :param report: called after every run with results of all the puzzles,
+    the ones served from memory marked as cached, and the days solved again
+    :param interval: seconds between two looks at the input files
+    """
+
+    days = tuple(days)
+    puzzles = tuple(puzzles)
+    options = options._replace(catch_errors=True)
+    watcher = InputWatcher(days)
+    # day and puzzle number: last result
+    results: Dict[Tuple[int, int], PuzzleResult] = {}
+    changed = days
+
+    while True:
+        results = {key: result._replace(cached=True)
+                   for key, result in results.items()}
+        for result in run_puzzles(changed, puzzles, workers, options,
+                                  use_result_cache):
+            results[result[:2]] = result
+        report(tuple(results[key] for key in sorted(results)), changed)
+
+        changed = ()
+        while len(changed) == 0:
+            sleep(interval)
+            changed = watcher.changed_days()
+
+################################################################################
@@ -0,0 +1,90 @@
+__author__ = "Jakub Franěk"
+__email__ = "tofugangsw@gmail.com"
+
+"""
+Backend selection in the worker processes of the puzzle pools. The pools are
+started with fork, so the workers inherit the patched core count.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Tuple
+from unittest import TestCase, main
+from unittest.mock import patch
+from src.utils import backends
+from src.utils.backends import MULTIPROCESSING, PYTHON, available_workers, \
+    select_backend, set_pool_worker
+from src.utils.daemon import _initialize_daemon_worker
+from src.utils.runner import RunOptions, initialize_worker
+
+CORES = 4
+# never reached, so the auto backend does not pick NumPy even if installed
+NUMPY_SIZE = 2 ** 62
+POOL_SIZE = 1000
+
+
+################################################################################
+
+def selected_backend() -> Tuple[int, str]:
+    """
+    :return: workers of the pool engines and the backend the auto backend
+    picks for a large input, in the calling process
+    """
+
+    return available_workers(), select_backend(POOL_SIZE, NUMPY_SIZE,
+                                               POOL_SIZE)
+
+
+################################################################################
+
+class TestPoolWorkerBackend(TestCase):
+    """
+    Pool engines must not start pools of their own inside the pool workers.
+    """
+
+    def setUp(self) -> None:
+        """
+        Pretends there are several cores and resets the process after each
+        test.
+        """
+
+        cpu_count = patch.object(backends, "cpu_count", return_value=CORES)
+        cpu_count.start()
+        self.addCleanup(cpu_count.stop)
+        self.addCleanup(initialize_worker, RunOptions())
+
+    def _worker_backend(self, initializer, *initargs) -> Tuple[int, str]:
+        """
+        :param initializer: pool worker initializer
+        :param initargs: initializer arguments
+        :return: selected_backend() in a worker of the pool
+        """
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("fork"),
+                                 initializer=initializer,
+                                 initargs=initargs) as executor:
+            return executor.submit(selected_backend).result()
+
+    def test_main_process_uses_pool(self) -> None:
+        initialize_worker(RunOptions())
+        self.assertEqual(selected_backend(), (CORES, MULTIPROCESSING))
+
+    def test_runner_worker_keeps_to_python(self) -> None:
+        self.assertEqual(self._worker_backend(initialize_worker, RunOptions(),
+                                              True), (1, PYTHON))
+
+    def test_daemon_worker_keeps_to_python(self) -> None:
+        self.assertEqual(self._worker_backend(_initialize_daemon_worker,
+                                              RunOptions()), (1, PYTHON))
+
+    def test_unmarked_worker_uses_pool(self) -> None:
+        self.assertEqual(self._worker_backend(set_pool_worker, False),
+                         (CORES, MULTIPROCESSING))
+
+
+################################################################################
+
+if __name__ == "__main__":
+    main()
+
+################################################################################